@@ -6,21 +6,24 @@ and update agent configurations. Agents are defined in the ``llm``
 module and exposed via the agent service layer.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Response
 
 from ...core.security import get_api_key
 from ...schemas.agent import AgentListResponse, AgentConfig
-from ...services.agent_service import list_agents, get_agent, update_agent
+from ...services.agent_service import list_agents_json, get_agent, update_agent
 
 
 router = APIRouter()
 
 
 @router.get("/", response_model=AgentListResponse)
-async def list_available_agents(api_key: str = Depends(get_api_key)) -> AgentListResponse:
-    """Return a list of all configured agents."""
-    agents = list_agents()
-    return AgentListResponse(agents=agents)
+async def list_available_agents(api_key: str = Depends(get_api_key)) -> Response:
+    """Return a list of all configured agents.
+
+    The body is pre-serialized by the registry and only rebuilt when an
+    agent changes, so no per-request model validation or encoding is done.
+    """
+    return Response(content=list_agents_json(), media_type="application/json")
 
 
 @router.get("/{name}", response_model=AgentConfig)
@@ -16,20 +16,20 @@ model prompts or internal details.
 
 from __future__ import annotations
 
-import json
-import re
-from datetime import datetime
-from html import unescape
+from datetime import datetime, timezone
 from typing import List, Optional
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.http_client import fetch_page, get_http_client
 from ...core.openai_client import generate
 from ...core.security import get_api_key
 from ...db.models import Company
+from ...services.research_service import invalidate_stats, replace_company_tags
 from ..deps import get_db
 from ...schemas.company import (
     CompanyListResponse,
@@ -39,6 +39,8 @@ from ...schemas.company import (
     DiscoverResponse,
     DiscoveredCompany,
 )
+from ...utils import json_codec
+from ...utils.html_text import html_to_text
 
 
 router = APIRouter(prefix="/market", tags=["market"], dependencies=[Depends(get_api_key)])
@@ -61,11 +63,12 @@ async def fetch_wikipedia_extract(title: str) -> str:
     """
     api_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{title.replace(' ', '_')}"
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(api_url, headers={"User-Agent": "ConstructorCopilotBot/1.0"})
-            if resp.status_code == 200:
-                data = resp.json()
-                return data.get("extract", "")
+        resp = await get_http_client().get(
+            api_url, headers={"User-Agent": "ConstructorCopilotBot/1.0"}, timeout=10
+        )
+        if resp.status_code == 200:
+            data = resp.json()
+            return data.get("extract", "")
     except Exception:
         pass
     return ""
@@ -86,20 +89,9 @@ async def fetch_website_text(url: str) -> str:
         string if fetching fails.
     """
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(url, headers={"User-Agent": "ConstructorCopilotBot/1.0"})
-            if resp.status_code == 200 and "text" in resp.headers.get("content-type", ""):
-                html = resp.text
-                # Remove script and style content
-                html = re.sub(r"<script[^>]*>.*?</script>", " ", html, flags=re.DOTALL | re.IGNORECASE)
-                html = re.sub(r"<style[^>]*>.*?</style>", " ", html, flags=re.DOTALL | re.IGNORECASE)
-                # Strip all tags
-                text = re.sub(r"<[^>]+>", " ", html)
-                # Decode HTML entities
-                text = unescape(text)
-                # Collapse whitespace
-                text = re.sub(r"\s+", " ", text)
-                return text.strip()[:3000]  # limit length for prompt
+        resp, html = await fetch_page(url, headers={"User-Agent": "ConstructorCopilotBot/1.0"}, timeout=10)
+        if resp.status_code == 200 and "text" in resp.headers.get("content-type", ""):
+            return html_to_text(html)[:3000]  # limit length for prompt
     except Exception:
         pass
     return ""
@@ -173,7 +165,7 @@ async def discover_companies(
     # returning an empty list.
     companies_list: List[DiscoveredCompany] = []
     try:
-        data = json.loads(raw_reply)
+        data = json_codec.loads(raw_reply)
         for item in data.get("companies", [])[: request.max_companies]:
             # Normalise name and website fields
             name = item.get("name")
@@ -183,13 +175,16 @@ async def discover_companies(
                 companies_list.append(
                     DiscoveredCompany(name=name, website=website, reason=reason)
                 )
-                # Upsert company into DB if not present
-                existing = await db.execute(select(Company).where(Company.name == name))
-                company_row = existing.scalars().first()
-                if not company_row:
-                    new_company = Company(name=name, website=website)
-                    db.add(new_company)
-        await db.commit()
+        # Insert the companies that are not stored yet in one statement.
+        if companies_list:
+            dialect_insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+            await db.execute(
+                dialect_insert(Company)
+                .values([{"name": c.name, "website": c.website} for c in companies_list])
+                .on_conflict_do_nothing(index_elements=[Company.name])
+            )
+            await db.commit()
+            invalidate_stats()
     except Exception:
         # If parsing fails, log and return an empty result
         companies_list = []
@@ -249,7 +244,7 @@ async def profile_company(
     ]
     raw_reply = await generate(messages, model="qwen/qwen2.5-7b-instruct:free")
     try:
-        profile_data = json.loads(raw_reply)
+        profile_data = json_codec.loads(raw_reply)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -269,7 +264,7 @@ async def profile_company(
         company.strengths = profile_data.get("strengths")
         company.risks = profile_data.get("risks")
         company.sources = profile_data.get("sources")
-        company.last_updated = datetime.utcnow()
+        company.last_updated = datetime.now(timezone.utc)
     else:
         company = Company(
             name=profile_data.get("name", request.name),
@@ -284,11 +279,18 @@ async def profile_company(
             strengths=profile_data.get("strengths"),
             risks=profile_data.get("risks"),
             sources=profile_data.get("sources"),
-            last_updated=datetime.utcnow(),
+            last_updated=datetime.now(timezone.utc),
         )
         db.add(company)
+    # Flush first so a new company has an id for its tag rows.
+    await db.flush()
+    await replace_company_tags(
+        db,
+        company.id,
+        {field: getattr(company, field) for field in ("pricing_model", "strengths", "risks")},
+    )
     await db.commit()
-    await db.refresh(company)
+    invalidate_stats()
     return CompanyResponse(**company.__dict__)
 
 
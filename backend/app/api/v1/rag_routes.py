@@ -45,13 +45,7 @@ async def ingest_endpoint(
     of chunks ingested. If metadata is provided, it is stored alongside
     each chunk.
     """
-    await ingest_documents(request.texts, request.metadata)
-    # Approximate ingested chunk count as sum of splits (not exact but provides feedback)
-    chunk_count = 0
-    from langchain.text_splitter import RecursiveCharacterTextSplitter
-    splitter = RecursiveCharacterTextSplitter(chunk_size=512, chunk_overlap=64)
-    for text in request.texts:
-        chunk_count += len(splitter.split_text(text))
+    chunk_count = await ingest_documents(request.texts, request.metadata)
     return IngestResponse(ingested=chunk_count)
 
 
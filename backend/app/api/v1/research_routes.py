@@ -37,6 +37,7 @@ from ...services.research_service import (
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 router = APIRouter(prefix="/research", tags=["research"])
 
@@ -96,7 +97,9 @@ async def list_companies(
 @router.get("/companies/{company_id}")
 async def get_company_detail(company_id: int, db: AsyncSession = Depends(get_db)) -> dict:
     """Return a full profile for a single company including its source documents."""
-    result = await db.execute(select(Company).where(Company.id == company_id))
+    result = await db.execute(
+        select(Company).where(Company.id == company_id).options(selectinload(Company.documents))
+    )
     c = result.scalars().first()
     if not c:
         raise HTTPException(status_code=404, detail="Company not found")
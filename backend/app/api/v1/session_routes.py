@@ -1,9 +1,17 @@
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+    from sse_starlette.sse import EventSourceResponse  # type: ignore[import-not-found]
+except Exception:  # pragma: no cover - fallback if sse-starlette is not installed
+    EventSourceResponse = None  # type: ignore
+
 from ...api.deps import get_db
 from ...core.config import settings
+from ...db.models import ResearchSession
+from ...db.session import async_session
 from ...schemas.session import (
     StartSessionRequest,
     SessionResponse,
@@ -17,31 +25,41 @@ from ...services.session_service import (
     start_session,
     list_sessions,
     get_session,
+    get_session_json,
     get_logs,
     update_scoring,
     get_trends,
     get_company_profile,
+    is_valid_id,
 )
+from ...services.log_stream import follow_logs
 from ...workers.tasks import run_scout_session, run_session_inline
 import asyncio
 
 router = APIRouter(prefix="/research", tags=["research-sessions"])
 
 
-@router.post("/sessions/start", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
-async def start_research_session(payload: StartSessionRequest, db: AsyncSession = Depends(get_db)) -> SessionResponse:
-    session = await start_session(payload.segment, payload.max_companies, db)
+async def _dispatch_scout(session_id: str, reuse_recent: bool = False) -> None:
+    """Queue the scout run on Celery and also start it inline."""
     # fire-and-forget Celery task plus inline fallback to guarantee progress
     celery_used = False
     try:
-        run_scout_session.delay(session.id)
+        # Publishing blocks on the broker (for seconds if it is down), so it
+        # runs in a worker thread instead of stalling the event loop.
+        await asyncio.to_thread(run_scout_session.delay, session_id, reuse_recent)
         celery_used = True
     except Exception:
         celery_used = False
     # Always run inline as well to guarantee progress (comment out if you only want Celery)
-    asyncio.create_task(run_session_inline(session.id))
+    asyncio.create_task(run_session_inline(session_id, reuse_recent))
     if not celery_used:
-        print("Celery broker not reachable; running scout inline for session", session.id)
+        print("Celery broker not reachable; running scout inline for session", session_id)
+
+
+@router.post("/sessions/start", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
+async def start_research_session(payload: StartSessionRequest, db: AsyncSession = Depends(get_db)) -> SessionResponse:
+    session = await start_session(payload.segment, payload.max_companies, db)
+    await _dispatch_scout(session.id, reuse_recent=not payload.force_refresh)
     return session
 
 
@@ -51,9 +69,10 @@ async def recent_sessions(limit: int = Query(6, ge=1, le=20), db: AsyncSession =
 
 
 @router.get("/sessions/{session_id}", response_model=SessionResponse)
-async def get_session_detail(session_id: str, db: AsyncSession = Depends(get_db)) -> SessionResponse:
+async def get_session_detail(session_id: str, db: AsyncSession = Depends(get_db)) -> Response:
+    # Polled by the UI: return the cached, pre-encoded body as is.
     try:
-        return await get_session(session_id, db)
+        return Response(content=await get_session_json(session_id, db), media_type="application/json")
     except ValueError:
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -62,14 +81,48 @@ async def get_session_detail(session_id: str, db: AsyncSession = Depends(get_db)
 async def get_session_logs(
     session_id: str,
     since: datetime | None = Query(None, description="Return logs newer than this timestamp"),
+    after_id: int | None = Query(None, description="Return logs newer than this log id"),
     db: AsyncSession = Depends(get_db),
 ) -> list[SessionLog]:
     try:
-        return await get_logs(session_id, db, since)
+        return await get_logs(session_id, db, since, after_id=after_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Session not found")
 
 
+@router.get("/sessions/{session_id}/logs/stream")
+async def stream_session_logs(
+    session_id: str,
+    after_id: int = Query(0, ge=0, description="Only stream logs with a larger id"),
+):
+    """Push new log lines as server-sent events until the session finishes.
+
+    Replaces polling ``/logs``: on PostgreSQL the stream wakes on
+    ``NOTIFY`` from the log table instead of re-querying on a timer.
+    """
+    # A short-lived session: a request-scoped one would stay open (idle in
+    # transaction) for as long as the stream runs.
+    exists = False
+    if is_valid_id(session_id):
+        async with async_session() as db:
+            exists = await db.get(ResearchSession, session_id) is not None
+    if not exists:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    async def events():
+        async for log in follow_logs(session_id, after_id=after_id):
+            yield {"id": str(log.id), "data": log.model_dump_json()}
+
+    if EventSourceResponse:
+        return EventSourceResponse(events())
+
+    async def event_stream():
+        async for event in events():
+            yield f"id: {event['id']}\ndata: {event['data']}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.post("/sessions/{session_id}/refresh", response_model=SessionResponse)
 async def refresh_session(session_id: str, db: AsyncSession = Depends(get_db)) -> SessionResponse:
     # Reuse start_session logic but with same id if exists
@@ -77,15 +130,7 @@ async def refresh_session(session_id: str, db: AsyncSession = Depends(get_db)) -
         session = await get_session(session_id, db)
     except ValueError:
         raise HTTPException(status_code=404, detail="Session not found")
-    celery_used = False
-    try:
-        run_scout_session.delay(session.id)
-        celery_used = True
-    except Exception:
-        celery_used = False
-    asyncio.create_task(run_session_inline(session.id))
-    if not celery_used:
-        print("Celery broker not reachable; running scout inline for session", session.id)
+    await _dispatch_scout(session.id)
     return session
 
 
@@ -76,7 +76,7 @@ async def run_task_endpoint(
     import asyncio
 
     # Enqueue the Celery task. We pass the list of messages as plain dicts.
-    messages = [m.dict(exclude_unset=True) for m in request.messages]
+    messages = [m.model_dump(exclude_unset=True) for m in request.messages]
     async_result: AsyncResult = run_agent_task.apply_async(args=[messages])
     task_id = async_result.id
 
@@ -5,7 +5,7 @@ Application configuration.
 import os
 from typing import Optional
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     
     # Vector Database (if you're using one)
     VECTOR_COLLECTION: str = "default"
+    VECTOR_DB_URL: Optional[str] = None  # Chroma persist directory; in-memory if unset
     
     # API Keys
     SEARCH_API_KEY: str = os.getenv("SEARCH_API_KEY", "")
@@ -24,6 +25,22 @@ class Settings(BaseSettings):
     LLM_API_KEY: str = os.getenv("LLM_API_KEY", OPENAI_API_KEY)
     LLM_MODEL: str = os.getenv("LLM_MODEL", "llama-3.1-8b-instant")
     LLM_API_BASE: str = os.getenv("LLM_API_BASE", "https://api.groq.com/openai/v1")
+
+    # Chat history: most recent messages kept in memory per session
+    HISTORY_MAX: int = 200
+
+    # Research jobs: companies profiled at once (search, fetch and LLM calls)
+    PROFILE_CONCURRENCY: int = 4
+    # Web search requests in flight at once per event loop
+    SEARCH_CONCURRENCY: int = 6
+    # Seconds an identical research LLM prompt is answered from cache
+    LLM_CACHE_TTL: float = 3600
+    # Seconds a company website's extracted text is reused across sessions
+    WEBSITE_CACHE_TTL: float = 7 * 24 * 3600
+    # A new session copies the results of a session for the same segment
+    # completed within this many seconds instead of researching again
+    # (0 disables)
+    SESSION_REUSE_TTL: float = 6 * 3600
     
     # Celery (FIXED: Use Redis instead of RabbitMQ)
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
@@ -32,10 +49,11 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: list = ["http://localhost:5173", "http://localhost:3000"]
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-        extra = "allow"  # Allow extra fields from .env
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="allow",  # Allow extra fields from .env
+    )
 
 
 settings = Settings()
@@ -6,12 +6,58 @@ performing outgoing HTTP requests. Centralizing HTTP logic here makes
 testing and error handling consistent across the codebase. Additional
 functionality such as retry strategies, timeouts, or custom headers can be
 added as needed.
+
+``get_http_client`` returns a pooled client shared by the whole process so
+repeated fetches reuse keep-alive connections (and HTTP/2 when the ``h2``
+package is installed) instead of paying a new TCP/TLS handshake each time.
 """
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
+try:
+    import h2  # noqa: F401  - enables httpx's HTTP/2 support
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - HTTP/2 is optional
+    HTTP2_AVAILABLE = False
+
+
+DEFAULT_TIMEOUT = 15.0
+# Only the first few thousand characters of a page are used, so page bodies
+# are read up to this many bytes and the rest is never downloaded.
+MAX_PAGE_BYTES = 256 * 1024
+
+_http_client: Optional[httpx.AsyncClient] = None
+# Pooled connections belong to the event loop that opened them, so the
+# client is rebuilt if it is used from another loop (e.g. a Celery task
+# that runs its own ``asyncio.run``).
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared ``httpx.AsyncClient`` for the running event loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=DEFAULT_TIMEOUT,
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client, if one was opened."""
+    global _http_client, _http_client_loop
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None:
+        await client.aclose()
+
 
 async def fetch_json(
     url: str,
@@ -33,7 +79,50 @@ async def fetch_json(
     Raises:
         httpx.HTTPError: If the request fails or the response cannot be parsed.
     """
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    client = get_http_client()
+    kwargs = {"timeout": timeout} if timeout is not None else {}
+    response = await client.get(url, params=params, headers=headers, **kwargs)
+    response.raise_for_status()
+    return response.json()
+
+
+async def fetch_page(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float | None = None,
+    follow_redirects: bool = False,
+    max_bytes: int = MAX_PAGE_BYTES,
+) -> Tuple[httpx.Response, str]:
+    """Fetch a web page, reading at most ``max_bytes`` of its body.
+
+    Args:
+        url (str): The page to request.
+        headers (Optional[Dict[str, str]]): Additional HTTP headers.
+        timeout (float | None): Optional timeout in seconds.
+        follow_redirects (bool): Whether to follow redirects.
+        max_bytes (int): Maximum number of body bytes to download.
+
+    Returns:
+        Tuple[httpx.Response, str]: The (closed) response, for its status and
+        headers, and the decoded, possibly truncated, body. The body is
+        empty, and never downloaded, for non-text content types.
+
+    Raises:
+        httpx.HTTPError: If the request fails.
+    """
+    kwargs = {"timeout": timeout} if timeout is not None else {}
+    chunks = []
+    total = 0
+    async with get_http_client().stream(
+        "GET", url, headers=headers, follow_redirects=follow_redirects, **kwargs
+    ) as response:
+        # Binary responses (PDFs, images, ...) have no text worth reading.
+        if "text" not in response.headers.get("content-type", "text"):
+            return response, ""
+        async for chunk in response.aiter_bytes(chunk_size=16384):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= max_bytes:
+                break
+    body = b"".join(chunks)[:max_bytes]
+    return response, body.decode(response.charset_encoding or "utf-8", errors="replace")
@@ -2,9 +2,20 @@
 LLM Service for generating text completions.
 """
 
-import httpx
+import hashlib
 from typing import Optional
 
+from .config import settings
+from .http_client import get_http_client
+from ..utils import json_codec
+from ..utils.ttl_cache import TTLCache
+
+
+# Replies keyed on a hash of (model, max_tokens, prompt); shared by every
+# LLMService in the process, so repeat segments and companies across
+# sessions skip the round trip.
+_completion_cache: TTLCache[str] = TTLCache(maxsize=512, ttl=settings.LLM_CACHE_TTL)
+
 
 class LLMService:
     """Service for LLM completions using Groq API."""
@@ -32,9 +43,18 @@ class LLMService:
             "temperature": 0.7
         }
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            return data["choices"][0]["message"]["content"]
\ No newline at end of file
+        response = await get_http_client().post(url, json=payload, headers=headers, timeout=60.0)
+        response.raise_for_status()
+        data = response.json()
+        
+        return data["choices"][0]["message"]["content"]
+
+    async def cached_generate(self, prompt: str, max_tokens: int = 1000) -> str:
+        """Like ``generate``, but reuse the reply to an identical earlier prompt."""
+        key = hashlib.sha256(json_codec.dumps_bytes([self.model, max_tokens, prompt])).hexdigest()
+        cached = _completion_cache.get(key)
+        if cached is not None:
+            return cached
+        reply = await self.generate(prompt, max_tokens=max_tokens)
+        _completion_cache.set(key, reply)
+        return reply
@@ -16,12 +16,17 @@ you want to call.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional
 
-from openai import OpenAI, RateLimitError, APIError, AuthenticationError, APIStatusError, OpenAIError
+import httpx
+from openai import OpenAI, APIError, APIStatusError, OpenAIError
 
 from .config import settings
+from .http_client import get_http_client
+from ..utils import json_codec
+from ..utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,27 @@ def _get_client() -> OpenAI:
     return OpenAI(api_key=api_key, base_url=settings.LLM_API_BASE)
 
 
+def _status_error(status_code: int) -> str:
+    """Map an HTTP error status from the provider to the reply shown to users."""
+    if status_code == 401:
+        return (
+            "Error: Invalid API key. "
+            "Check OPENAI_API_KEY in the backend .env and make sure it's correct."
+        )
+    if status_code == 402:
+        return (
+            "Error: Insufficient credits on OpenRouter. "
+            "Please add credits at https://openrouter.ai/settings/credits "
+            "or use a model with lower token requirements."
+        )
+    if status_code == 429:
+        return (
+            "Error: The AI backend has reached its rate limit on this key. "
+            "Please try again later or use a different key."
+        )
+    return f"Error: API returned status {status_code}. Please try again later."
+
+
 async def generate(
     messages: List[Dict[str, Any]],
     model: str | None = None,
@@ -78,28 +104,10 @@ async def generate(
 
     try:
         response = await asyncio.to_thread(call_api)
-    except AuthenticationError as e:
-        logger.exception("OpenAI auth error (invalid API key): %s", e)
-        return (
-            "Error: Invalid API key. "
-            "Check OPENAI_API_KEY in the backend .env and make sure it's correct."
-        )
     except APIStatusError as e:
-        if e.status_code == 402:
-            logger.exception("OpenAI insufficient credits: %s", e)
-            return (
-                "Error: Insufficient credits on OpenRouter. "
-                "Please add credits at https://openrouter.ai/settings/credits "
-                "or use a model with lower token requirements."
-            )
+        # Includes AuthenticationError (401) and RateLimitError (429).
         logger.exception("OpenAI API status error: %s", e)
-        return f"Error: API returned status {e.status_code}. Please try again later."
-    except RateLimitError as e:
-        logger.exception("OpenAI rate limit / insufficient quota: %s", e)
-        return (
-            "Error: The AI backend has reached its rate limit on this key. "
-            "Please try again later or use a different key."
-        )
+        return _status_error(e.status_code)
     except APIError as e:
         logger.exception("OpenAI API error: %s", e)
         return "Error: The AI provider returned an error. Please try again later."
@@ -125,6 +133,90 @@ async def generate(
     return "".join(chunks)
 
 
+# Successful completions keyed by a hash of (model, max_tokens, messages).
+# Research prompts embed the fetched page text, so a changed source yields a
+# new key; the TTL bounds how long an unchanged prompt is answered from here.
+_completion_cache: TTLCache[str] = TTLCache(maxsize=512, ttl=settings.LLM_CACHE_TTL)
+
+
+def _is_error_reply(reply: str) -> bool:
+    return reply.startswith(("Error:", "Missing LLM_API_KEY"))
+
+
+async def cached_generate(
+    messages: List[Dict[str, Any]],
+    model: str | None = None,
+    max_tokens: int = 4000,
+    no_cache: bool = False,
+) -> str:
+    """Like ``generate``, but reuse the reply to an identical earlier request.
+
+    Only successful replies are cached; error strings are always retried.
+    ``no_cache`` skips the lookup but still stores the fresh reply.
+    """
+    selected_model = model or settings.LLM_MODEL
+    key = hashlib.sha256(json_codec.dumps_bytes([selected_model, max_tokens, messages])).hexdigest()
+    cached = None if no_cache else _completion_cache.get(key)
+    if cached is not None:
+        return cached
+    reply = await generate(messages, model=selected_model, max_tokens=max_tokens)
+    if not _is_error_reply(reply):
+        _completion_cache.set(key, reply)
+    return reply
+
+
+def build_chat_body(
+    messages: List[Dict[str, Any]],
+    model: str | None = None,
+    tools: Optional[Iterable[Dict[str, Any]]] = None,
+    max_tokens: int = 4000,
+) -> bytes:
+    """Encode a chat completion request body for ``generate_raw``.
+
+    ``tools`` is only included when non-empty.
+    """
+    body: Dict[str, Any] = {
+        "model": model or settings.LLM_MODEL,
+        "messages": messages,
+        "max_tokens": max_tokens,
+    }
+    if tools:
+        body["tools"] = list(tools)
+    return json_codec.dumps_bytes(body)
+
+
+async def generate_raw(body: bytes, timeout: float = 60.0) -> str:
+    """Send a pre-encoded chat completion request and return the reply text.
+
+    ``body`` is posted as-is (see ``build_chat_body``), so the messages are
+    serialized exactly once with orjson instead of being re-encoded by the
+    SDK. Errors are reported as strings, like ``generate``.
+    """
+    api_key = settings.LLM_API_KEY or settings.OPENAI_API_KEY
+    if not api_key:
+        return "Missing LLM_API_KEY (or OPENAI_API_KEY). Set it in backend/.env before running the app/worker."
+
+    url = f"{settings.LLM_API_BASE.rstrip('/')}/chat/completions"
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    try:
+        response = await get_http_client().post(url, content=body, headers=headers, timeout=timeout)
+    except httpx.HTTPError as e:
+        logger.exception("Error while calling the chat completions endpoint: %s", e)
+        return "Error: Unexpected failure while talking to the AI backend."
+
+    if response.status_code >= 400:
+        logger.error("Chat completions endpoint returned %s: %s", response.status_code, response.text[:500])
+        return _status_error(response.status_code)
+
+    try:
+        choices = json_codec.loads(response.content).get("choices") or []
+    except (json_codec.JSONDecodeError, AttributeError):
+        return "Error: The AI provider returned an error. Please try again later."
+    if not choices:
+        return "Error: Empty response from AI backend."
+    return (choices[0].get("message") or {}).get("content") or ""
+
+
 async def generate_stream(
     messages: List[Dict[str, Any]],
     model: str | None = None,
@@ -156,30 +248,10 @@ async def generate_stream(
 
     try:
         response = await asyncio.to_thread(call_api)
-    except AuthenticationError as e:
-        logger.exception("OpenAI auth error (stream): %s", e)
-        yield (
-            "Error: Invalid API key. "
-            "Check OPENAI_API_KEY in the backend .env and make sure it's correct."
-        )
-        return
     except APIStatusError as e:
-        if e.status_code == 402:
-            logger.exception("OpenAI insufficient credits (stream): %s", e)
-            yield (
-                "Error: Insufficient credits on OpenRouter. "
-                "Please add credits at https://openrouter.ai/settings/credits."
-            )
-            return
+        # Includes AuthenticationError (401) and RateLimitError (429).
         logger.exception("OpenAI API status error (stream): %s", e)
-        yield f"Error: API returned status {e.status_code}. Please try again later."
-        return
-    except RateLimitError as e:
-        logger.exception("OpenAI rate limit / insufficient quota (stream): %s", e)
-        yield (
-            "Error: The AI backend has reached its rate limit on this key. "
-            "Please try again later or use a different key."
-        )
+        yield _status_error(e.status_code)
         return
     except APIError as e:
         logger.exception("OpenAI API error (stream): %s", e)
@@ -2,8 +2,33 @@
 Search Service for web search using Tavily API.
 """
 
+import asyncio
 import httpx
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from weakref import WeakKeyDictionary
+
+from .config import settings
+from .http_client import get_http_client
+
+
+# Queries are fanned out with asyncio.gather; this caps how many reach the
+# search API at once. Semaphores are tied to one event loop, so there is one
+# per loop (Celery tasks each run their own).
+_search_slots: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
+
+
+def _search_slot() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slot = _search_slots.get(loop)
+    if slot is None:
+        slot = _search_slots[loop] = asyncio.Semaphore(settings.SEARCH_CONCURRENCY)
+    return slot
+
+
+# Searches in flight per event loop, keyed by (api_key, query, num_results).
+# Sessions for the same segment started together issue identical queries;
+# later callers await the first one's request instead of sending their own.
+_inflight: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str, int], asyncio.Task]]" = WeakKeyDictionary()
 
 
 class SearchError(Exception):
@@ -22,9 +47,7 @@ async def search_web(query: str, num_results: int = 5) -> List[Dict[str, Any]]:
     Returns:
         List of search results with title, url, content
     """
-    from app.core.config import settings
-    service = SearchService(api_key=settings.SEARCH_API_KEY)
-    return await service.search(query, num_results)
+    return await SearchService(api_key=settings.SEARCH_API_KEY).search(query, num_results)
 
 
 class SearchService:
@@ -45,6 +68,17 @@ class SearchService:
         Returns:
             List of search results with title, url, content
         """
+        pending = _inflight.setdefault(asyncio.get_running_loop(), {})
+        key = (self.api_key, query, num_results)
+        task = pending.get(key)
+        if task is None:
+            task = pending[key] = asyncio.ensure_future(self._search(query, num_results))
+            task.add_done_callback(lambda _: pending.pop(key, None))
+        # Shielded so one caller being cancelled does not cancel the request
+        # for the others; each caller gets its own list.
+        return list(await asyncio.shield(task))
+
+    async def _search(self, query: str, num_results: int) -> List[Dict[str, Any]]:
         payload = {
             "api_key": self.api_key,
             "query": query,
@@ -56,21 +90,21 @@ class SearchService:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(self.base_url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                
-                results = []
-                for item in data.get("results", []):
-                    results.append({
-                        "title": item.get("title", ""),
-                        "url": item.get("url", ""),
-                        "content": item.get("content", ""),
-                        "score": item.get("score", 0.0)
-                    })
-                
-                return results
+            async with _search_slot():
+                response = await get_http_client().post(self.base_url, json=payload, timeout=15.0)
+            response.raise_for_status()
+            data = response.json()
+            
+            results = []
+            for item in data.get("results", []):
+                results.append({
+                    "title": item.get("title", ""),
+                    "url": item.get("url", ""),
+                    "content": item.get("content", ""),
+                    "score": item.get("score", 0.0)
+                })
+            
+            return results
                 
         except httpx.HTTPStatusError as e:
             # Graceful fallback on 4xx/5xx (e.g., 403)
@@ -0,0 +1,75 @@
+"""store session, company and trend keys as native uuid
+
+Revision ID: 20240403_uuid_keys
+Revises: 20240402_legacy_companies
+Create Date: 2024-04-03
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20240403_uuid_keys'
+down_revision = '20240402_legacy_companies'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, referenced table) for every foreign key pointing at a
+# UUID primary key. They are dropped while the column types change.
+FOREIGN_KEYS = [
+    ('research_session_logs', 'session_id', 'research_sessions'),
+    ('session_companies', 'session_id', 'research_sessions'),
+    ('trend_analyses', 'session_id', 'research_sessions'),
+    ('company_profiles', 'company_id', 'session_companies'),
+    ('company_sources', 'company_id', 'session_companies'),
+]
+
+PRIMARY_KEYS = ['research_sessions', 'session_companies', 'trend_analyses']
+
+
+def _drop_foreign_keys():
+    for table, column, _ in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+
+
+def _create_foreign_keys():
+    for table, column, referred in FOREIGN_KEYS:
+        op.create_foreign_key(
+            f'{table}_{column}_fkey', table, referred, [column], ['id'], ondelete='CASCADE'
+        )
+
+
+def upgrade():
+    _drop_foreign_keys()
+    for table in PRIMARY_KEYS:
+        op.alter_column(
+            table, 'id',
+            type_=postgresql.UUID(as_uuid=False),
+            postgresql_using='id::uuid',
+        )
+    for table, column, _ in FOREIGN_KEYS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.UUID(as_uuid=False),
+            postgresql_using=f'{column}::uuid',
+        )
+    _create_foreign_keys()
+
+
+def downgrade():
+    _drop_foreign_keys()
+    for table, column, _ in FOREIGN_KEYS:
+        op.alter_column(
+            table, column,
+            type_=sa.String(),
+            postgresql_using=f'{column}::text',
+        )
+    for table in PRIMARY_KEYS:
+        op.alter_column(
+            table, 'id',
+            type_=sa.String(),
+            postgresql_using='id::text',
+        )
+    _create_foreign_keys()
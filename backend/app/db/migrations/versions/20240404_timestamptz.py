@@ -0,0 +1,51 @@
+"""make timestamp columns timezone-aware
+
+Revision ID: 20240404_timestamptz
+Revises: 20240403_uuid_keys
+Create Date: 2024-04-04
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20240404_timestamptz'
+down_revision = '20240403_uuid_keys'
+branch_labels = None
+depends_on = None
+
+
+# Existing values were written with ``datetime.utcnow()`` or ``now()`` in
+# a UTC session, so they are reinterpreted as UTC.
+TIMESTAMP_COLUMNS = [
+    ('research_sessions', 'created_at'),
+    ('research_sessions', 'updated_at'),
+    ('research_session_logs', 'ts'),
+    ('session_companies', 'last_verified_at'),
+    ('session_companies', 'created_at'),
+    ('session_companies', 'updated_at'),
+    ('trend_analyses', 'created_at'),
+    ('companies', 'last_updated'),
+    ('companies', 'first_discovered'),
+    ('source_documents', 'published_at'),
+    ('research_jobs', 'created_at'),
+    ('research_jobs', 'finished_at'),
+]
+
+
+def upgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -0,0 +1,47 @@
+"""fold company profile sections into one jsonb document
+
+Revision ID: 20240405_profile_content
+Revises: 20240404_timestamptz
+Create Date: 2024-04-05
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20240405_profile_content'
+down_revision = '20240404_timestamptz'
+branch_labels = None
+depends_on = None
+
+
+PROFILE_FIELDS = [
+    'summary',
+    'score_analysis',
+    'market_position',
+    'background',
+    'recent_developments',
+    'products_services',
+    'scale_reach',
+    'strategic_notes',
+]
+
+
+def upgrade():
+    op.add_column(
+        'company_profiles',
+        sa.Column('content', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='{}'),
+    )
+    pairs = ', '.join(f"'{field}', {field}" for field in PROFILE_FIELDS)
+    op.execute(f"UPDATE company_profiles SET content = jsonb_strip_nulls(jsonb_build_object({pairs}))")
+    for field in PROFILE_FIELDS:
+        op.drop_column('company_profiles', field)
+
+
+def downgrade():
+    for field in PROFILE_FIELDS:
+        op.add_column('company_profiles', sa.Column(field, sa.Text(), nullable=True))
+    assignments = ', '.join(f"{field} = content ->> '{field}'" for field in PROFILE_FIELDS)
+    op.execute(f"UPDATE company_profiles SET {assignments}")
+    op.drop_column('company_profiles', 'content')
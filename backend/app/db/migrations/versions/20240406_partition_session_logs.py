@@ -0,0 +1,79 @@
+"""hash-partition research session logs by session
+
+Revision ID: 20240406_partition_session_logs
+Revises: 20240405_profile_content
+Create Date: 2024-04-06
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20240406_partition_session_logs'
+down_revision = '20240405_profile_content'
+branch_labels = None
+depends_on = None
+
+
+# Logs are always read and purged one session at a time, so hashing on
+# session_id keeps each session's rows (and its cascade delete) inside a
+# single small partition.
+PARTITIONS = 16
+
+COLUMNS = 'id, session_id, ts, level, message, meta'
+
+
+def _create_logs_table(name, partitioned):
+    # A partitioned table's primary key must include the partition key.
+    primary_key = 'PRIMARY KEY (id, session_id)' if partitioned else 'PRIMARY KEY (id)'
+    suffix = ' PARTITION BY HASH (session_id)' if partitioned else ''
+    op.execute(
+        f"""
+        CREATE TABLE {name} (
+            id integer NOT NULL DEFAULT nextval('research_session_logs_id_seq'),
+            session_id uuid NOT NULL,
+            ts timestamptz DEFAULT now(),
+            level varchar,
+            message text NOT NULL,
+            meta jsonb,
+            CONSTRAINT research_session_logs_pkey {primary_key},
+            CONSTRAINT research_session_logs_session_id_fkey FOREIGN KEY (session_id)
+                REFERENCES research_sessions (id) ON DELETE CASCADE
+        ){suffix}
+        """
+    )
+
+
+def _swap_in(new_name):
+    """Move rows into ``new_name`` and give it the original table name."""
+    op.execute(f'INSERT INTO {new_name} ({COLUMNS}) SELECT {COLUMNS} FROM research_session_logs_old')
+    op.execute(f'ALTER SEQUENCE research_session_logs_id_seq OWNED BY {new_name}.id')
+    op.execute('DROP TABLE research_session_logs_old')
+    op.execute(f'ALTER TABLE {new_name} RENAME TO research_session_logs')
+
+
+def _retire_current_table():
+    op.execute('ALTER SEQUENCE research_session_logs_id_seq OWNED BY NONE')
+    op.execute('ALTER TABLE research_session_logs RENAME TO research_session_logs_old')
+    op.execute('ALTER INDEX research_session_logs_pkey RENAME TO research_session_logs_old_pkey')
+
+
+def upgrade():
+    _retire_current_table()
+    _create_logs_table('research_session_logs_new', partitioned=True)
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f'CREATE TABLE research_session_logs_p{remainder} PARTITION OF research_session_logs_new '
+            f'FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})'
+        )
+    _swap_in('research_session_logs_new')
+    # Indexes on the parent are created on every partition.
+    op.create_index('ix_research_session_logs_session_id_ts', 'research_session_logs', ['session_id', 'ts'])
+    op.create_index('ix_research_session_logs_ts', 'research_session_logs', ['ts'])
+
+
+def downgrade():
+    _retire_current_table()
+    _create_logs_table('research_session_logs_new', partitioned=False)
+    _swap_in('research_session_logs_new')
+    op.create_index('ix_research_session_logs_session_id', 'research_session_logs', ['session_id'])
+    op.create_index('ix_research_session_logs_ts', 'research_session_logs', ['ts'])
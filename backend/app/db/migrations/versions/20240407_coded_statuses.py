@@ -0,0 +1,44 @@
+"""store status and level labels as smallint codes
+
+Revision ID: 20240407_coded_statuses
+Revises: 20240406_partition_session_logs
+Create Date: 2024-04-07
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20240407_coded_statuses'
+down_revision = '20240406_partition_session_logs'
+branch_labels = None
+depends_on = None
+
+
+# Must match the label tuples in app/db/models.py; the code is the index.
+# Unknown legacy values fall back to the first label.
+CODED_COLUMNS = [
+    ('research_sessions', 'status', ('PENDING', 'RUNNING', 'COMPLETE', 'FAILED')),
+    ('research_session_logs', 'level', ('info', 'success', 'warning', 'error')),
+    ('session_companies', 'status', ('PENDING', 'COMPLETE', 'FAILED')),
+]
+
+
+def upgrade():
+    for table, column, labels in CODED_COLUMNS:
+        cases = ' '.join(f"WHEN '{label}' THEN {code}" for code, label in enumerate(labels))
+        op.alter_column(
+            table, column,
+            type_=sa.SmallInteger(),
+            postgresql_using=f'CASE {column} {cases} ELSE 0 END',
+        )
+
+
+def downgrade():
+    for table, column, labels in CODED_COLUMNS:
+        cases = ' '.join(f"WHEN {code} THEN '{label}'" for code, label in enumerate(labels))
+        op.alter_column(
+            table, column,
+            type_=sa.String(),
+            postgresql_using=f'CASE {column} {cases} END',
+        )
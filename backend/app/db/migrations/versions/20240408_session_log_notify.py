@@ -0,0 +1,43 @@
+"""notify listeners when session logs are written
+
+Revision ID: 20240408_session_log_notify
+Revises: 20240407_coded_statuses
+Create Date: 2024-04-08
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20240408_session_log_notify'
+down_revision = '20240407_coded_statuses'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The payload is left empty on purpose: Postgres folds identical
+    # notifications within a transaction, so a batch of log rows for one
+    # session wakes listeners once. Channel format matches
+    # app.services.log_stream.channel_name.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_session_log() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('session_' || NEW.session_id::text, '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER research_session_logs_notify
+        AFTER INSERT ON research_session_logs
+        FOR EACH ROW EXECUTE FUNCTION notify_session_log()
+        """
+    )
+
+
+def downgrade():
+    op.execute('DROP TRIGGER IF EXISTS research_session_logs_notify ON research_session_logs')
+    op.execute('DROP FUNCTION IF EXISTS notify_session_log()')
@@ -0,0 +1,90 @@
+"""mirror list-valued company fields into company_tags
+
+Revision ID: 20240409_company_tags
+Revises: 20240408_session_log_notify
+Create Date: 2024-04-09
+"""
+
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20240409_company_tags'
+down_revision = '20240408_session_log_notify'
+branch_labels = None
+depends_on = None
+
+
+# Must match _TAG_TYPES in app/services/research_service.py.
+TAG_COLUMNS = [
+    ('pricing_model', 'pricing'),
+    ('strengths', 'strength'),
+    ('risks', 'risk'),
+    ('compliance_tags', 'compliance'),
+]
+
+
+def upgrade():
+    op.create_table(
+        'company_tags',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('company_id', sa.Integer(), sa.ForeignKey('companies.id', ondelete='CASCADE'), nullable=False, index=True),
+        sa.Column('tag_type', sa.String(), nullable=False),
+        sa.Column('tag_value', sa.String(), nullable=False),
+    )
+    op.create_index('ix_company_tags_type_value', 'company_tags', ['tag_type', 'tag_value'])
+    # Backfill from the JSON arrays, or legacy comma-separated text.
+    if op.get_bind().dialect.name != 'postgresql':
+        _backfill_portable()
+        return
+    for column, tag_type in TAG_COLUMNS:
+        op.execute(
+            f"""
+            INSERT INTO company_tags (company_id, tag_type, tag_value)
+            SELECT c.id, '{tag_type}', btrim(parts.value)
+            FROM companies AS c
+            CROSS JOIN LATERAL (
+                SELECT jsonb_array_elements_text(c.{column}::jsonb) AS value
+                WHERE c.{column} LIKE '[%'
+                UNION ALL
+                SELECT regexp_split_to_table(c.{column}, ',')
+                WHERE c.{column} <> '' AND c.{column} NOT LIKE '[%'
+            ) AS parts
+            WHERE btrim(parts.value) <> ''
+            """
+        )
+
+
+def _split(value):
+    # Same parsing as _list_field in app/services/research_service.py.
+    if not value:
+        return []
+    if value.startswith('['):
+        try:
+            items = json.loads(value)
+        except ValueError:
+            items = None
+        if isinstance(items, list):
+            return [str(item).strip() for item in items if str(item).strip()]
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+def _backfill_portable():
+    bind = op.get_bind()
+    companies = sa.table('companies', sa.column('id'), *(sa.column(column) for column, _ in TAG_COLUMNS))
+    tags = sa.table('company_tags', sa.column('company_id'), sa.column('tag_type'), sa.column('tag_value'))
+    rows = [
+        {'company_id': row.id, 'tag_type': tag_type, 'tag_value': value}
+        for row in bind.execute(sa.select(companies))
+        for column, tag_type in TAG_COLUMNS
+        for value in _split(getattr(row, column))
+    ]
+    if rows:
+        op.bulk_insert(tags, rows)
+
+
+def downgrade():
+    op.drop_index('ix_company_tags_type_value', table_name='company_tags')
+    op.drop_table('company_tags')
@@ -0,0 +1,24 @@
+"""index research sessions by updated_at
+
+Revision ID: 20240410_session_updated_at_index
+Revises: 20240409_company_tags
+Create Date: 2024-04-10
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20240410_session_updated_at_index'
+down_revision = '20240409_company_tags'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The recent-sessions list orders by updated_at DESC with a small LIMIT;
+    # a backward scan of this index reads just those rows.
+    op.create_index('ix_research_sessions_updated_at', 'research_sessions', ['updated_at'])
+
+
+def downgrade():
+    op.drop_index('ix_research_sessions_updated_at', table_name='research_sessions')
@@ -5,14 +5,78 @@ Defines ``User``, ``ChatSession``, and ``Message`` tables. These models
 are simplistic and can be extended with additional fields or relations.
 """
 
-from datetime import datetime
-
 import uuid
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, Float, JSON
-from sqlalchemy.orm import relationship
+from typing import Optional, Tuple
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, SmallInteger, String, Text, Float, JSON, func
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import backref, relationship
 
 from .base import Base
 
+# A lazy load cannot run under asyncio (it fails with MissingGreenlet), so
+# every relationship is declared ``lazy="raise_on_sql"`` and read through
+# explicit loader options (``selectinload``) on the query that needs it. A
+# query that forgets its loader option fails loudly with a clear error;
+# attributes already in the identity map are still returned without SQL.
+
+# JSON document column: binary JSONB on PostgreSQL (matching the Alembic
+# migrations), generic JSON elsewhere. Encoding is handled by the engine's
+# orjson-backed serializer configured in ``db/session.py``.
+JSONDocument = JSON().with_variant(postgresql.JSONB(astext_type=Text()), "postgresql")
+
+# UUID key stored as native 16-byte ``uuid`` on PostgreSQL and as text
+# elsewhere. Values are exchanged as strings on every backend so API
+# schemas and route parameters stay unchanged. New ids are always generated
+# in Python (``uuid4`` column defaults), never by the database.
+UUIDString = String().with_variant(postgresql.UUID(as_uuid=False), "postgresql")
+
+
+class CodedString(TypeDecorator):
+    """Low-cardinality label stored as a SMALLINT code.
+
+    Application code keeps reading and writing the label strings; only the
+    database sees the integer position of the label in ``labels``. New labels
+    must therefore be appended, never inserted or reordered.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, labels: Tuple[str, ...]):
+        super().__init__()
+        self.labels = labels
+        self._codes = {label: code for code, label in enumerate(labels)}
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        try:
+            return self._codes[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not one of {self.labels}") from None
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        # Rows written before the column was coded (SQLite databases from
+        # ``create_all``) hold the label itself until scripts/fix_database.py
+        # converts them.
+        if isinstance(value, str):
+            return value
+        return self.labels[value]
+
+
+SESSION_STATUSES = ("PENDING", "RUNNING", "COMPLETE", "FAILED")
+COMPANY_STATUSES = ("PENDING", "COMPLETE", "FAILED")
+LOG_LEVELS = ("info", "success", "warning", "error")
+
+# Timestamps are timezone-aware and filled in by the database (``now()``)
+# rather than by a Python callable per row. Models with server defaults set
+# ``eager_defaults`` so the server-generated values come back via RETURNING
+# instead of an extra lazy load (or ``refresh``) after flush.
+
 
 class User(Base):
     """User account model."""
@@ -24,24 +88,26 @@ class User(Base):
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
 
-    messages = relationship("Message", back_populates="user", cascade="all, delete-orphan")
+    messages = relationship("Message", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 
 class ChatSession(Base):
     """Chat session model representing a conversation between a user and the agent."""
 
     __tablename__ = "chat_sessions"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    user = relationship("User", backref="sessions")
+    user = relationship("User", backref=backref("sessions", lazy="raise_on_sql"), lazy="raise_on_sql")
     messages = relationship(
         "Message",
         back_populates="session",
         cascade="all, delete-orphan",
         order_by="Message.id",
+        lazy="raise_on_sql",
     )
 
 
@@ -49,16 +115,17 @@ class Message(Base):
     """Individual chat message within a session."""
 
     __tablename__ = "messages"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(Integer, ForeignKey("chat_sessions.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     role = Column(String, nullable=False)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    session = relationship("ChatSession", back_populates="messages")
-    user = relationship("User", back_populates="messages")
+    session = relationship("ChatSession", back_populates="messages", lazy="raise_on_sql")
+    user = relationship("User", back_populates="messages", lazy="raise_on_sql")
 
 
 # ---------------------------------------------------------------------------
@@ -102,6 +169,7 @@ class Company(Base):
     """
 
     __tablename__ = "companies"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     # Basic identification fields
@@ -124,15 +192,17 @@ class Company(Base):
     has_ai_features = Column(Boolean, default=False)
     compliance_tags = Column(Text, nullable=True)  # JSON string
     # Timestamps
-    last_updated = Column(DateTime, default=datetime.utcnow)
-    first_discovered = Column(DateTime, default=datetime.utcnow)
+    last_updated = Column(DateTime(timezone=True), server_default=func.now())
+    first_discovered = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     documents = relationship(
         "SourceDocument",
         back_populates="company",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
+    tags = relationship("CompanyTag", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 
 class SourceDocument(Base):
@@ -155,9 +225,27 @@ class SourceDocument(Base):
     full_text = Column(Text, nullable=True)
     source_type = Column(String, nullable=True)  # e.g. "website", "wikipedia", "article"
     relevance_score = Column(Float, nullable=True)  # 0–1 score indicating relevance
-    published_at = Column(DateTime, nullable=True)
+    published_at = Column(DateTime(timezone=True), nullable=True)
 
-    company = relationship("Company", back_populates="documents")
+    company = relationship("Company", back_populates="documents", lazy="raise_on_sql")
+
+
+class CompanyTag(Base):
+    """One label from a company's list-valued profile fields.
+
+    ``profile_company`` mirrors ``pricing_model``, ``strengths``, ``risks``
+    and ``compliance_tags`` into this table whenever they change, so
+    statistics can group on ``tag_value`` instead of decoding the JSON text
+    columns of every company.
+    """
+
+    __tablename__ = "company_tags"
+    __table_args__ = (Index("ix_company_tags_type_value", "tag_type", "tag_value"),)
+
+    id = Column(Integer, primary_key=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    tag_type = Column(String, nullable=False)  # "pricing", "strength", "risk", "compliance"
+    tag_value = Column(String, nullable=False)
 
 
 class ResearchJob(Base):
@@ -170,12 +258,14 @@ class ResearchJob(Base):
     """
 
     __tablename__ = "research_jobs"
+    # created_at comes back with the INSERT; start_research reports it.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     segment = Column(String, nullable=False)
     status = Column(String, nullable=False, default="pending")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    finished_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
     error_message = Column(Text, nullable=True)
 
     # Optionally you could add a relationship to discovered companies
@@ -191,82 +281,127 @@ class ResearchSession(Base):
     """Market research session initiated by the user."""
 
     __tablename__ = "research_sessions"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
     label = Column(String, nullable=False, index=True)  # what user typed
     segment = Column(String, nullable=True)
-    status = Column(String, nullable=False, default="PENDING")  # PENDING/RUNNING/COMPLETED/FAILED
+    status = Column(CodedString(SESSION_STATUSES), nullable=False, default="PENDING")
     max_companies = Column(Integer, nullable=True)
     companies_found = Column(Integer, nullable=False, default=0)
-    charts = Column(JSON, nullable=True)  # precomputed chart datasets
-    scoring_config = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    charts = Column(JSONDocument, nullable=True)  # precomputed chart datasets
+    scoring_config = Column(JSONDocument, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Indexed for the recent-sessions list (ORDER BY updated_at DESC LIMIT n)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
 
-    logs = relationship("ResearchSessionLog", back_populates="session", cascade="all, delete-orphan")
-    companies = relationship("SessionCompany", back_populates="session", cascade="all, delete-orphan")
-    trends = relationship("TrendAnalysis", back_populates="session", cascade="all, delete-orphan")
+    logs = relationship("ResearchSessionLog", back_populates="session", cascade="all, delete-orphan", lazy="raise_on_sql")
+    companies = relationship("SessionCompany", back_populates="session", cascade="all, delete-orphan", lazy="raise_on_sql")
+    trends = relationship("TrendAnalysis", back_populates="session", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 
 class ResearchSessionLog(Base):
     """Ordered log lines for a session, driving the terminal console UI."""
 
     __tablename__ = "research_session_logs"
+    # On PostgreSQL the table is hash-partitioned by session_id (see the
+    # 20240406 migration); the primary key there is (id, session_id).
+    __table_args__ = (Index("ix_research_session_logs_session_id_ts", "session_id", "ts"),)
 
     id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(String, ForeignKey("research_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
-    ts = Column(DateTime, default=datetime.utcnow, index=True)
-    level = Column(String, default="info")  # info/success/warning/error
+    session_id = Column(UUIDString, ForeignKey("research_sessions.id", ondelete="CASCADE"), nullable=False)
+    ts = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    level = Column(CodedString(LOG_LEVELS), default="info")
     message = Column(Text, nullable=False)
-    meta = Column(JSON, nullable=True)
+    meta = Column(JSONDocument, nullable=True)
 
-    session = relationship("ResearchSession", back_populates="logs")
+    session = relationship("ResearchSession", back_populates="logs", lazy="raise_on_sql")
 
 
 class SessionCompany(Base):
     """Company discovered as part of a research session."""
 
     __tablename__ = "session_companies"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    session_id = Column(String, ForeignKey("research_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
+    session_id = Column(UUIDString, ForeignKey("research_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False, index=True)
     domain = Column(String, nullable=True)
     logo_url = Column(String, nullable=True)
     score = Column(Integer, nullable=True)
-    status = Column(String, default="PENDING")  # PENDING/COMPLETE/FAILED
+    status = Column(CodedString(COMPANY_STATUSES), default="PENDING")
     data_reliability = Column(String, default="medium")
-    last_verified_at = Column(DateTime, nullable=True)
+    last_verified_at = Column(DateTime(timezone=True), nullable=True)
     founded_year = Column(Integer, nullable=True)
     employees = Column(Integer, nullable=True)
     hq_city = Column(String, nullable=True)
     hq_country = Column(String, nullable=True)
-    primary_tags = Column(JSON, nullable=True)
+    primary_tags = Column(JSONDocument, nullable=True)
     summary = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    profile = relationship(
+        "CompanyProfile", back_populates="company", uselist=False, cascade="all, delete-orphan", lazy="raise_on_sql"
+    )
+    sources = relationship("CompanySource", back_populates="company", cascade="all, delete-orphan", lazy="raise_on_sql")
+    session = relationship("ResearchSession", back_populates="companies", lazy="raise_on_sql")
+
+
+# Sections of a generated company profile, stored as keys of
+# ``CompanyProfile.content``.
+PROFILE_FIELDS = (
+    "summary",
+    "score_analysis",
+    "market_position",
+    "background",
+    "recent_developments",
+    "products_services",
+    "scale_reach",
+    "strategic_notes",
+)
+
 
-    profile = relationship("CompanyProfile", back_populates="company", uselist=False, cascade="all, delete-orphan")
-    sources = relationship("CompanySource", back_populates="company", cascade="all, delete-orphan")
-    session = relationship("ResearchSession", back_populates="companies")
+class _ProfileField:
+    """Expose one key of ``CompanyProfile.content`` as a plain attribute."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return (obj.content or {}).get(self.name)
+
+    def __set__(self, obj, value):
+        # Assign a new dict so the ORM sees the column as modified.
+        obj.content = {**(obj.content or {}), self.name: value}
 
 
 class CompanyProfile(Base):
-    """Detailed profile content for a company (LLM generated)."""
+    """Detailed profile content for a company (LLM generated).
+
+    The profile sections are always written and read together, so they live
+    in a single JSON document instead of one text column each. Attribute
+    access (``profile.summary`` etc.) reads and writes keys of ``content``.
+    """
 
     __tablename__ = "company_profiles"
 
-    company_id = Column(String, ForeignKey("session_companies.id", ondelete="CASCADE"), primary_key=True)
-    summary = Column(Text, nullable=True)
-    score_analysis = Column(Text, nullable=True)
-    market_position = Column(Text, nullable=True)
-    background = Column(Text, nullable=True)
-    recent_developments = Column(Text, nullable=True)
-    products_services = Column(Text, nullable=True)  # Store as JSON string
-    scale_reach = Column(Text, nullable=True)
-    strategic_notes = Column(Text, nullable=True)
+    company_id = Column(UUIDString, ForeignKey("session_companies.id", ondelete="CASCADE"), primary_key=True)
+    content = Column(JSONDocument, nullable=False, default=dict, server_default="{}")
+
+    summary = _ProfileField()
+    score_analysis = _ProfileField()
+    market_position = _ProfileField()
+    background = _ProfileField()
+    recent_developments = _ProfileField()
+    products_services = _ProfileField()
+    scale_reach = _ProfileField()
+    strategic_notes = _ProfileField()
 
-    company = relationship("SessionCompany", back_populates="profile")
+    company = relationship("SessionCompany", back_populates="profile", lazy="raise_on_sql")
 
 class CompanySource(Base):
     """Sources underpinning a company profile."""
@@ -274,12 +409,12 @@ class CompanySource(Base):
     __tablename__ = "company_sources"
 
     id = Column(Integer, primary_key=True, index=True)
-    company_id = Column(String, ForeignKey("session_companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    company_id = Column(UUIDString, ForeignKey("session_companies.id", ondelete="CASCADE"), nullable=False, index=True)
     url = Column(String, nullable=False)
     label = Column(String, nullable=True)
     source_type = Column(String, nullable=True)  # news, official_site, report
 
-    company = relationship("SessionCompany", back_populates="sources")
+    company = relationship("SessionCompany", back_populates="sources", lazy="raise_on_sql")
 
 
 class TrendAnalysis(Base):
@@ -287,10 +422,10 @@ class TrendAnalysis(Base):
 
     __tablename__ = "trend_analyses"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    session_id = Column(String, ForeignKey("research_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
+    session_id = Column(UUIDString, ForeignKey("research_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
     overview = Column(Text, nullable=True)
-    bars = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    bars = Column(JSONDocument, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    session = relationship("ResearchSession", back_populates="trends")
+    session = relationship("ResearchSession", back_populates="trends", lazy="raise_on_sql")
@@ -6,18 +6,80 @@ application settings. The async session factory is exported as
 ``async_session`` for use in dependency injection.
 """
 
+import asyncio
+from typing import Any, Dict
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from ..core.config import settings
+from ..utils import json_codec
+
+
+def _engine_options(db_url: str) -> Dict[str, Any]:
+    """Return driver-specific tuning for ``create_async_engine``.
+
+    SQLite keeps SQLAlchemy's defaults (its pool does not take sizing
+    arguments). Server databases get a sized, pre-pinged pool and, on
+    asyncpg, a larger prepared-statement cache so the repetitive message,
+    session and log queries skip re-parsing on every call.
+    """
+    url = make_url(db_url)
+    options: Dict[str, Any] = {
+        "echo": False,
+        # Rows per multi-VALUES INSERT when SQLAlchemy batches executemany().
+        "insertmanyvalues_page_size": 1000,
+        # JSON/JSONB columns (charts, tags, log meta) go through orjson.
+        "json_serializer": json_codec.dumps,
+        "json_deserializer": json_codec.loads,
+    }
+    if url.get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "statement_cache_size": 1024,
+            "prepared_statement_cache_size": 1024,
+            "command_timeout": 30,
+        }
+    return options
 
 
 # Create an async engine. The echo flag can be set to True for verbose
 # SQL logging during development.
-engine = create_async_engine(settings.DB_URL, echo=False, future=True)
+engine = create_async_engine(settings.DB_URL, **_engine_options(settings.DB_URL))
 
 async_session = sessionmaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False,
-)
\ No newline at end of file
+)
+
+
+# Connections opened by ``warm_pool`` at startup.
+POOL_WARM_CONNECTIONS = 4
+
+
+async def warm_pool(connections: int = POOL_WARM_CONNECTIONS) -> None:
+    """Open pooled connections up front so early requests skip the connect,
+    authentication and (on asyncpg) type introspection round trips.
+
+    No-op on SQLite, where connecting is just opening a file.
+    """
+    if engine.dialect.name == "sqlite":
+        return
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Held concurrently, so each ping checks out a distinct connection.
+    await asyncio.gather(*(_ping() for _ in range(connections)))
@@ -5,56 +5,124 @@ This module defines a mapping of agent names to their configurations. Each
 agent includes a name, description, prompt file path, model, and list of
 allowed tools. A convenience function is provided to retrieve the default
 agent.
+
+The built-in agents are constructed once at import time and exposed through
+a read-only ``AGENTS`` view. Use ``register_agent`` to add or replace an
+agent so that every reader sees the change through the same mapping.
 """
 
-from typing import Dict
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
+from ..core.config import settings
 from ..schemas.agent import AgentConfig
+from ..utils import json_codec
+
+
+PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
+
+# Every built-in agent runs on the configured LLM model (``LLM_MODEL``).
+_MODEL = settings.LLM_MODEL
 
 
 # Define available agents. When adding a new agent, ensure the prompt file
 # exists in ``app/llm/prompts`` and list any tools the agent may use.
-AGENTS: Dict[str, AgentConfig] = {
-    "base": AgentConfig(
-        name="base",
-        description="Base agent with a generic system prompt",
-        prompt_file="base_system.txt",
-        model="llama-3.1-8b-instant",
-        tools=[],
-    ),
-    "student": AgentConfig(
-        name="student",
-        description="Friendly study companion tailored for students",
-        prompt_file="student_agent.txt",
-        model="llama-3.1-8b-instant",
-        tools=[],
-    ),
-    "prof": AgentConfig(
-        name="prof",
-        description="Experienced professor with deep academic knowledge",
-        prompt_file="prof_agent.txt",
-        model="llama-3.1-8b-instant",
-        tools=[],
-    ),
+_RAW = (
+    {
+        "name": "base",
+        "description": "Base agent with a generic system prompt",
+        "prompt_file": "base_system.txt",
+        "model": _MODEL,
+        "tools": [],
+    },
+    {
+        "name": "student",
+        "description": "Friendly study companion tailored for students",
+        "prompt_file": "student_agent.txt",
+        "model": _MODEL,
+        "tools": [],
+    },
+    {
+        "name": "prof",
+        "description": "Experienced professor with deep academic knowledge",
+        "prompt_file": "prof_agent.txt",
+        "model": _MODEL,
+        "tools": [],
+    },
     # New agent for structured EdTech competitor research. This persona
     # specialises in discovering and profiling companies in the education
     # technology sector. It uses a dedicated system prompt (see
-    # app/llm/prompts/market_agent.txt) and the same free OpenRouter model.
-    "market": AgentConfig(
-        name="market",
-        description="Market research agent for EdTech and LMS competitor intelligence",
-        prompt_file="market_agent.txt",
-        model="llama-3.1-8b-instant",
-        tools=[],
-    ),
+    # app/llm/prompts/market_agent.txt) and the same configured model.
+    {
+        "name": "market",
+        "description": "Market research agent for EdTech and LMS competitor intelligence",
+        "prompt_file": "market_agent.txt",
+        "model": _MODEL,
+        "tools": [],
+    },
+)
+
+# The entries above are trusted literals, so skip validation when building them.
+_REGISTRY: Dict[str, AgentConfig] = {
+    raw["name"]: AgentConfig.model_construct(**raw) for raw in _RAW
 }
 
+AGENTS: Mapping[str, AgentConfig] = MappingProxyType(_REGISTRY)
 
-def list_agents() -> Dict[str, AgentConfig]:
-    """Return all registered agents as a mapping."""
+# JSON body of the agent list endpoint, rebuilt after ``register_agent``.
+_agents_body: Optional[bytes] = None
+
+
+def list_agents() -> Mapping[str, AgentConfig]:
+    """Return all registered agents as a read-only mapping."""
     return AGENTS
 
 
 def get_default_agent() -> AgentConfig:
     """Return the default agent configuration."""
     return AGENTS["base"]
+
+
+def register_agent(config: AgentConfig) -> AgentConfig:
+    """Add or replace an agent configuration in the registry."""
+    global _agents_body
+    _REGISTRY[config.name] = config
+    _agents_body = None
+    return config
+
+
+def serialized_agents() -> bytes:
+    """Return the ``AgentListResponse`` JSON body for all registered agents.
+
+    The registry only changes through ``register_agent``, so the payload is
+    encoded once and reused until the next registration.
+    """
+    global _agents_body
+    if _agents_body is None:
+        _agents_body = json_codec.dumps_bytes(
+            {"agents": [agent.model_dump() for agent in AGENTS.values()]}
+        )
+    return _agents_body
+
+
+@lru_cache(maxsize=None)
+def _read_prompt(prompt_file: str) -> str:
+    return (PROMPTS_DIR / prompt_file).read_text(encoding="utf-8")
+
+
+def get_prompt(name: str) -> str:
+    """Return the system prompt text for an agent.
+
+    Prompt files are static, so each one is read from disk once and served
+    from memory afterwards. The cache is keyed by file name, which keeps it
+    correct when ``register_agent`` points an agent at a different file.
+    """
+    return _read_prompt(AGENTS[name].prompt_file)
+
+
+def warm_prompts() -> None:
+    """Load the prompt of every registered agent into the cache."""
+    for name in AGENTS:
+        get_prompt(name)
@@ -1,26 +1,69 @@
 """
-Planner module stub.
+Keyword-based tool planner.
 
 A planner decides which tool (if any) to invoke based on the current
-conversation. The simplest planner returns ``None`` indicating no tool
-call. You can extend this logic to parse messages and determine whether
-a calendar lookup, FAQ search, or web search is appropriate.
+conversation. This implementation looks at the latest user message and
+routes it to the calendar, FAQ, or web search tool when it contains one
+of the trigger phrases below. All phrases are compiled into a single
+regular expression so each message is scanned once, however many
+triggers are registered.
 """
 
-from typing import List, Optional
+import re
+from typing import Iterable, List, Optional
 
 from ..schemas.common import Message
 
 
-async def plan(messages: List[Message]) -> Optional[dict]:
+# Trigger phrases per tool. Order matters only for overlapping matches at
+# the same position: earlier tools win.
+_TRIGGERS = {
+    "calendar": ("meeting", "schedule", "calendar", "appointment"),
+    "faq": ("what is", "how do i", "how to", "faq"),
+    "search": ("search", "find", "look up"),
+}
+
+_TRIGGER_RE = re.compile(
+    "|".join(
+        rf"(?P<{tool}>\b(?:{'|'.join(re.escape(p) for p in phrases)})\b)"
+        for tool, phrases in _TRIGGERS.items()
+    ),
+    re.IGNORECASE,
+)
+
+
+def _arguments(tool: str, text: str) -> dict:
+    """Build the argument payload expected by each tool's ``run``."""
+    if tool == "faq":
+        return {"question": text}
+    if tool == "search":
+        return {"query": text}
+    return {}
+
+
+async def plan(
+    messages: List[Message], allowed: Optional[Iterable[str]] = None
+) -> Optional[dict]:
     """Decide which tool to call based on the conversation history.
 
     Args:
         messages (List[Message]): Ordered list of conversation messages.
+        allowed (Optional[Iterable[str]]): Tool names the caller may invoke.
+            ``None`` allows every known tool.
 
     Returns:
         Optional[dict]: If a tool call is needed, return a dict with
             ``name`` and ``arguments`` keys. Otherwise, return None.
     """
-    # TODO: implement intelligent tool planning based on message content.
-    return None
\ No newline at end of file
+    if not messages or messages[-1].role != "user":
+        return None
+    permitted = set(_TRIGGERS) if allowed is None else set(allowed)
+    if not permitted:
+        return None
+
+    text = messages[-1].content
+    for match in _TRIGGER_RE.finditer(text):
+        tool = match.lastgroup
+        if tool in permitted:
+            return {"name": tool, "arguments": _arguments(tool, text)}
+    return None
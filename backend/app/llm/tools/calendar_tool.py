@@ -10,6 +10,10 @@ actual calendar API calls (e.g. Google Calendar, Outlook) as needed.
 from typing import Any, Dict, List
 
 
+# Shared empty result; tool results are treated as read-only by callers.
+_NO_EVENTS: Dict[str, List[Dict[str, Any]]] = {"events": []}
+
+
 async def run(args: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
     """Execute the calendar tool.
 
@@ -24,4 +28,4 @@ async def run(args: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
         ``{"events": [{"title": "Meeting", "start": "2025-01-01T10:00"}]}``
     """
     # In a real implementation, you'd integrate with a calendar service here.
-    return {"events": []}
\ No newline at end of file
+    return _NO_EVENTS
\ No newline at end of file
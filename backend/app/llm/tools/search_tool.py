@@ -11,6 +11,11 @@ from typing import Any, Dict, List
 from ...core.http_client import fetch_json
 
 
+# Shared result for queries that cannot produce hits. Callers treat tool
+# results as read-only, so one instance is reused instead of a fresh dict.
+_EMPTY: Dict[str, List[Dict[str, Any]]] = {"results": []}
+
+
 async def run(args: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
     """Execute the search tool.
 
@@ -20,9 +25,9 @@ async def run(args: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
     Returns:
         Dict[str, List[Dict[str, Any]]]: A dictionary containing search results.
     """
-    query = args.get("query", "")
+    query = (args.get("query") or "").strip()
     if not query:
-        return {"results": []}
+        return _EMPTY
 
     # Example: call an external search API. This is commented out because it
     # requires an actual search endpoint. Uncomment and replace with a real
@@ -34,4 +39,4 @@ async def run(args: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
     # return {"results": results.get("items", [])}
 
     # For now, return an empty list.
-    return {"results": []}
\ No newline at end of file
+    return _EMPTY
\ No newline at end of file
@@ -6,10 +6,22 @@ and includes the API routers for different parts of the system. A simple health
 check endpoint is also provided.
 """
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .core.config import settings
+from .core.http_client import close_http_client
+from .db.session import warm_pool
+from .llm.agent_registry import warm_prompts
+from .services import rag_service
+from .services.chat_service import warm_agent_tools
+from .services.log_stream import close_listener
+from .services.research_service import warm_token_encoding
 
 # Import API routers from the versioned API package. Each router encapsulates
 # routes for a distinct area of the API: chat interactions, streaming, agent
@@ -24,6 +36,31 @@ from .api.v1 import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm process-wide caches on startup and close shared clients on shutdown."""
+    warm_prompts()
+    warm_agent_tools()
+    await warm_token_encoding()
+    try:
+        await warm_pool()
+    except Exception:
+        logger.exception("Could not pre-open database connections; they will open on demand")
+    if rag_service.RAG_AVAILABLE:
+        # Build the embeddings client and open Chroma now rather than on the
+        # first chat turn. RAG is optional, so a failure only disables it.
+        try:
+            await asyncio.to_thread(rag_service.get_vector_store)
+        except Exception:
+            logger.exception("Could not preload the vector store; RAG will retry on first use")
+    yield
+    await close_http_client()
+    await close_listener()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -34,6 +71,7 @@ def create_app() -> FastAPI:
         title="AI Agent Backend",
         version="0.1.0",
         description="Backend service for an AI agent powered by FastAPI and OpenAI",
+        lifespan=lifespan,
     )
 
     # Configure CORS. This allows your frontend (running on a different origin)
@@ -8,7 +8,7 @@ extend this module to persist agents in a database.
 
 from typing import Iterable, Optional
 
-from ..llm.agent_registry import AGENTS
+from ..llm.agent_registry import AGENTS, register_agent
 from ..schemas.agent import AgentConfig
 
 
@@ -21,4 +21,4 @@ def get_agent(name: str) -> Optional[AgentConfig]:
 
 
 def save_agent(config: AgentConfig) -> None:
-    AGENTS[config.name] = config
\ No newline at end of file
+    register_agent(config)
\ No newline at end of file
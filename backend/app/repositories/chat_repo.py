@@ -19,7 +19,6 @@ async def create_chat_session(db: AsyncSession, user_id: int) -> ChatSession:
     session = ChatSession(user_id=user_id)
     db.add(session)
     await db.commit()
-    await db.refresh(session)
     return session
 
 
@@ -30,7 +29,6 @@ async def add_message(
     msg = Message(session_id=session_id, user_id=user_id, role=role, content=content)
     db.add(msg)
     await db.commit()
-    await db.refresh(msg)
     return msg
 
 
@@ -29,5 +29,4 @@ async def create_user(db: AsyncSession, email: str, hashed_password: str) -> Use
     user = User(email=email, hashed_password=hashed_password)
     db.add(user)
     await db.commit()
-    await db.refresh(user)
     return user
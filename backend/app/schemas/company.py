@@ -26,7 +26,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DiscoverRequest(BaseModel):
@@ -51,6 +51,8 @@ class DiscoveredCompany(BaseModel):
     website: Optional[str] = Field(None, description="Primary website URL if known.")
     reason: Optional[str] = Field(None, description="Explanation of why this company matches the keywords.")
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
 
 class DiscoverResponse(BaseModel):
     """Response payload for discovery requests."""
@@ -79,8 +81,8 @@ class CompanyBase(BaseModel):
 class CompanyProfileRequest(BaseModel):
     """Request payload for generating or refreshing a company profile."""
 
-    name: str = Field(..., description="Company or product name.")
-    website: Optional[str] = Field(None, description="Website URL to use as context.")
+    name: str = Field(..., max_length=256, description="Company or product name.")
+    website: Optional[str] = Field(None, max_length=2048, description="Website URL to use as context.")
     force_refresh: bool = Field(False, description="Force regeneration even if a profile exists.")
 
 
@@ -14,15 +14,19 @@ weight representation used in lists and search results.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ResearchStartRequest(BaseModel):
     """Request payload to initiate a research job for a market segment."""
 
-    segment: str = Field(..., description="Market segment description, e.g. 'university LMS platforms in Europe'.")
+    segment: str = Field(
+        ...,
+        max_length=512,
+        description="Market segment description, e.g. 'university LMS platforms in Europe'.",
+    )
     max_companies: int = Field(10, description="Maximum number of companies to discover and profile.")
 
 
@@ -47,9 +51,8 @@ class ResearchJobResponse(BaseModel):
     finished_at: Optional[datetime] = None
     companies: List[ResearchJobCompanyStatus] = []
     
-    class Config:
-        # Allow population by field name to support both 'id' and 'job_id'
-        populate_by_name = True
+    # Allow population by field name to support both 'id' and 'job_id'
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class CompanySummary(BaseModel):
@@ -114,9 +117,7 @@ class CompanyComparison(BaseModel):
     company_id: int = Field(..., alias="companyId")
     points: List[str] = []
     
-    class Config:
-        populate_by_name = True
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class CompanyCompareResponse(BaseModel):
@@ -133,11 +134,13 @@ class StatsBucket(BaseModel):
     label: str
     count: int
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
 
 class StatsOverviewResponse(BaseModel):
     """Aggregated statistics over the company dataset."""
 
-    by_category: List[StatsBucket] = []
-    by_region: List[StatsBucket] = []
-    pricing_models: List[StatsBucket] = []
+    by_category: Tuple[StatsBucket, ...] = ()
+    by_region: Tuple[StatsBucket, ...] = ()
+    pricing_models: Tuple[StatsBucket, ...] = ()
     ai_features: Dict[str, int] = {}
\ No newline at end of file
@@ -1,6 +1,11 @@
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Read-only config for models the API only builds from ORM rows and returns;
+# frozen instances are safe to share through the session response cache.
+_READ_ONLY = ConfigDict(from_attributes=True, extra="forbid", frozen=True)
 
 
 class SessionLog(BaseModel):
@@ -10,8 +15,7 @@ class SessionLog(BaseModel):
   message: str
   meta: Optional[dict] = None
 
-  class Config:
-    orm_mode = True
+  model_config = _READ_ONLY
 
 
 class CompanyCard(BaseModel):
@@ -29,8 +33,7 @@ class CompanyCard(BaseModel):
   primary_tags: Optional[List[str]] = None
   summary: Optional[str] = None
 
-  class Config:
-    orm_mode = True
+  model_config = _READ_ONLY
 
 
 class ChartsPayload(BaseModel):
@@ -39,6 +42,10 @@ class ChartsPayload(BaseModel):
   performance_matrix: Optional[list] = None
   market_evolution: Optional[list] = None
 
+  # Built from the stored charts JSON, so unknown keys are ignored rather
+  # than rejected.
+  model_config = ConfigDict(frozen=True)
+
 
 class SessionResponse(BaseModel):
   id: str
@@ -62,9 +69,10 @@ class SessionListItem(BaseModel):
 
 
 class StartSessionRequest(BaseModel):
-  segment: str = Field(..., description="User-provided label / query")
+  segment: str = Field(..., max_length=512, description="User-provided label / query")
   max_companies: int = Field(3, ge=1, le=15)
-  region: Optional[str] = None
+  region: Optional[str] = Field(None, max_length=128)
+  force_refresh: bool = Field(False, description="Research again even if the segment was researched recently")
 
 
 class ScoringCriterion(BaseModel):
@@ -72,6 +80,9 @@ class ScoringCriterion(BaseModel):
   label: str
   weight: float
 
+  # Also a request body (PUT scoring), so extra client fields stay allowed.
+  model_config = ConfigDict(frozen=True)
+
 
 class ScoringConfig(BaseModel):
   criteria: List[ScoringCriterion]
@@ -81,6 +92,8 @@ class TrendBar(BaseModel):
   label: str
   impact: int
 
+  model_config = _READ_ONLY
+
 
 class TrendResponse(BaseModel):
   overview: str
@@ -92,8 +105,7 @@ class CompanySourceItem(BaseModel):
   label: Optional[str] = None
   source_type: Optional[str] = None
 
-  class Config:
-    orm_mode = True
+  model_config = _READ_ONLY
 
 
 class CompanyProfileResponse(BaseModel):
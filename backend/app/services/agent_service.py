@@ -9,7 +9,7 @@ would be a straightforward extension.
 
 from typing import Dict, Iterable, Optional
 
-from ..llm.agent_registry import AGENTS
+from ..llm.agent_registry import AGENTS, register_agent, serialized_agents
 from ..schemas.agent import AgentConfig
 
 
@@ -18,6 +18,11 @@ def list_agents() -> Iterable[AgentConfig]:
     return AGENTS.values()
 
 
+def list_agents_json() -> bytes:
+    """Return the serialized agent list used by the list endpoint."""
+    return serialized_agents()
+
+
 def get_agent(name: str) -> Optional[AgentConfig]:
     """Fetch a single agent configuration by name."""
     return AGENTS.get(name)
@@ -33,5 +38,4 @@ def update_agent(name: str, config: AgentConfig) -> AgentConfig:
     Returns:
         AgentConfig: The updated agent configuration.
     """
-    AGENTS[name] = config
-    return config
\ No newline at end of file
+    return register_agent(config)
\ No newline at end of file
@@ -6,17 +6,26 @@ are hard-coded. You can replace this logic with database queries or
 aggregations from a metrics backend such as Prometheus.
 """
 
+from types import MappingProxyType
+from typing import Mapping
 
-async def get_usage_stats() -> dict:
+# The stub metrics never change, so one read-only mapping is shared by all
+# callers instead of building a new dict per request.
+_STATS: Mapping[str, int] = MappingProxyType(
+    {
+        "messages_processed": 0,
+        "active_users": 0,
+        "agents_configured": 3,
+    }
+)
+
+
+async def get_usage_stats() -> Mapping[str, int]:
     """Return usage statistics for the backend.
 
     Returns:
-        dict: A dictionary of usage metrics.
+        Mapping[str, int]: A read-only mapping of usage metrics.
     """
     # In a real implementation, gather metrics from the database or monitoring
     # infrastructure here.
-    return {
-        "messages_processed": 0,
-        "active_users": 0,
-        "agents_configured": 3,
-    }
\ No newline at end of file
+    return _STATS
\ No newline at end of file
@@ -7,13 +7,62 @@ delegating to the OpenAI client for generating replies. It also exposes
 a streaming variant for incremental responses.
 """
 
-from typing import AsyncGenerator, List
+import asyncio
+import contextlib
+from operator import itemgetter
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
+from pydantic import TypeAdapter
+
+from ..schemas.agent import AgentConfig
 from ..schemas.common import Message
 from ..llm.agent_registry import get_default_agent
 from ..llm.planner import plan
-from ..llm.tools import calendar_tool, faq_tool, search_tool
-from ..core.openai_client import generate, generate_stream
+from ..services.tool_service import get_tool
+from ..core.openai_client import build_chat_body, generate_raw, generate_stream
+
+try:
+    from .rag_service import RAG_AVAILABLE, retrieve_context
+except Exception:  # pragma: no cover - RAG is optional
+    RAG_AVAILABLE = False
+    retrieve_context = None  # type: ignore[assignment]
+
+
+# Streamed tokens are buffered and sent once this many characters have
+# accumulated or this many seconds have passed since the last flush.
+STREAM_FLUSH_CHARS = 256
+STREAM_FLUSH_INTERVAL = 0.05
+
+# Dumps a whole message list in one pydantic-core call.
+_MESSAGES = TypeAdapter(List[Message])
+
+ToolDefs = Optional[Tuple[Dict[str, Any], ...]]
+
+# (agent, tool definitions) for the current default agent.
+_agent_cache: Optional[Tuple[AgentConfig, ToolDefs]] = None
+
+
+def _agent_and_tools() -> Tuple[AgentConfig, ToolDefs]:
+    """Return the default agent and its tool definitions.
+
+    Map tool names into the format expected by the Responses API. Each tool
+    definition should at minimum include its name and type. The result is
+    rebuilt only when the registry hands out a different default agent
+    (``register_agent`` replaces the object), so no explicit invalidation is
+    needed. Callers must not mutate the returned dicts.
+    """
+    global _agent_cache
+    agent = get_default_agent()
+    cached = _agent_cache
+    if cached is None or cached[0] is not agent:
+        tool_defs = tuple({"type": "function", "name": name} for name in agent.tools or ()) or None
+        cached = _agent_cache = (agent, tool_defs)
+    return cached
+
+
+def warm_agent_tools() -> None:
+    """Build the default agent's tool definitions before the first request."""
+    _agent_and_tools()
 
 
 async def handle_chat(messages: List[Message]) -> str:
@@ -25,21 +74,19 @@ async def handle_chat(messages: List[Message]) -> str:
     Returns:
         str: The generated reply from the AI agent.
     """
-    agent = get_default_agent()
+    agent, tool_defs = _agent_and_tools()
     # Convert pydantic models to dictionaries expected by OpenAI API
-    formatted = [m.dict(exclude_unset=True) for m in messages]
+    formatted = _MESSAGES.dump_python(messages, exclude_unset=True)
 
     # If RAG context is enabled and the last message comes from the user,
     # retrieve relevant context and inject it as a system message. This helps
     # ground the model’s responses in factual data. See DataCamp’s RAG
     # tutorial for more details on the retrieval workflow【438448550825859†L103-L139】.
-    if messages and messages[-1].role == "user":
+    if RAG_AVAILABLE and messages and messages[-1].role == "user":
         try:
-            from ..services.rag_service import retrieve_context  # type: ignore
-
             context_chunks = await retrieve_context(messages[-1].content, k=3)
             if context_chunks:
-                context_text = "\n\n".join([chunk for chunk, _ in context_chunks])
+                context_text = "\n\n".join(map(itemgetter(0), context_chunks))
                 # Prepend context as a system message
                 formatted.insert(
                     0,
@@ -54,31 +101,19 @@ async def handle_chat(messages: List[Message]) -> str:
 
     # Plan which tool to use based on the conversation. If the planner
     # decides a tool call is required, execute it and append the result.
-    tool_call = await plan(messages)
+    tool_call = await plan(messages, allowed=agent.tools or ())
     if tool_call:
         name = tool_call.get("name")
         args = tool_call.get("arguments", {})
-        if name == "calendar":
-            result = await calendar_tool.run(args)
-        elif name == "faq":
-            result = await faq_tool.run(args)
-        elif name == "search":
-            result = await search_tool.run(args)
-        else:
-            result = {"error": f"Unknown tool {name}"}
+        runner = get_tool(name)
+        result = await runner(args) if runner else {"error": f"Unknown tool {name}"}
         # Insert tool call result into the conversation. The format used here
         # depends on your prompt conventions.
         formatted.append({"role": "tool", "name": name, "content": str(result)})
 
-    # Ask the language model for a reply.
-    # Map tool names into the format expected by the Responses API. Each tool
-    # definition should at minimum include its name and type. Since our
-    # ``openai_client.generate`` helper accepts a list of arbitrary dicts,
-    # converting the list of strings here keeps the agent config flexible.
-    tool_defs = None
-    if agent.tools:
-        tool_defs = [{"type": "function", "name": name} for name in agent.tools]
-    reply = await generate(formatted, model=agent.model, tools=tool_defs)
+    # Ask the language model for a reply. The request body is encoded once
+    # with orjson and posted as-is.
+    reply = await generate_raw(build_chat_body(formatted, model=agent.model, tools=tool_defs))
     return reply
 
 
@@ -101,11 +136,63 @@ async def stream_chat(messages: List[Message]) -> AsyncGenerator[str, None]:
     model. This preserves any streaming support provided by the API and
     reduces latency for the end user.
     """
-    agent = get_default_agent()
-    formatted = [m.dict(exclude_unset=True) for m in messages]
-    # Convert allowed tools to tool definitions
-    tool_defs = None
-    if agent.tools:
-        tool_defs = [{"type": "function", "name": name} for name in agent.tools]
-    async for chunk in generate_stream(formatted, model=agent.model, tools=tool_defs):
-        yield chunk
\ No newline at end of file
+    agent, tool_defs = _agent_and_tools()
+    formatted = _MESSAGES.dump_python(messages, exclude_unset=True)
+    stream = generate_stream(formatted, model=agent.model, tools=tool_defs)
+    async for chunk in _coalesce(stream):
+        yield chunk
+
+
+async def _coalesce(
+    chunks: AsyncGenerator[str, None],
+    max_chars: int = STREAM_FLUSH_CHARS,
+    interval: float = STREAM_FLUSH_INTERVAL,
+) -> AsyncGenerator[str, None]:
+    """Merge small stream chunks into fewer, larger ones.
+
+    Buffered text is flushed once it reaches ``max_chars`` or has waited
+    ``interval`` seconds, so the first token still reaches the client
+    promptly.
+    """
+    loop = asyncio.get_running_loop()
+    buffer: List[str] = []
+    size = 0
+    flush_at = 0.0
+    pending: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(chunks.__anext__())
+            # asyncio.wait leaves the pending read running on timeout,
+            # unlike wait_for, which would cancel the upstream generator.
+            timeout = max(flush_at - loop.time(), 0) if buffer else None
+            done, _ = await asyncio.wait((pending,), timeout=timeout)
+            if not done:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+                continue
+            try:
+                chunk = pending.result()
+            except StopAsyncIteration:
+                break
+            finally:
+                pending = None
+            if not buffer:
+                flush_at = loop.time() + interval
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= max_chars or loop.time() >= flush_at:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            # The generator cannot be closed while that read is still
+            # running, so let the cancellation land first.
+            with contextlib.suppress(BaseException):
+                await pending
+        await chunks.aclose()
@@ -2,27 +2,57 @@
 History service stub.
 
 This service manages chat histories. In this simplified implementation,
-histories are stored in an in-memory dictionary keyed by session ID. For
-a production deployment you might back this with a database or Redis to
-support persistence and scaling.
+histories are stored in an in-memory dictionary keyed by session ID, and
+only the most recent ``settings.HISTORY_MAX`` messages of each session are
+kept. Messages are stored in the wire format passed to the LLM client
+(``Message.model_dump(exclude_unset=True)``), converted once when they
+are added rather than on every read. For a production deployment you might
+back this with a database or Redis to support persistence and scaling.
 """
 
-from typing import List, Dict
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
 
+from ..core.config import settings
 from ..schemas.common import Message
 
 
+WireMessage = Dict[str, Any]
+
+
 class HistoryService:
     """Manage conversation histories for chat sessions."""
 
-    def __init__(self) -> None:
-        # Map session ID to list of messages
-        self._store: Dict[str, List[Message]] = {}
+    __slots__ = ("_store", "_maxlen", "_create_lock")
+
+    def __init__(self, maxlen: int | None = None) -> None:
+        # Map session ID to its most recent messages; older ones fall off.
+        self._store: Dict[str, Deque[WireMessage]] = {}
+        self._maxlen = maxlen or settings.HISTORY_MAX
+        # Only creating a session's deque needs coordination: ``deque.append``
+        # and the tuple snapshot in ``get_history`` are thread-safe on their
+        # own, so existing sessions never contend on this lock.
+        self._create_lock = threading.Lock()
+
+    def _history_for(self, session_id: str) -> Deque[WireMessage]:
+        history = self._store.get(session_id)
+        if history is None:
+            with self._create_lock:
+                history = self._store.get(session_id)
+                if history is None:
+                    history = self._store[session_id] = deque(maxlen=self._maxlen)
+        return history
 
     def add_message(self, session_id: str, message: Message) -> None:
         """Append a message to the history for a given session."""
-        self._store.setdefault(session_id, []).append(message)
+        self._history_for(session_id).append(message.model_dump(exclude_unset=True))
+
+    def get_history(self, session_id: str) -> Tuple[WireMessage, ...]:
+        """Retrieve the conversation history for a session as a snapshot.
 
-    def get_history(self, session_id: str) -> List[Message]:
-        """Retrieve the conversation history for a session."""
-        return list(self._store.get(session_id, []))
\ No newline at end of file
+        Returns a tuple of wire-format message dicts, not ``Message``
+        objects. The dicts are ready to send to the LLM client and are
+        shared with the store, so callers must copy before modifying them.
+        """
+        return tuple(self._store.get(session_id, ()))
\ No newline at end of file
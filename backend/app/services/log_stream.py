@@ -0,0 +1,172 @@
+"""
+Live tail of research session logs.
+
+``follow_logs`` yields a session's log entries as they are written, for the
+server-sent events endpoint behind the terminal console. On PostgreSQL
+(asyncpg) a trigger on ``research_session_logs`` sends ``NOTIFY
+session_<id>`` once per transaction that adds log rows, so the stream only
+queries the table after a notification. All streams in a process share
+one LISTEN connection. Other backends (SQLite in development and tests)
+check for new rows every ``POLL_INTERVAL`` seconds.
+"""
+
+import asyncio
+import contextlib
+import logging
+from bisect import insort
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from ..db.models import ResearchSession
+from ..db.session import async_session, engine
+from ..schemas.session import SessionLog
+from .session_service import get_logs
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 1.0
+# Upper bound on waiting for a notification before re-checking the session,
+# so a stream still ends if a NOTIFY is missed (e.g. after a reconnect).
+NOTIFY_TIMEOUT = 15.0
+# Ids are assigned at insert but become visible at commit, so a concurrent
+# transaction can commit a lower id after a higher one was streamed. Each
+# check therefore re-reads from the oldest of the last LOG_OVERLAP ids
+# streamed (or from ``after_id`` before any were) and skips the ones
+# already sent.
+LOG_OVERLAP = 50
+
+_FINISHED_STATUSES = frozenset({"COMPLETE", "FAILED"})
+
+# The shared LISTEN connection and, per channel, the wake events of the
+# streams following it. The lock serialises LISTEN/UNLISTEN on it.
+_listen_conn: Optional[AsyncConnection] = None
+_listen_driver: Any = None
+_listen_lock = asyncio.Lock()
+_subscribers: Dict[str, Set[asyncio.Event]] = {}
+
+
+def channel_name(session_id: str) -> str:
+    """Return the NOTIFY channel used for a session's log inserts."""
+    return f"session_{session_id}"
+
+
+def _uses_listen() -> bool:
+    return engine.dialect.driver == "asyncpg"
+
+
+def _dispatch(_conn: Any, _pid: int, channel: str, _payload: str) -> None:
+    for wake in _subscribers.get(channel, ()):
+        wake.set()
+
+
+async def _listener() -> Any:
+    """Return the shared asyncpg connection, reopening it if it was lost.
+
+    Must be called with ``_listen_lock`` held. One pooled connection is
+    checked out for the whole process, however many streams are open.
+    """
+    global _listen_conn, _listen_driver
+    if _listen_driver is not None and not _listen_driver.is_closed():
+        return _listen_driver
+    if _listen_conn is not None:
+        with contextlib.suppress(Exception):
+            await _listen_conn.invalidate()
+    _listen_conn = await engine.connect()
+    raw = await _listen_conn.get_raw_connection()
+    _listen_driver = raw.driver_connection
+    # Streams that were already open missed notifications while the old
+    # connection was down; waking them makes each re-check the table.
+    for channel, waiters in _subscribers.items():
+        await _listen_driver.add_listener(channel, _dispatch)
+        for wake in waiters:
+            wake.set()
+    return _listen_driver
+
+
+async def close_listener() -> None:
+    """Release the shared LISTEN connection (called on app shutdown)."""
+    global _listen_conn, _listen_driver
+    async with _listen_lock:
+        if _listen_conn is not None:
+            # Discard rather than return it: its LISTENs would outlive us.
+            await _listen_conn.invalidate()
+        _listen_conn = _listen_driver = None
+        _subscribers.clear()
+
+
+@asynccontextmanager
+async def _wakeups(session_id: str) -> AsyncIterator[asyncio.Event]:
+    """Yield an event that is set whenever new logs may have been written."""
+    wake = asyncio.Event()
+    if not _uses_listen():
+        yield wake
+        return
+
+    channel = channel_name(session_id)
+    async with _listen_lock:
+        driver_conn = await _listener()
+        if channel not in _subscribers:
+            await driver_conn.add_listener(channel, _dispatch)
+            _subscribers[channel] = set()
+        _subscribers[channel].add(wake)
+    try:
+        yield wake
+    finally:
+        async with _listen_lock:
+            waiters = _subscribers.get(channel, set())
+            waiters.discard(wake)
+            if not waiters and _subscribers.pop(channel, None) is not None:
+                # A lost connection already dropped the LISTEN.
+                if _listen_driver is not None and not _listen_driver.is_closed():
+                    try:
+                        await _listen_driver.remove_listener(channel, _dispatch)
+                    except Exception:
+                        logger.warning("Could not UNLISTEN %s", channel, exc_info=True)
+
+
+async def follow_logs(session_id: str, after_id: int = 0) -> AsyncIterator[SessionLog]:
+    """Yield log entries newer than ``after_id`` until the session finishes.
+
+    Raises:
+        ValueError: If the session does not exist.
+    """
+    timeout = NOTIFY_TIMEOUT if _uses_listen() else POLL_INTERVAL
+    # The final log line is written just after the status flips to
+    # COMPLETE/FAILED, so stop only after one more empty check.
+    finished_and_idle = False
+    # Newest LOG_OVERLAP ids streamed, ascending.
+    recent: List[int] = []
+    async with _wakeups(session_id) as wake:
+        while True:
+            wake.clear()
+            # At most LOG_OVERLAP already-sent rows are read again.
+            floor = recent[0] if recent else after_id
+            async with async_session() as db:
+                logs = await get_logs(session_id, db, after_id=floor)
+                # Already loaded by get_logs, so this is an identity-map hit.
+                session = await db.get(ResearchSession, session_id)
+                finished = session is not None and session.status in _FINISHED_STATUSES
+
+            logs = [log for log in logs if log.id not in recent]
+            for log in logs:
+                insort(recent, log.id)
+                yield log
+            del recent[:-LOG_OVERLAP]
+
+            if finished and not logs:
+                if finished_and_idle:
+                    return
+                finished_and_idle = True
+            else:
+                finished_and_idle = False
+
+            try:
+                await asyncio.wait_for(wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                if _uses_listen():
+                    # Quiet for a while: reopen the shared connection if it
+                    # was lost, so later notifications arrive again.
+                    async with _listen_lock:
+                        await _listener()
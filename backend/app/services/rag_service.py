@@ -34,7 +34,8 @@ before calling the language model.
 from __future__ import annotations
 
 import asyncio
-from typing import Iterable, List, Tuple
+import threading
+from typing import Iterable, List, Sequence, Tuple
 
 try:
     from langchain.docstore.document import Document  # type: ignore
@@ -49,11 +50,29 @@ except Exception as e:  # pragma: no cover
     Chroma = None  # type: ignore
 
 from ..core.config import settings
+from ..utils.ttl_cache import TTLCache
 
 
-# Create a global vector store. For production, consider initializing
-# this in a startup event and storing the instance on the app state.
+# True when the optional langchain dependencies could be imported.
+RAG_AVAILABLE = OpenAIEmbeddings is not None and Chroma is not None
+
+# Texts sent per embeddings API request, and chunks handed to the vector
+# store per worker thread during ingest. Shards are embedded concurrently
+# (bounded by INGEST_CONCURRENCY) so bulk ingest overlaps network round-trips.
+EMBEDDING_BATCH_SIZE = 1000
+INGEST_SHARD_SIZE = 2048
+INGEST_CONCURRENCY = 4
+
+# Recent retrieval results keyed by normalised (query, k). A hit skips both
+# the query embedding request and the vector search. Cleared on ingest so
+# new documents are visible immediately.
+_retrieval_cache: TTLCache[List[Tuple[str, float]]] = TTLCache(maxsize=1024, ttl=300)
+
+
+# Global vector store, created once. The app lifespan preloads it at
+# startup; the lock keeps concurrent first calls from building two clients.
 _vector_store: Chroma | None = None
+_vector_store_lock = threading.Lock()
 
 
 def get_vector_store() -> Chroma:
@@ -66,6 +85,13 @@ def get_vector_store() -> Chroma:
     global _vector_store
     if _vector_store is not None:
         return _vector_store
+    with _vector_store_lock:
+        if _vector_store is None:
+            _vector_store = _create_vector_store()
+    return _vector_store
+
+
+def _create_vector_store() -> Chroma:
     # Determine persistence directory. If VECTOR_DB_URL is provided, use it.
     persist_dir = None
     if settings.VECTOR_DB_URL:
@@ -74,21 +100,29 @@ def get_vector_store() -> Chroma:
         raise ImportError(
             "langchain is not installed. Please install langchain to use the RAG service."
         )
-    embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-    _vector_store = Chroma(
+    embeddings = OpenAIEmbeddings(
+        model="text-embedding-3-small",
+        chunk_size=EMBEDDING_BATCH_SIZE,
+        max_retries=3,
+        show_progress_bar=False,
+    )
+    return Chroma(
         collection_name=settings.VECTOR_COLLECTION,
         embedding_function=embeddings,
         persist_directory=persist_dir,
     )
-    return _vector_store
 
 
-async def ingest_documents(texts: Iterable[str], metadata: Iterable[dict] | None = None) -> None:
+async def ingest_documents(texts: Iterable[str], metadata: Sequence[dict] | None = None) -> int:
     """Ingest a collection of documents into the vector store.
 
     Args:
         texts (Iterable[str]): Raw text documents.
-        metadata (Iterable[dict] | None): Optional metadata for each document.
+        metadata (Sequence[dict] | None): Optional metadata for each document,
+            matched to ``texts`` by position.
+
+    Returns:
+        int: Number of chunks added to the vector store.
     """
     # Defer import checks until the function is called
     if OpenAIEmbeddings is None or Document is None or RecursiveCharacterTextSplitter is None:
@@ -97,19 +131,30 @@ async def ingest_documents(texts: Iterable[str], metadata: Iterable[dict] | None
         )
     vector_store = get_vector_store()
     splitter = RecursiveCharacterTextSplitter(chunk_size=512, chunk_overlap=64)
-    docs: List[Document] = []
-    for i, text in enumerate(texts):
-        chunks = splitter.split_text(text)
-        for chunk in chunks:
-            meta = {"source_index": i}
-            if metadata and len(metadata) > i:
-                meta.update(metadata[i])
-            docs.append(Document(page_content=chunk, metadata=meta))
-    # Embedding and adding to the vector store can be CPU‑bound; run in a thread
-    def _add_docs():
-        vector_store.add_documents(docs)  # type: ignore[arg-type]
-
-    await asyncio.to_thread(_add_docs)
+    texts = list(texts)
+    metadata = metadata or ()
+    metadatas = [
+        {"source_index": i, **(metadata[i] if i < len(metadata) else {})}
+        for i in range(len(texts))
+    ]
+    # One call splits every text and attaches its metadata to each chunk.
+    docs: List[Document] = splitter.create_documents(texts, metadatas=metadatas)
+    # Embedding and adding to the vector store block on network I/O; run
+    # each shard in a worker thread and keep a few shards in flight.
+    limit = asyncio.Semaphore(INGEST_CONCURRENCY)
+
+    async def _add_shard(shard: List[Document]) -> None:
+        async with limit:
+            await asyncio.to_thread(vector_store.add_documents, shard)
+
+    await asyncio.gather(
+        *(
+            _add_shard(docs[start:start + INGEST_SHARD_SIZE])
+            for start in range(0, len(docs), INGEST_SHARD_SIZE)
+        )
+    )
+    _retrieval_cache.clear()
+    return len(docs)
 
 
 async def retrieve_context(query: str, k: int = 4) -> List[Tuple[str, float]]:
@@ -127,9 +172,15 @@ async def retrieve_context(query: str, k: int = 4) -> List[Tuple[str, float]]:
         raise ImportError(
             "langchain is not installed. Please install langchain to use the RAG service."
         )
+    key = (query.strip().lower(), k)
+    cached = _retrieval_cache.get(key)
+    if cached is not None:
+        return cached
     vector_store = get_vector_store()
     # Search can be blocking; run in a thread
     def _search() -> List[Tuple[Document, float]]:
         return vector_store.similarity_search_with_score(query, k=k)
     results = await asyncio.to_thread(_search)
-    return [(doc.page_content, score) for doc, score in results]
\ No newline at end of file
+    chunks = [(doc.page_content, score) for doc, score in results]
+    _retrieval_cache.set(key, chunks)
+    return chunks
\ No newline at end of file
@@ -24,19 +24,28 @@ the API layer so that HTTP responses can be generated accordingly.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-
-import httpx
-from sqlalchemy import func, select
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.openai_client import generate
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - tiktoken is optional
+    tiktoken = None
+
+from ..core.http_client import fetch_page
+from ..core.openai_client import cached_generate
 from ..core.search import SearchError, search_web
 from ..core.config import settings
-from ..db.models import Company, ResearchJob, SourceDocument
+from ..db.models import Company, CompanyTag, ResearchJob, SourceDocument
+from ..db.session import async_session
 from ..schemas.research import (
     CompanyCompareResponse,
     CompanyComparison,
@@ -45,9 +54,71 @@ from ..schemas.research import (
     StatsBucket,
     StatsOverviewResponse,
 )
+from ..utils import json_codec
+from ..utils.html_text import html_to_text
+from ..utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Dashboards poll the stats overview; it is recomputed at most once per TTL
+# and dropped whenever this process writes company data.
+STATS_CACHE_TTL = 30.0
+_stats_cache: TTLCache[StatsOverviewResponse] = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL)
+
+
+# Parsed discovery results per (normalised segment, max_companies). Callers
+# must not mutate the returned dicts.
+_discovery_cache: TTLCache[Tuple[Dict[str, str], ...]] = TTLCache(maxsize=256, ttl=settings.LLM_CACHE_TTL)
+
+
+# Research jobs currently running in this process, keyed like the discovery
+# cache. An identical request arriving meanwhile waits for that job's result
+# instead of discovering and profiling the same companies again.
+_running_jobs: Dict[Tuple[str, int], asyncio.Future] = {}
+
+
+def _segment_key(segment: str, max_companies: int) -> Tuple[str, int]:
+    """Key segment-level work on whitespace- and case-normalised text."""
+    return " ".join(segment.split()).lower(), max_companies
+
+
+def invalidate_stats() -> None:
+    """Drop the cached stats overview after companies have been written."""
+    _stats_cache.clear()
+
+
+# System prompts are fixed strings (request-specific values go in the user
+# message) so every call shares an identical prefix that providers with
+# automatic prompt caching can reuse.
+_DISCOVERY_SYSTEM = (
+    "You are an assistant that helps with market research in the education and LMS sector. "
+    "Given a description of a market segment and a maximum count, propose up to that many relevant companies. "
+    "Return ONLY a JSON object with a top level key 'companies' whose value is a list of objects. "
+    "Each company object must contain: 'name' (string), and optionally 'website', 'category', 'region', 'size_bucket'. "
+    "Do not include any commentary, markdown formatting, or anything outside of the JSON."
+)
+
+_PROFILE_SYSTEM = (
+    "You are an expert market analyst for EdTech and LMS companies. "
+    "Using the provided context, produce a JSON object describing the company. "
+    "Required keys: name, website, segment, category, region, size_bucket, description, "
+    "background, products, target_segments, pricing_model, market_position, strengths, "
+    "risks, has_ai_features, compliance_tags. "
+    "For list fields (products, target_segments, pricing_model, strengths, risks, compliance_tags), "
+    "provide arrays of strings. "
+    "Always include all keys. If information is unavailable, use null or an empty array. "
+    "has_ai_features should be a boolean. "
+    "Do not wrap the JSON in markdown or code blocks."
+)
+
+_COMPARE_SYSTEM = (
+    "You are a market analyst. You will be given summaries of multiple companies. "
+    "Identify strengths that are common across all companies, list key differentiators for each company, "
+    "and suggest opportunity gaps in the market. Return a JSON object with keys: "
+    "common_strengths (list of strings), key_differences (list of objects with 'company_id' and 'points'), "
+    "and opportunity_gaps (list of strings). Do not wrap the JSON in markdown."
+)
+
 
 async def start_research(
     segment: str,
@@ -58,8 +129,9 @@ async def start_research(
 
     This function performs the "sense" and initial "decide" steps: it
     invokes the language model to propose a list of companies relevant to
-    ``segment``, upserts them into the database, and sequentially profiles
-    each one. A ResearchJob record tracks progress and status.
+    ``segment``, upserts them into the database, and profiles them
+    concurrently (up to ``settings.PROFILE_CONCURRENCY`` at a time). A
+    ResearchJob record tracks progress and status.
 
     Args:
         segment: Market segment description provided by the user.
@@ -68,12 +140,45 @@ async def start_research(
 
     Returns:
         A ``ResearchJobResponse`` containing job metadata and company status.
+        Concurrent calls for the same segment share the first call's job.
     """
+    key = _segment_key(segment, max_companies)
+    while (running := _running_jobs.get(key)) is not None:
+        try:
+            return await asyncio.shield(running)
+        except asyncio.CancelledError:
+            # Only the running job was cancelled: take over below.
+            if not running.cancelled():
+                raise
+
+    running = asyncio.get_running_loop().create_future()
+    _running_jobs[key] = running
+    try:
+        response = await _run_research(segment, max_companies, db)
+    except asyncio.CancelledError:
+        running.cancel()
+        raise
+    except Exception as exc:
+        running.set_exception(exc)
+        running.exception()  # mark retrieved when nobody else is waiting
+        raise
+    else:
+        running.set_result(response)
+        return response
+    finally:
+        del _running_jobs[key]
+
+
+async def _run_research(
+    segment: str,
+    max_companies: int,
+    db: AsyncSession,
+) -> ResearchJobResponse:
+    """Run one research job; see ``start_research``."""
     # Create job in DB
-    job = ResearchJob(segment=segment, status="running", created_at=datetime.utcnow())
+    job = ResearchJob(segment=segment, status="running")
     db.add(job)
     await db.commit()
-    await db.refresh(job)
     logger.info("Started research job %s for segment '%s'", job.id, segment)
 
     company_statuses: List[ResearchJobCompanyStatus] = []
@@ -86,7 +191,7 @@ async def start_research(
             logger.warning("No companies discovered for segment: %s", segment)
             job.status = "done"
             job.error_message = "No companies found for this segment"
-            job.finished_at = datetime.utcnow()
+            job.finished_at = datetime.now(timezone.utc)
             await db.commit()
             return ResearchJobResponse(
                 job_id=job.id,
@@ -98,84 +203,24 @@ async def start_research(
                 companies=[],
             )
 
-        # Step 2: Upsert each discovered company and profile it
-        for item in discovered:
-            name = item.get("name")
-            if not name:
-                continue
-                
-            website = item.get("website")
-            category = item.get("category")
-            region = item.get("region")
-            size_bucket = item.get("size_bucket")
-            
-            # Upsert into DB
-            result = await db.execute(select(Company).where(Company.name == name))
-            company: Optional[Company] = result.scalars().first()
-            
-            if company:
-                # Update existing company
-                logger.info("Updating existing company: %s", name)
-                if segment and not company.segment:
-                    company.segment = segment
-                if category and not company.category:
-                    company.category = category
-                if region and not company.region:
-                    company.region = region
-                if size_bucket and not company.size_bucket:
-                    company.size_bucket = size_bucket
-                if website and not company.website:
-                    company.website = website
-            else:
-                # Create new company
-                logger.info("Creating new company: %s", name)
-                company = Company(
-                    name=name,
-                    website=website,
-                    segment=segment,
-                    category=category,
-                    region=region,
-                    size_bucket=size_bucket,
-                    first_discovered=datetime.utcnow(),
-                )
-                db.add(company)
-            
-            # Commit after each company creation/update
-            await db.commit()
-            await db.refresh(company)
-            
-            # Initialize status
-            status = ResearchJobCompanyStatus(
-                id=company.id,
-                name=company.name,
-                status="pending",
-                last_updated=company.last_updated,
-                has_profile=False,
-            )
-            
-            # Profile the company
-            try:
-                logger.info("Profiling company: %s", company.name)
-                await profile_company(company, db)
-                await db.refresh(company)  # Refresh to get updated fields
-                status.status = "profiled"
-                status.last_updated = company.last_updated
-                status.has_profile = bool(company.description)
-                logger.info("Successfully profiled: %s", company.name)
-            except Exception as exc:
-                logger.exception("Profiling failed for %s: %s", company.name, exc)
-                status.status = "failed"
-                status.has_profile = False
-                # Continue to next company even if this one fails
-            
-            company_statuses.append(status)
-            
-            # Commit after profiling each company
-            await db.commit()
+        # Step 2: Upsert every discovered company in one statement, then
+        # profile them concurrently. Each profile gets its own database
+        # session; the semaphore caps the number of search/LLM calls in flight.
+        companies = await _upsert_companies(_unique_by_name(discovered), segment, db)
+        await db.commit()
+        invalidate_stats()
+
+        sem = asyncio.Semaphore(settings.PROFILE_CONCURRENCY)
+
+        async def _guarded(company: Company) -> ResearchJobCompanyStatus:
+            async with sem:
+                return await _profile_one(company)
+
+        company_statuses = list(await asyncio.gather(*(_guarded(c) for c in companies)))
 
         # Mark job as done
         job.status = "done"
-        job.finished_at = datetime.utcnow()
+        job.finished_at = datetime.now(timezone.utc)
         await db.commit()
         logger.info("Completed research job %s with %d companies", job.id, len(company_statuses))
 
@@ -183,7 +228,7 @@ async def start_research(
         logger.exception("Research job %s failed: %s", job.id, exc)
         job.status = "failed"
         job.error_message = str(exc)[:512]
-        job.finished_at = datetime.utcnow()
+        job.finished_at = datetime.now(timezone.utc)
         await db.commit()
         
         return ResearchJobResponse(
@@ -207,6 +252,92 @@ async def start_research(
     )
 
 
+def _unique_by_name(discovered: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Drop unnamed entries and repeated names, keeping the first occurrence."""
+    seen = set()
+    unique = []
+    for item in discovered:
+        name = item.get("name")
+        if name and name not in seen:
+            seen.add(name)
+            unique.append(item)
+    return unique
+
+
+# Discovery fields that only fill in gaps on an existing company.
+_UPSERT_FIELDS = ("website", "segment", "category", "region", "size_bucket")
+
+
+async def _upsert_companies(
+    items: List[Dict[str, str]],
+    segment: str,
+    db: AsyncSession,
+) -> List[Company]:
+    """Insert new companies and fill missing fields on existing ones.
+
+    Uses a single ``INSERT ... ON CONFLICT (name) DO UPDATE ... RETURNING``
+    statement (PostgreSQL and SQLite both support it) instead of a SELECT
+    and INSERT/UPDATE per company. Existing values are never overwritten.
+    """
+    if not items:
+        return []
+    rows = [
+        {
+            "name": item["name"],
+            "website": item.get("website"),
+            "segment": segment,
+            "category": item.get("category"),
+            "region": item.get("region"),
+            "size_bucket": item.get("size_bucket"),
+        }
+        for item in items
+    ]
+    dialect_insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    stmt = dialect_insert(Company).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Company.name],
+        set_={
+            field: func.coalesce(getattr(Company, field), getattr(stmt.excluded, field))
+            for field in _UPSERT_FIELDS
+        },
+    ).returning(Company)
+    result = await db.scalars(stmt, execution_options={"populate_existing": True})
+    companies = list(result)
+    logger.info("Upserted %d companies for segment '%s'", len(companies), segment)
+    return companies
+
+
+async def _profile_one(company: Company) -> ResearchJobCompanyStatus:
+    """Profile one upserted company in a fresh session.
+
+    Profiling failures are reported in the returned status rather than
+    raised, so one bad company does not fail the whole job.
+    """
+    status = ResearchJobCompanyStatus(
+        id=company.id,
+        name=company.name,
+        status="pending",
+        last_updated=company.last_updated,
+        has_profile=False,
+    )
+    async with async_session() as db:
+        company = await db.merge(company, load=False)
+        try:
+            logger.info("Profiling company: %s", company.name)
+            # profile_company sets every field it changes on this instance.
+            await profile_company(company, db)
+            status.status = "profiled"
+            status.last_updated = company.last_updated
+            status.has_profile = bool(company.description)
+            logger.info("Successfully profiled: %s", company.name)
+        except Exception as exc:
+            logger.exception("Profiling failed for %s: %s", company.name, exc)
+            status.status = "failed"
+            status.has_profile = False
+            await db.rollback()
+    return status
+
+
 async def _discover_companies_via_llm(segment: str, max_companies: int) -> List[Dict[str, str]]:
     """Ask the language model to propose a list of companies for a segment.
 
@@ -222,37 +353,27 @@ async def _discover_companies_via_llm(segment: str, max_companies: int) -> List[
     Returns:
         A list of dictionaries, one per proposed company.
     """
-    system_prompt = (
-        "You are an assistant that helps with market research in the education and LMS sector. "
-        "Given a description of a market segment, propose up to {max_n} relevant companies. "
-        "Return ONLY a JSON object with a top level key 'companies' whose value is a list of objects. "
-        "Each company object must contain: 'name' (string), and optionally 'website', 'category', 'region', 'size_bucket'. "
-        "Do not include any commentary, markdown formatting, or anything outside of the JSON."
-    ).format(max_n=max_companies)
-    
+    # Segments differing only in case or spacing share a cache entry.
+    cache_key = _segment_key(segment, max_companies)
+    cached = _discovery_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Using cached discovery for segment: %s", segment)
+        return list(cached)
+
     user_prompt = f"Segment: {segment}. Provide up to {max_companies} companies."
     
     messages = [
-        {"role": "system", "content": system_prompt},
+        {"role": "system", "content": _DISCOVERY_SYSTEM},
         {"role": "user", "content": user_prompt},
     ]
     
     try:
-        raw = await generate(messages, model=settings.LLM_MODEL, max_tokens=2000)
-        
-        # Clean up the response - remove markdown code blocks if present
-        raw = raw.strip()
-        if raw.startswith("```json"):
-            raw = raw[7:]
-        if raw.startswith("```"):
-            raw = raw[3:]
-        if raw.endswith("```"):
-            raw = raw[:-3]
-        raw = raw.strip()
+        raw = await cached_generate(messages, model=settings.LLM_MODEL, max_tokens=2000)
         
         logger.info("LLM discovery response: %s", raw[:200])
         
-        data = json.loads(raw)
+        # Tolerates markdown fences and prose around the JSON.
+        data = json_codec.loads_embedded(raw)
         companies = [
             {
                 "name": c.get("name"),
@@ -266,9 +387,11 @@ async def _discover_companies_via_llm(segment: str, max_companies: int) -> List[
         ]
         
         logger.info("Discovered %d companies", len(companies))
+        if companies:
+            _discovery_cache.set(cache_key, tuple(companies))
         return companies
         
-    except json.JSONDecodeError as exc:
+    except json_codec.JSONDecodeError as exc:
         logger.error("Failed to parse discovery JSON: %s. Raw response: %s", exc, raw[:500])
         return []
     except Exception as exc:
@@ -276,7 +399,149 @@ async def _discover_companies_via_llm(segment: str, max_companies: int) -> List[
         return []
 
 
-async def profile_company(company: Company, db: AsyncSession) -> None:
+# Budget for fetched page text in the profile prompt: tokens when tiktoken
+# is installed, otherwise characters (roughly four per token; reduced from
+# 8000).
+PROFILE_CONTEXT_TOKENS = 1000
+PROFILE_CONTEXT_CHARS = 4000
+
+
+@lru_cache(maxsize=1)
+def _token_encoding() -> Optional[Any]:
+    """Return a tiktoken encoding, or None if tiktoken is unavailable.
+
+    The configured models are not OpenAI models, so ``cl100k_base`` is used
+    as a close approximation of their tokenizers.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as exc:  # e.g. the BPE file cannot be downloaded
+        logger.warning("tiktoken encoding unavailable, budgeting context by characters: %s", exc)
+        return None
+
+
+async def warm_token_encoding() -> None:
+    """Load the tiktoken encoding in a worker thread.
+
+    The first ``get_encoding`` call downloads and builds the BPE file, which
+    must not block the event loop. Called on app startup, and before the
+    first ``_fit_context`` in processes that skip it (e.g. workers).
+    """
+    if _token_encoding.cache_info().currsize == 0:
+        await asyncio.to_thread(_token_encoding)
+
+
+def _fit_context(texts: List[str]) -> List[str]:
+    """Truncate ``texts`` so that, joined with blank lines, they fit the budget.
+
+    Texts past the budget become empty strings, keeping positions aligned.
+    """
+    encoding = _token_encoding()
+    fitted = []
+    if encoding is None:
+        remaining = PROFILE_CONTEXT_CHARS
+        for page in texts:
+            kept = page[: max(remaining, 0)]
+            fitted.append(kept)
+            remaining -= len(kept) + 2  # the "\n\n" separator
+        return fitted
+
+    remaining = PROFILE_CONTEXT_TOKENS
+    for page in texts:
+        tokens = encoding.encode(page)
+        if len(tokens) > remaining:
+            page = encoding.decode(tokens[: max(remaining, 0)])
+            tokens = tokens[: max(remaining, 0)]
+        fitted.append(page)
+        remaining -= len(tokens) + 1  # the "\n\n" separator
+    return fitted
+
+
+# Profile keys copied from the LLM's JSON onto the Company row.
+_TEXT_FIELDS = (
+    "website", "segment", "category", "region", "size_bucket",
+    "description", "background", "market_position",
+)
+# Profile keys holding lists, stored as JSON-encoded text.
+_LIST_FIELDS = (
+    "products", "target_segments", "pricing_model", "strengths", "risks", "compliance_tags",
+)
+# List fields mirrored into company_tags, with their tag_type.
+_TAG_TYPES = {
+    "pricing_model": "pricing",
+    "strengths": "strength",
+    "risks": "risk",
+    "compliance_tags": "compliance",
+}
+
+
+def _list_to_json(value: Any) -> Optional[str]:
+    """Convert a list to a JSON string; strings pass through, else None."""
+    if isinstance(value, list):
+        return json_codec.dumps(value)
+    if isinstance(value, str):
+        return value
+    return None
+
+
+async def replace_company_tags(db: AsyncSession, company_id: int, fields: Mapping[str, Any]) -> None:
+    """Rewrite a company's ``company_tags`` rows for the given list fields.
+
+    ``fields`` maps Company list columns to their new values (JSON text,
+    legacy comma-separated text or a list). Columns that are not mirrored
+    are ignored and tags of other types are left alone. Does not commit.
+    """
+    retagged = {
+        _TAG_TYPES[field]: _list_field(_list_to_json(value))
+        for field, value in fields.items()
+        if field in _TAG_TYPES
+    }
+    if not retagged:
+        return
+    await db.execute(
+        delete(CompanyTag).where(
+            CompanyTag.company_id == company_id,
+            CompanyTag.tag_type.in_(retagged),
+        )
+    )
+    tag_rows = [
+        {"company_id": company_id, "tag_type": tag_type, "tag_value": value}
+        for tag_type, values in retagged.items()
+        for value in values
+    ]
+    if tag_rows:
+        await db.execute(insert(CompanyTag), tag_rows)
+
+
+async def backfill_company_tags(db: AsyncSession) -> int:
+    """Fill ``company_tags`` for companies that have no tags yet.
+
+    The 20240409 migration backfills with PostgreSQL-only SQL; this is the
+    portable equivalent for databases created with ``create_all`` (e.g.
+    SQLite). Returns the number of companies tagged.
+    """
+    rows = (
+        await db.execute(
+            select(Company.id, *(getattr(Company, field) for field in _TAG_TYPES))
+            .where(~Company.tags.any())
+        )
+    ).all()
+    tag_rows = [
+        {"company_id": row.id, "tag_type": tag_type, "tag_value": value}
+        for row in rows
+        for field, tag_type in _TAG_TYPES.items()
+        for value in _list_field(getattr(row, field))
+    ]
+    if tag_rows:
+        await db.execute(insert(CompanyTag), tag_rows)
+        await db.commit()
+        invalidate_stats()
+    return len({row["company_id"] for row in tag_rows})
+
+
+async def profile_company(company: Company, db: AsyncSession, refresh: bool = False) -> None:
     """Generate or refresh a structured profile for a company.
 
     This function performs the core "decide" step of the pipeline. It
@@ -288,6 +553,8 @@ async def profile_company(company: Company, db: AsyncSession) -> None:
     Args:
         company: The Company ORM object to profile. Fields will be updated in place.
         db: Async database session.
+        refresh: Ask the language model again even if an identical prompt
+            was answered recently.
 
     Returns:
         None. The company object is updated and committed to the database.
@@ -300,77 +567,37 @@ async def profile_company(company: Company, db: AsyncSession) -> None:
         f"{company.name} LMS features",
     ]
     
-    # Gather documents
+    # Gather documents; the queries run concurrently.
     documents: List[Tuple[str, str, str]] = []  # (url, title, snippet)
-    try:
-        for q in queries[:2]:  # Limit to 2 queries to save time
-            try:
-                results = await search_web(q, num_results=2)  # Reduced from 3
-                for item in results:
-                    url = item.get("url")
-                    title = item.get("title")
-                    snippet = item.get("snippet")
-                    if url and not any(d[0] == url for d in documents):
-                        documents.append((url, title, snippet))
-            except SearchError as e:
-                logger.warning("Search disabled or failed: %s", e)
-                break
-    except Exception as exc:
-        logger.exception("Error during search for %s: %s", company.name, exc)
-
-    # Fetch and clean text for each document
-    context_parts: List[str] = []
-    for idx, (url, title, snippet) in enumerate(documents[:3]):  # Limit to 3 docs
-        try:
-            async with httpx.AsyncClient(timeout=10) as client:  # Reduced timeout
-                resp = await client.get(url, headers={"User-Agent": "CompetitorResearchBot/1.0"})
-                if resp.status_code == 200 and "text" in resp.headers.get("content-type", ""):
-                    import re
-                    from html import unescape
-                    html = resp.text
-                    html = re.sub(r"<script[^>]*>.*?</script>", " ", html, flags=re.DOTALL | re.IGNORECASE)
-                    html = re.sub(r"<style[^>]*>.*?</style>", " ", html, flags=re.DOTALL | re.IGNORECASE)
-                    text = re.sub(r"<[^>]+>", " ", html)
-                    text = unescape(text)
-                    text = re.sub(r"\s+", " ", text)
-                    plain = text.strip()[:1500]  # Reduced from 3000
-                else:
-                    plain = snippet or ""
-        except Exception as exc:
-            logger.debug("Failed to fetch %s: %s", url, exc)
-            plain = snippet or ""
-        
-        # Persist source document
-        doc = SourceDocument(
-            company_id=company.id,
-            url=url,
-            title=title,
-            snippet=snippet,
-            full_text=plain,
-            source_type="website",
-            relevance_score=None,
-            published_at=None,
-        )
-        db.add(doc)
-        context_parts.append(plain)
-    
-    await db.commit()
+    seen_urls: set[str] = set()
+    results_list = await asyncio.gather(
+        *(search_web(q, num_results=2) for q in queries[:2]),  # Limit to 2 queries to save time
+        return_exceptions=True,
+    )
+    for results in results_list:
+        if isinstance(results, SearchError):
+            logger.warning("Search disabled or failed: %s", results)
+            continue
+        if isinstance(results, Exception):
+            logger.error("Error during search for %s: %s", company.name, results)
+            continue
+        for item in results:
+            url = item.get("url")
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                documents.append((url, item.get("title"), item.get("snippet")))
+
+    # Fetch and clean text for each document concurrently over the shared
+    # connection pool.
+    selected = documents[:3]  # Limit to 3 docs
+    texts = await asyncio.gather(*(_fetch_document_text(url, snippet) for url, _, snippet in selected))
+    # Only the part of each page that fits in the prompt is kept, both for
+    # the prompt and for SourceDocument.full_text.
+    await warm_token_encoding()
+    texts = _fit_context(texts)
 
     # Compose prompt for LLM
-    context_text = "\n\n".join(context_parts)[:4000]  # Reduced from 8000
-    
-    system_prompt = (
-        "You are an expert market analyst for EdTech and LMS companies. "
-        "Using the provided context, produce a JSON object describing the company. "
-        "Required keys: name, website, segment, category, region, size_bucket, description, "
-        "background, products, target_segments, pricing_model, market_position, strengths, "
-        "risks, has_ai_features, compliance_tags. "
-        "For list fields (products, target_segments, pricing_model, strengths, risks, compliance_tags), "
-        "provide arrays of strings. "
-        "Always include all keys. If information is unavailable, use null or an empty array. "
-        "has_ai_features should be a boolean. "
-        "Do not wrap the JSON in markdown or code blocks."
-    )
+    context_text = "\n\n".join(texts)
     
     user_prompt = (
         f"Context:\n{context_text}\n\n"
@@ -379,64 +606,75 @@ async def profile_company(company: Company, db: AsyncSession) -> None:
     )
     
     messages = [
-        {"role": "system", "content": system_prompt},
+        {"role": "system", "content": _PROFILE_SYSTEM},
         {"role": "user", "content": user_prompt},
     ]
     
     try:
-        raw = await generate(messages, model=settings.LLM_MODEL, max_tokens=2000)
-        
-        # Clean up response
-        raw = raw.strip()
-        if raw.startswith("```json"):
-            raw = raw[7:]
-        if raw.startswith("```"):
-            raw = raw[3:]
-        if raw.endswith("```"):
-            raw = raw[:-3]
-        raw = raw.strip()
+        raw = await cached_generate(messages, model=settings.LLM_MODEL, max_tokens=2000, no_cache=refresh)
         
         logger.info("Profile response for %s: %s", company.name, raw[:200])
         
-        profile = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        profile = json_codec.loads_embedded(raw)
+    except json_codec.JSONDecodeError as exc:
         logger.error("Failed to parse profile JSON for %s: %s. Raw: %s", company.name, exc, raw[:500])
         profile = {}
     except Exception as exc:
         logger.exception("Error generating profile for %s: %s", company.name, exc)
         profile = {}
     
-    # Update company fields
-    def list_to_json(value):
-        """Convert list to JSON string, or return original if not a list."""
-        if isinstance(value, list):
-            return json.dumps(value)
-        elif isinstance(value, str):
-            return value
-        return None
-    
-    company.website = profile.get("website") or company.website
-    company.segment = profile.get("segment") or company.segment
-    company.category = profile.get("category") or company.category
-    company.region = profile.get("region") or company.region
-    company.size_bucket = profile.get("size_bucket") or company.size_bucket
-    company.description = profile.get("description") or company.description
-    company.background = profile.get("background") or company.background
-    company.products = list_to_json(profile.get("products")) or company.products
-    company.target_segments = list_to_json(profile.get("target_segments")) or company.target_segments
-    company.pricing_model = list_to_json(profile.get("pricing_model")) or company.pricing_model
-    company.market_position = profile.get("market_position") or company.market_position
-    company.strengths = list_to_json(profile.get("strengths")) or company.strengths
-    company.risks = list_to_json(profile.get("risks")) or company.risks
+    # Persist the source documents with a single executemany INSERT. They
+    # are written here, after the LLM call, so the documents and the profile
+    # update share one short transaction.
+    if selected:
+        await db.execute(
+            insert(SourceDocument),
+            [
+                {
+                    "company_id": company.id,
+                    "url": url,
+                    "title": title,
+                    "snippet": snippet,
+                    "full_text": plain,
+                    "source_type": "website",
+                }
+                for (url, title, snippet), plain in zip(selected, texts)
+            ],
+        )
+
+    # Update company fields. Values the model left empty keep what is stored.
+    for field in _TEXT_FIELDS:
+        value = profile.get(field)
+        if value:
+            setattr(company, field, value)
+    changed: Dict[str, str] = {}
+    for field in _LIST_FIELDS:
+        encoded = _list_to_json(profile.get(field))
+        # Skip unchanged lists so the column is not rewritten.
+        if encoded and encoded != getattr(company, field):
+            setattr(company, field, encoded)
+            changed[field] = encoded
+    await replace_company_tags(db, company.id, changed)
     company.has_ai_features = bool(profile.get("has_ai_features", company.has_ai_features))
-    company.compliance_tags = list_to_json(profile.get("compliance_tags")) or company.compliance_tags
-    company.last_updated = datetime.utcnow()
+    company.last_updated = datetime.now(timezone.utc)
     
     await db.commit()
+    invalidate_stats()
     logger.info("Successfully updated profile for: %s", company.name)
 
 
 
+async def _fetch_document_text(url: str, snippet: Optional[str]) -> str:
+    """Fetch ``url`` and return its visible text, or the snippet on failure."""
+    try:
+        resp, html = await fetch_page(url, headers={"User-Agent": "CompetitorResearchBot/1.0"}, timeout=10)
+        if resp.status_code == 200 and "text" in resp.headers.get("content-type", ""):
+            return html_to_text(html)[:1500]  # Reduced from 3000
+    except Exception as exc:
+        logger.debug("Failed to fetch %s: %s", url, exc)
+    return snippet or ""
+
+
 async def refresh_company(company_id: int, db: AsyncSession) -> None:
     """Refresh the profile for a specific company.
 
@@ -451,7 +689,28 @@ async def refresh_company(company_id: int, db: AsyncSession) -> None:
     company = result.scalars().first()
     if not company:
         raise ValueError("Company not found")
-    await profile_company(company, db)
+    await profile_company(company, db, refresh=True)
+
+
+async def _count_pricing_models(db: AsyncSession) -> Dict[str, int]:
+    """Count companies per pricing model label from ``company_tags``.
+
+    Companies without any pricing tag are counted as ``"unknown"``.
+    """
+    result = await db.execute(
+        select(CompanyTag.tag_value, func.count())
+        .where(CompanyTag.tag_type == "pricing")
+        .group_by(CompanyTag.tag_value)
+    )
+    pricing_counts: Counter[str] = Counter(dict(result.all()))
+    untagged = await db.scalar(
+        select(func.count())
+        .select_from(Company)
+        .where(~Company.tags.any(CompanyTag.tag_type == "pricing"))
+    )
+    if untagged:
+        pricing_counts["unknown"] += untagged
+    return pricing_counts
 
 
 async def get_stats_overview(db: AsyncSession) -> StatsOverviewResponse:
@@ -459,8 +718,11 @@ async def get_stats_overview(db: AsyncSession) -> StatsOverviewResponse:
 
     Returns:
         ``StatsOverviewResponse`` aggregating companies by category, region,
-        pricing model and AI features.
+        pricing model and AI features. Served from a short-lived cache.
     """
+    cached = _stats_cache.get(None)
+    if cached is not None:
+        return cached
     buckets = {
         "by_category": [],
         "by_region": [],
@@ -473,43 +735,38 @@ async def get_stats_overview(db: AsyncSession) -> StatsOverviewResponse:
     # Region
     result = await db.execute(select(Company.region, func.count()).group_by(Company.region))
     buckets["by_region"] = [StatsBucket(label=row[0] or "unknown", count=row[1]) for row in result.all()]
-    # Pricing model: explode lists encoded as JSON or comma separated
-    result = await db.execute(select(Company.pricing_model))
-    pricing_counts: Dict[str, int] = {}
-    for row in result.scalars().all():
-        if not row:
-            pricing_counts.setdefault("unknown", 0)
-            pricing_counts["unknown"] += 1
-            continue
-        value = row
-        try:
-            items = json.loads(value)
-            if isinstance(items, list):
-                for item in items:
-                    pricing_counts.setdefault(item, 0)
-                    pricing_counts[item] += 1
-            else:
-                pricing_counts.setdefault(str(items), 0)
-                pricing_counts[str(items)] += 1
-        except Exception:
-            # comma separated fallback
-            for part in value.split(","):
-                part = part.strip()
-                pricing_counts.setdefault(part or "unknown", 0)
-                pricing_counts[part or "unknown"] += 1
+    # Pricing model: grouped from the company_tags mirror
+    pricing_counts = await _count_pricing_models(db)
     buckets["pricing_models"] = [StatsBucket(label=k, count=v) for k, v in pricing_counts.items()]
     # AI features counts
     result = await db.execute(select(Company.has_ai_features, func.count()).group_by(Company.has_ai_features))
-    ai_counts: Dict[str, int] = {}
+    # NULL and false both count as "without_ai", so the groups are summed.
+    ai_counts: Counter[str] = Counter()
     for has_ai, count in result.all():
-        key = "with_ai" if has_ai else "without_ai"
-        ai_counts[key] = count
-    return StatsOverviewResponse(
+        ai_counts["with_ai" if has_ai else "without_ai"] += count
+    overview = StatsOverviewResponse(
         by_category=buckets["by_category"],
         by_region=buckets["by_region"],
         pricing_models=buckets["pricing_models"],
         ai_features=ai_counts,
     )
+    _stats_cache.set(None, overview)
+    return overview
+
+
+def _list_field(value: Optional[str]) -> List[str]:
+    """Decode a list column stored as a JSON array or comma-separated text."""
+    if not value:
+        return []
+    # Only JSON arrays are worth a parse attempt; anything else is legacy text.
+    if value.startswith("["):
+        try:
+            items = json_codec.loads(value)
+        except json_codec.JSONDecodeError:
+            items = None
+        if isinstance(items, list):
+            return [str(item) for item in items if item]
+    return [part.strip() for part in value.split(",") if part.strip()]
 
 
 async def compare_companies(company_ids: List[int], db: AsyncSession) -> CompanyCompareResponse:
@@ -527,48 +784,32 @@ async def compare_companies(company_ids: List[int], db: AsyncSession) -> Company
     """
     if not company_ids:
         return CompanyCompareResponse()
-    result = await db.execute(select(Company).where(Company.id.in_(company_ids)))
-    companies = result.scalars().all()
+    # Only the columns the prompt uses; full ORM rows would also load the
+    # long profile text.
+    result = await db.execute(
+        select(Company.id, Company.name, Company.category, Company.strengths, Company.risks)
+        .where(Company.id.in_(company_ids))
+    )
+    companies = result.all()
     if not companies:
         return CompanyCompareResponse()
     # Compose context summarising each company
-    lines: List[str] = []
-    for c in companies:
-        strengths = []
-        if c.strengths:
-            try:
-                strengths = json.loads(c.strengths)
-            except Exception:
-                strengths = [s.strip() for s in c.strengths.split(",") if s.strip()]
-        risks = []
-        if c.risks:
-            try:
-                risks = json.loads(c.risks)
-            except Exception:
-                risks = [s.strip() for s in c.risks.split(",") if s.strip()]
-        lines.append(
-            f"Company {c.id}: {c.name}\n"
-            f"  Category: {c.category or 'unknown'}\n"
-            f"  Strengths: {', '.join(strengths) or 'unknown'}\n"
-            f"  Risks: {', '.join(risks) or 'unknown'}"
-        )
-    context = "\n\n".join(lines)
-    # LLM prompt for comparison
-    system_prompt = (
-        "You are a market analyst. You will be given summaries of multiple companies. "
-        "Identify strengths that are common across all companies, list key differentiators for each company, "
-        "and suggest opportunity gaps in the market. Return a JSON object with keys: "
-        "common_strengths (list of strings), key_differences (list of objects with 'company_id' and 'points'), "
-        "and opportunity_gaps (list of strings). Do not wrap the JSON in markdown."
+    context = "\n\n".join(
+        f"Company {c.id}: {c.name}\n"
+        f"  Category: {c.category or 'unknown'}\n"
+        f"  Strengths: {', '.join(_list_field(c.strengths)) or 'unknown'}\n"
+        f"  Risks: {', '.join(_list_field(c.risks)) or 'unknown'}"
+        for c in companies
     )
+    # LLM prompt for comparison
     user_prompt = f"Company summaries:\n{context}\n\nReturn the JSON insights."
     messages = [
-        {"role": "system", "content": system_prompt},
+        {"role": "system", "content": _COMPARE_SYSTEM},
         {"role": "user", "content": user_prompt},
     ]
-    raw = await generate(messages, model=settings.LLM_MODEL)
+    raw = await cached_generate(messages, model=settings.LLM_MODEL)
     try:
-        data = json.loads(raw)
+        data = json_codec.loads(raw)
         common_strengths = data.get("common_strengths") or []
         key_diffs_data = data.get("key_differences") or []
         gaps = data.get("opportunity_gaps") or []
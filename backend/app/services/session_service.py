@@ -2,15 +2,14 @@
 Session service for managing research sessions.
 """
 
-import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import attributes, selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from ..db.models import (
     CompanyProfile,
@@ -32,9 +31,41 @@ from ..schemas.session import (
     StartSessionRequest,
     TrendResponse,
 )
+from ..utils import json_codec
+from ..utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# The UI polls session headers and the recent-sessions list while a scout
+# run is in progress. Responses are served from memory for a few seconds;
+# writers call ``invalidate_session`` so local changes show up immediately.
+SESSION_CACHE_TTL = 3.0
+_session_cache: TTLCache[SessionResponse] = TTLCache(maxsize=4096, ttl=SESSION_CACHE_TTL)
+_session_list_cache: TTLCache[List[SessionListItem]] = TTLCache(maxsize=64, ttl=SESSION_CACHE_TTL)
+# Serialised form of _session_cache entries for the polled detail endpoint.
+_session_json_cache: TTLCache[bytes] = TTLCache(maxsize=4096, ttl=SESSION_CACHE_TTL)
+
+
+def is_valid_id(value: str) -> bool:
+    """Return True if ``value`` is a well-formed session or company id.
+
+    Ids are UUIDs, stored natively on PostgreSQL, where a malformed literal
+    makes the query fail instead of matching nothing. Callers check first
+    and treat a bad id as not found.
+    """
+    try:
+        UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        return False
+    return True
+
+
+def invalidate_session(session_id: str) -> None:
+    """Drop cached reads for a session after it has been written."""
+    _session_cache.invalidate(session_id)
+    _session_json_cache.invalidate(session_id)
+    _session_list_cache.clear()
+
 
 def _parse_json(value: Any) -> Any:
     """Safely parse JSON fields that may be stored as strings."""
@@ -42,19 +73,28 @@ def _parse_json(value: Any) -> Any:
         return value
     if isinstance(value, str):
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
+            return json_codec.loads(value)
+        except json_codec.JSONDecodeError:
             return value
     return value
 
 
+def _tag_list(value: Any) -> List[str]:
+    """Decode ``primary_tags`` into strings; empty when absent or malformed."""
+    tags = _parse_json(value)
+    return [str(tag) for tag in tags] if isinstance(tags, list) else []
+
+
+# The response builders below use ``model_construct``: every value comes
+# from typed ORM columns (or is coerced here), so field validation would only
+# repeat work. TrendResponse is still validated because its bars are raw
+# JSON dicts.
 def _company_to_card(company: SessionCompany) -> CompanyCard:
     """Convert a SessionCompany ORM object into the API schema."""
-    tags = _parse_json(company.primary_tags) or []
     summary = company.summary
     if not summary and company.profile:
         summary = company.profile.summary
-    return CompanyCard(
+    return CompanyCard.model_construct(
         id=company.id,
         name=company.name,
         domain=company.domain,
@@ -66,7 +106,7 @@ def _company_to_card(company: SessionCompany) -> CompanyCard:
         employees=company.employees,
         hq_city=company.hq_city,
         hq_country=company.hq_country,
-        primary_tags=tags if isinstance(tags, list) else [],
+        primary_tags=_tag_list(company.primary_tags),
         summary=summary,
     )
 
@@ -75,18 +115,19 @@ def _session_to_response(session: ResearchSession) -> SessionResponse:
     charts_data = _parse_json(session.charts) or {}
     scoring_data = _parse_json(session.scoring_config) or {}
     companies_raw: list[SessionCompany] = []
-    if attributes.is_attribute_loaded(session, "companies"):
+    if "companies" not in inspect(session).unloaded:
         companies_raw = session.companies or []
     companies = [_company_to_card(comp) for comp in companies_raw]
 
-    return SessionResponse(
+    return SessionResponse.model_construct(
         id=session.id,
         label=session.label,
         segment=session.segment,
         status=session.status,
         max_companies=session.max_companies,
         companies_found=session.companies_found or 0,
-        charts=ChartsPayload(**charts_data) if isinstance(charts_data, dict) else None,
+        # Written by the worker's _build_charts, so there is nothing to validate.
+        charts=ChartsPayload.model_construct(**charts_data) if isinstance(charts_data, dict) else None,
         scoring_config=scoring_data if isinstance(scoring_data, dict) else {},
         created_at=session.created_at,
         updated_at=session.updated_at or session.created_at,
@@ -97,7 +138,6 @@ def _session_to_response(session: ResearchSession) -> SessionResponse:
 async def start_session(segment: str, max_companies: int, db: AsyncSession) -> SessionResponse:
     """Create a new session and return the API representation."""
     session = ResearchSession(
-        id=str(uuid4()),
         label=segment,
         segment=segment,
         status="PENDING",
@@ -105,12 +145,10 @@ async def start_session(segment: str, max_companies: int, db: AsyncSession) -> S
         companies_found=0,
         charts={},
         scoring_config={},
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
     )
     db.add(session)
     await db.commit()
-    await db.refresh(session)
+    _session_list_cache.clear()
     return _session_to_response(session)
 
 
@@ -121,57 +159,104 @@ async def create_session(session_data: StartSessionRequest, db: AsyncSession) ->
 
 async def list_sessions(db: AsyncSession, limit: int = 10, offset: int = 0) -> List[SessionListItem]:
     """List existing sessions ordered by most recent updates."""
+    cached = _session_list_cache.get((limit, offset))
+    if cached is not None:
+        return cached
+    # Only the listed columns, so the charts/scoring JSON is never decoded.
     result = await db.execute(
-        select(ResearchSession)
+        select(
+            ResearchSession.id,
+            ResearchSession.label,
+            ResearchSession.status,
+            func.coalesce(ResearchSession.updated_at, ResearchSession.created_at).label("updated_at"),
+        )
         .order_by(ResearchSession.updated_at.desc())
         .limit(limit)
         .offset(offset)
     )
-    sessions = result.scalars().all()
-    return [
-        SessionListItem(
-            id=s.id,
-            label=s.label,
-            status=s.status,
-            updated_at=s.updated_at or s.created_at,
-        )
-        for s in sessions
-    ]
+    # Row keys match the SessionListItem fields one to one.
+    items = [SessionListItem.model_construct(**row) for row in result.mappings()]
+    _session_list_cache.set((limit, offset), items)
+    return items
 
 
 async def get_session(session_id: str, db: AsyncSession) -> SessionResponse:
     """Retrieve a session with its companies and profiles."""
+    if not is_valid_id(session_id):
+        raise ValueError("Session not found")
+    cached = _session_cache.get(session_id)
+    if cached is not None:
+        return cached
+    # Cards only read each company's profile; raiseload turns any other
+    # relationship access into an error instead of a hidden per-row query.
     result = await db.execute(
         select(ResearchSession)
         .options(
-            selectinload(ResearchSession.companies)
-            .selectinload(SessionCompany.profile),
-            selectinload(ResearchSession.companies)
-            .selectinload(SessionCompany.sources),
+            selectinload(ResearchSession.companies).options(
+                selectinload(SessionCompany.profile).raiseload("*"),
+                raiseload("*"),
+            ),
+            raiseload("*"),
         )
         .where(ResearchSession.id == session_id)
     )
     session = result.scalar_one_or_none()
     if not session:
         raise ValueError("Session not found")
-    return _session_to_response(session)
-
-
-async def get_logs(session_id: str, db: AsyncSession, since: Optional[datetime] = None) -> List[SessionLog]:
-    """Return ordered logs for a session."""
+    response = _session_to_response(session)
+    _session_cache.set(session_id, response)
+    return response
+
+
+async def get_session_json(session_id: str, db: AsyncSession) -> bytes:
+    """Like ``get_session``, but return the response already encoded as JSON.
+
+    Repeated polls within the cache TTL reuse the same bytes, skipping both
+    the query and response serialisation.
+    """
+    cached = _session_json_cache.get(session_id)
+    if cached is not None:
+        return cached
+    body = (await get_session(session_id, db)).model_dump_json().encode()
+    _session_json_cache.set(session_id, body)
+    return body
+
+
+async def get_logs(
+    session_id: str,
+    db: AsyncSession,
+    since: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+) -> List[SessionLog]:
+    """Return ordered logs for a session.
+
+    ``since`` filters by timestamp; ``after_id`` returns only entries newer
+    than a log id already seen, which is exact even when several lines share
+    a timestamp.
+    """
+    if not is_valid_id(session_id):
+        raise ValueError("Session not found")
     session_exists = await db.get(ResearchSession, session_id)
     if not session_exists:
         raise ValueError("Session not found")
 
-    query = select(ResearchSessionLog).where(ResearchSessionLog.session_id == session_id)
+    query = select(
+        ResearchSessionLog.id,
+        ResearchSessionLog.ts,
+        ResearchSessionLog.level,
+        ResearchSessionLog.message,
+        ResearchSessionLog.meta,
+    ).where(ResearchSessionLog.session_id == session_id)
     if since:
         query = query.where(ResearchSessionLog.ts > since)
-    query = query.order_by(ResearchSessionLog.ts.asc())
+    if after_id is not None:
+        query = query.where(ResearchSessionLog.id > after_id)
+    query = query.order_by(ResearchSessionLog.ts.asc(), ResearchSessionLog.id.asc())
 
     result = await db.execute(query)
-    logs = result.scalars().all()
+    logs = result.all()
     return [
-        SessionLog(
+        SessionLog.model_construct(
             id=log.id,
             ts=log.ts,
             level=log.level,
@@ -184,20 +269,23 @@ async def get_logs(session_id: str, db: AsyncSession, since: Optional[datetime]
 
 async def update_scoring(session_id: str, payload: ScoringConfig, db: AsyncSession) -> Dict[str, Any]:
     """Persist scoring config for a session."""
+    if not is_valid_id(session_id):
+        raise ValueError("Session not found")
     result = await db.execute(select(ResearchSession).where(ResearchSession.id == session_id))
     session = result.scalar_one_or_none()
     if not session:
         raise ValueError("Session not found")
 
     session.scoring_config = payload.model_dump()
-    session.updated_at = datetime.utcnow()
     await db.commit()
-    await db.refresh(session)
+    invalidate_session(session_id)
     return session.scoring_config or {}
 
 
 async def get_trends(session_id: str, db: AsyncSession) -> TrendResponse:
     """Fetch the latest trend analysis for a session."""
+    if not is_valid_id(session_id):
+        raise ValueError("Trend analysis not found")
     result = await db.execute(
         select(TrendAnalysis)
         .where(TrendAnalysis.session_id == session_id)
@@ -216,11 +304,14 @@ async def get_trends(session_id: str, db: AsyncSession) -> TrendResponse:
 
 async def get_company_profile(company_id: str, db: AsyncSession) -> CompanyProfileResponse:
     """Return a company profile including sources."""
+    if not is_valid_id(company_id):
+        raise ValueError("Company not found")
     result = await db.execute(
         select(SessionCompany)
         .options(
-            selectinload(SessionCompany.profile),
-            selectinload(SessionCompany.sources),
+            selectinload(SessionCompany.profile).raiseload("*"),
+            selectinload(SessionCompany.sources).raiseload("*"),
+            raiseload("*"),
         )
         .where(SessionCompany.id == company_id)
     )
@@ -231,7 +322,7 @@ async def get_company_profile(company_id: str, db: AsyncSession) -> CompanyProfi
     profile: CompanyProfile | None = company.profile
     sources = company.sources or []
 
-    return CompanyProfileResponse(
+    return CompanyProfileResponse.model_construct(
         id=company.id,
         name=company.name,
         domain=company.domain,
@@ -243,7 +334,7 @@ async def get_company_profile(company_id: str, db: AsyncSession) -> CompanyProfi
         employees=company.employees,
         hq_city=company.hq_city,
         hq_country=company.hq_country,
-        primary_tags=_parse_json(company.primary_tags) or [],
+        primary_tags=_tag_list(company.primary_tags),
         summary=company.summary or (profile.summary if profile else None),
         score_analysis=profile.score_analysis if profile else None,
         market_position=profile.market_position if profile else None,
@@ -253,7 +344,7 @@ async def get_company_profile(company_id: str, db: AsyncSession) -> CompanyProfi
         scale_reach=profile.scale_reach if profile else None,
         strategic_notes=profile.strategic_notes if profile else None,
         sources=[
-            CompanySourceItem(
+            CompanySourceItem.model_construct(
                 url=src.url,
                 label=getattr(src, "label", None),
                 source_type=getattr(src, "source_type", None),
@@ -265,11 +356,13 @@ async def get_company_profile(company_id: str, db: AsyncSession) -> CompanyProfi
 
 async def update_session_status(session_id: str, status: str, db: AsyncSession) -> bool:
     """Update a session's status flag."""
+    if not is_valid_id(session_id):
+        return False
     result = await db.execute(select(ResearchSession).where(ResearchSession.id == session_id))
     session = result.scalar_one_or_none()
     if not session:
         return False
     session.status = status
-    session.updated_at = datetime.utcnow()
     await db.commit()
+    invalidate_session(session_id)
     return True
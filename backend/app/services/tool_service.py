@@ -6,11 +6,26 @@ their name. It isolates the rest of the codebase from the internal
 structure of the tool modules.
 """
 
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from ..llm.tools import calendar_tool, faq_tool, search_tool
 
 
+ToolRunner = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+# Tool name -> coroutine function, resolved with a single dict lookup.
+_TOOL_DISPATCH: Dict[str, ToolRunner] = {
+    "calendar": calendar_tool.run,
+    "faq": faq_tool.run,
+    "search": search_tool.run,
+}
+
+
+def get_tool(name: str) -> Optional[ToolRunner]:
+    """Return the runner for a tool name, or None if it is unknown."""
+    return _TOOL_DISPATCH.get(name)
+
+
 async def call_tool(name: str, args: Dict[str, Any]) -> Any:
     """Invoke a tool by name.
 
@@ -24,10 +39,7 @@ async def call_tool(name: str, args: Dict[str, Any]) -> Any:
     Raises:
         ValueError: If an unknown tool name is provided.
     """
-    if name == "calendar":
-        return await calendar_tool.run(args)
-    if name == "faq":
-        return await faq_tool.run(args)
-    if name == "search":
-        return await search_tool.run(args)
-    raise ValueError(f"Unknown tool: {name}")
\ No newline at end of file
+    runner = get_tool(name)
+    if runner is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return await runner(args)
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Plain-text extraction from fetched web pages.
+
+The research service, the market routes and the session worker feed page
+text to the language model. ``html_to_text`` drops scripts, styles and tags, unescapes
+entities and collapses whitespace.
+
+When ``selectolax`` is installed the page is parsed by its C HTML parser
+(the lexbor backend where the installed version ships it),
+which is much faster than regex stripping and handles markup such as
+``"</script>"`` inside script bodies. Otherwise one precompiled regex strips
+all markup in a single pass.
+"""
+
+import re
+from html import unescape
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:  # pragma: no cover - selectolax is optional
+    try:
+        from selectolax.parser import HTMLParser
+
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        HTMLParser = None  # type: ignore[assignment]
+        SELECTOLAX_AVAILABLE = False
+
+
+# Script and style blocks (with their contents) and any other tag, removed in
+# a single scan of the document.
+_MARKUP_RE = re.compile(
+    r"<script[^>]*>.*?</script>|<style[^>]*>.*?</style>|<[^>]+>",
+    re.DOTALL | re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
+
+
+def html_to_text(html: str) -> str:
+    """Return the visible text of ``html`` on a single line."""
+    if SELECTOLAX_AVAILABLE:
+        tree = HTMLParser(html)
+        for node in tree.css("script,style,noscript"):
+            node.decompose()
+        root = tree.body or tree.root
+        text = root.text(separator=" ") if root is not None else ""
+        return _WS_RE.sub(" ", text).strip()
+
+    text = unescape(_MARKUP_RE.sub(" ", html))
+    return _WS_RE.sub(" ", text).strip()
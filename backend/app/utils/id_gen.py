@@ -2,12 +2,12 @@
 Utility functions for generating unique identifiers.
 """
 
-import uuid
+import secrets
 
 def generate_id() -> str:
-    """Generate a random hexadecimal ID using UUID4.
+    """Generate a random hexadecimal ID from 16 random bytes.
 
     Returns:
         str: A 32-character hexadecimal string.
     """
-    return uuid.uuid4().hex
+    return secrets.token_hex(16)
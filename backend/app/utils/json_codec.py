@@ -0,0 +1,49 @@
+"""
+JSON encoding helpers backed by ``orjson``.
+
+``orjson`` serialises and parses several times faster than the standard
+library and natively understands datetimes, UUIDs and dataclasses. These
+wrappers keep the call sites close to ``json.dumps``/``json.loads`` and are
+also handed to the database engine for JSON columns.
+"""
+
+from typing import Any
+
+import orjson
+
+
+# Dict keys in LLM output and chart payloads are not guaranteed to be strings.
+_DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def dumps(value: Any) -> str:
+    """Serialise ``value`` to a JSON string."""
+    return orjson.dumps(value, option=_DUMP_OPTIONS).decode("utf-8")
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Serialise ``value`` to UTF-8 encoded JSON bytes."""
+    return orjson.dumps(value, option=_DUMP_OPTIONS)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from a string or bytes."""
+    return orjson.loads(data)
+
+
+def loads_embedded(text: str) -> Any:
+    """Parse the JSON object or array embedded in ``text``.
+
+    LLM replies often wrap the document in markdown fences or a sentence of
+    prose; everything before the first ``{``/``[`` and after the matching
+    last ``}``/``]`` is ignored. Raises ``JSONDecodeError`` like ``loads``.
+    """
+    starts = [index for index in (text.find("{"), text.find("[")) if index != -1]
+    if starts:
+        start = min(starts)
+        end = text.rfind("}" if text[start] == "{" else "]")
+        if end > start:
+            return orjson.loads(text[start:end + 1])
+    return orjson.loads(text)
@@ -2,19 +2,37 @@
 Timing utilities for measuring execution durations.
 """
 
+import inspect
+import logging
 import time
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
 R = TypeVar("R")
 
+logger = logging.getLogger(__name__)
+
 def timeit(func: Callable[..., R]) -> Callable[..., R]:
-    """Decorator to measure and print the execution time of a function."""
+    """Decorator to measure and log (at DEBUG) the execution time of a function.
+
+    Coroutine functions are timed until the awaited result is ready, not just
+    until the coroutine object is created.
+    """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter_ns()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                logger.debug("%s executed in %d ns", func.__qualname__, time.perf_counter_ns() - start)
+        return async_wrapper  # type: ignore[return-value]
+
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> R:
-        start = time.perf_counter()
-        result = func(*args, **kwargs)
-        duration = time.perf_counter() - start
-        print(f"{func.__name__} executed in {duration:.4f}s")
-        return result
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            logger.debug("%s executed in %d ns", func.__qualname__, time.perf_counter_ns() - start)
     return wrapper
@@ -9,8 +9,13 @@ scheduler during application startup.
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 # Create a global scheduler instance. Do not start it until the FastAPI
-# application has been fully initialized to avoid race conditions.
-scheduler = AsyncIOScheduler(timezone="UTC")
+# application has been fully initialized to avoid race conditions. Runs that
+# were missed while the loop was busy collapse into one, and a job never
+# overlaps with itself.
+scheduler = AsyncIOScheduler(
+    timezone="UTC",
+    job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 60},
+)
 
 
 def start_scheduler() -> None:
@@ -3,32 +3,96 @@ Celery tasks for background job processing.
 """
 
 import asyncio
-import json
 import logging
-import re
-from datetime import datetime
-from html import unescape
-from typing import Any, Dict, List, Optional
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Coroutine, Dict, List, Optional, TypeVar
+from uuid import uuid4
 
-import httpx
 from celery import shared_task
-from sqlalchemy import select, update
+from celery.signals import worker_process_shutdown
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (no Windows build)
+    uvloop = None
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.config import settings
+from ..core.http_client import close_http_client, fetch_page
 from ..core.llm import LLMService
 from ..core.search import SearchService
 from ..db.models import (
+    PROFILE_FIELDS,
     CompanyProfile,
     CompanySource,
     ResearchSession,
     ResearchSessionLog,
     SessionCompany,
 )
-from ..db.session import async_session
+from ..db.session import async_session, engine
+from ..services.session_service import invalidate_session
+from ..utils import json_codec
+from ..utils.html_text import html_to_text
+from ..utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+R = TypeVar("R")
+
+# Extracted website text per normalised domain. The worker process is
+# long-lived, so a company researched again in a later session skips the
+# fetch and HTML parse. Failed fetches are not cached.
+_website_cache: TTLCache[str] = TTLCache(maxsize=2048, ttl=settings.WEBSITE_CACHE_TTL)
+
+
+# One event loop per worker process, running in a daemon thread. Tasks are
+# submitted to it instead of each paying for asyncio.run's loop setup and
+# teardown, and the engine pool and shared HTTP client stay connected
+# between tasks. Created lazily (and per pid) so a prefork parent's loop
+# thread is never inherited by its children.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_pid: Optional[int] = None
+_worker_loop_lock = threading.Lock()
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    global _worker_loop, _worker_loop_pid
+    with _worker_loop_lock:
+        if _worker_loop is None or _worker_loop_pid != os.getpid():
+            # uvloop's loop when installed, as it is with uvicorn[standard]
+            loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="celery-asyncio", daemon=True).start()
+            _worker_loop, _worker_loop_pid = loop, os.getpid()
+        return _worker_loop
+
+
+def _run_async(coro: Coroutine[Any, Any, R]) -> R:
+    """Run ``coro`` on the worker's event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_worker_loop()).result()
+
+
+async def _close_worker_clients() -> None:
+    await close_http_client()
+    await engine.dispose()
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_loop(**_kwargs: Any) -> None:
+    """Close the pooled HTTP and database connections as the worker exits."""
+    global _worker_loop
+    loop = _worker_loop
+    if loop is None or _worker_loop_pid != os.getpid():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_worker_clients(), loop).result(timeout=10)
+    except Exception:
+        logger.exception("Failed to close worker connections on shutdown")
+    loop.call_soon_threadsafe(loop.stop)
+    _worker_loop = None
+
 
 @shared_task(bind=True, name="backend.app.workers.tasks.run_agent_task")
 def run_agent_task(self, query: str, chat_id: str) -> Dict[str, Any]:
@@ -38,33 +102,37 @@ def run_agent_task(self, query: str, chat_id: str) -> Dict[str, Any]:
 
 
 @shared_task(bind=True, name="backend.app.workers.tasks.run_scout_session")
-def run_scout_session(self, session_id: str) -> Dict[str, Any]:
+def run_scout_session(self, session_id: str, reuse_recent: bool = False) -> Dict[str, Any]:
     """Run full scout research session."""
     logger.info(f"Celery worker: starting scout session {session_id}")
     
     try:
         # Run async work
-        asyncio.run(_run_session_async(session_id))
+        _run_async(_run_session_async(session_id, reuse_recent))
         return {"status": "completed", "session_id": session_id}
     except Exception as e:
         logger.exception(f"Scout session {session_id} failed: {e}")
         # Update session status to failed
-        asyncio.run(_mark_session_failed(session_id, str(e)))
+        _run_async(_mark_session_failed(session_id, str(e)))
         raise
 
 
-async def run_session_inline(session_id: str):
+async def run_session_inline(session_id: str, reuse_recent: bool = False):
     """Run session inline (for testing without Celery)."""
     try:
-        await _run_session_async(session_id)
+        await _run_session_async(session_id, reuse_recent)
     except Exception as e:
         logger.exception(f"Inline session {session_id} failed: {e}")
         await _mark_session_failed(session_id, str(e))
         raise
 
 
-async def _run_session_async(session_id: str):
-    """Core async logic for running a scout session."""
+async def _run_session_async(session_id: str, reuse_recent: bool = False):
+    """Core async logic for running a scout session.
+
+    With ``reuse_recent`` the results of a recently completed session for
+    the same segment are copied instead, when there is one.
+    """
     async with async_session() as db:
         # Get session
         result = await db.execute(select(ResearchSession).where(ResearchSession.id == session_id))
@@ -72,10 +140,15 @@ async def _run_session_async(session_id: str):
         
         if not session:
             raise ValueError(f"Session {session_id} not found")
+
+        if reuse_recent and await _copy_recent_session(db, session):
+            invalidate_session(session_id)
+            return
         
         # Update to RUNNING
         session.status = "RUNNING"
         await db.commit()
+        invalidate_session(session_id)
         
         # Initialize services
         search_service = SearchService(api_key=settings.SEARCH_API_KEY)
@@ -91,105 +164,243 @@ async def _run_session_async(session_id: str):
                 llm_service=llm_service
             )
             
-            await _add_log(db, session_id, f"Discovered {len(companies)} companies: {[c['name'] for c in companies]}")
+            await _add_log(
+                db, session_id, f"Discovered {len(companies)} companies: {[c['name'] for c in companies]}", commit=False
+            )
             
-            # Step 2: Save discovered companies
-            session.companies_found = len(companies)
-            for comp_data in companies:
-                comp = SessionCompany(
-                    session_id=session_id,
-                    name=comp_data.get("name", "Unknown"),
-                    domain=comp_data.get("domain", ""),
-                    primary_tags=comp_data.get("tags", []),
+            # Step 2: Save discovered companies in one INSERT ... RETURNING,
+            # which also hands back the rows to profile below.
+            companies_to_profile = []
+            if companies:
+                result = await db.scalars(
+                    insert(SessionCompany).returning(SessionCompany),
+                    [
+                        {
+                            "session_id": session_id,
+                            "name": comp_data.get("name", "Unknown"),
+                            "domain": comp_data.get("domain", ""),
+                            "primary_tags": _tag_strings(comp_data.get("tags")),
+                        }
+                        for comp_data in companies
+                    ],
                 )
-                db.add(comp)
-            
-            await db.commit()
-            
-            # Step 3: Deep profile each company
-            result = await db.execute(
-                select(SessionCompany).where(SessionCompany.session_id == session_id)
+                companies_to_profile = result.all()
+
+            # Bump the denormalised counter in the same transaction as the
+            # inserts so status polls never need a COUNT(*) over companies.
+            await db.execute(
+                update(ResearchSession)
+                .where(ResearchSession.id == session_id)
+                .values(companies_found=ResearchSession.companies_found + len(companies))
             )
-            companies_to_profile = result.scalars().all()
+            await db.commit()
+            invalidate_session(session_id)
             
-            for comp in companies_to_profile:
-                try:
-                    await _add_log(db, session_id, f"Deep research on {comp.name}...")
-                    
-                    profile_data = await _deep_profile_company(
-                        company_name=comp.name,
-                        company_domain=comp.domain,
-                        segment=session.segment,
-                        search_service=search_service,
-                        llm_service=llm_service
-                    )
-                    
-                    # Persist the detailed profile content
-                    profile = CompanyProfile(
-                        company_id=comp.id,
-                        summary=_safe_text(profile_data.get("summary")),
-                        score_analysis=_safe_text(profile_data.get("score_analysis")),
-                        market_position=_safe_text(profile_data.get("market_position")),
-                        background=_safe_text(profile_data.get("background")),
-                        recent_developments=_safe_text(profile_data.get("recent_developments")),
-                        products_services=_safe_text(profile_data.get("products_services")),
-                        scale_reach=_safe_text(profile_data.get("scale_reach")),
-                        strategic_notes=_safe_text(profile_data.get("strategic_notes")),
-                    )
-                    db.add(profile)
-
-                    # Update high-level company fields stored on SessionCompany
-                    comp.summary = profile.summary
-                    comp.data_reliability = profile_data.get("data_reliability", "medium")
-                    comp.last_verified_at = datetime.utcnow()
-                    comp.status = "COMPLETE"
-                    
-                    # Add sources
-                    for src in profile_data.get("sources", [])[:10]:  # Limit to 10 sources
-                        source = CompanySource(
-                            company_id=comp.id,
-                            url=src.get("url", ""),
-                            label=src.get("title", "Unknown"),
-                            source_type=src.get("source_type") or None,
-                        )
-                        db.add(source)
-                    
-                    await db.commit()
-                    await db.refresh(comp)
-                    
-                    await _add_log(db, session_id, f"✓ Profile complete: {comp.name}")
-                    
-                except Exception as e:
-                    await db.rollback()  # Critical: rollback on error
-                    logger.exception(f"Failed to profile {comp.name}: {e}")
-                    await _add_log(db, session_id, f"✗ Failed to profile {comp.name}: {str(e)[:100]}")
-                    continue
+            # Step 3: Deep profile the companies concurrently, each in its
+            # own database session; the semaphore caps search/LLM calls.
+            sem = asyncio.Semaphore(settings.PROFILE_CONCURRENCY)
+            segment = session.segment
+
+            async def _guarded(comp: SessionCompany) -> None:
+                async with sem:
+                    await _profile_session_company(session_id, comp, segment, search_service, llm_service)
+
+            await asyncio.gather(*(_guarded(comp) for comp in companies_to_profile))
             
-            # Step 4: Generate charts (placeholder)
-            charts_data = {
-                "segmentation": [],
-                "scale": [],
-                "performance": [],
-                "evolution": []
-            }
-            session.charts = charts_data  # store as dict (JSON column)
+            # Step 4: Precompute chart datasets once; session reads only
+            # return the stored JSON and never aggregate on GET.
+            session.charts = await _build_charts(db, session_id)
             
-            # Mark complete
+            # Mark complete (same UPDATE as the charts, same commit as the log)
             session.status = "COMPLETE"
-            session.updated_at = datetime.utcnow()
+            await _add_log(db, session_id, "✅ Research session complete!", commit=False)
             await db.commit()
-            
-            await _add_log(db, session_id, "✅ Research session complete!")
+            invalidate_session(session_id)
             
         except Exception as e:
             await db.rollback()
             logger.exception(f"Session {session_id} failed: {e}")
             session.status = "FAILED"
+            await _add_log(db, session_id, f"❌ Session failed: {str(e)}", commit=False)
             await db.commit()
-            await _add_log(db, session_id, f"❌ Session failed: {str(e)}")
+            invalidate_session(session_id)
             raise
 
 
+async def _copy_recent_session(db: AsyncSession, session: ResearchSession) -> bool:
+    """Fill ``session`` from a recent completed session for its segment.
+
+    Copies up to ``max_companies`` companies with their profiles and
+    sources, rebuilds the charts and marks ``session`` complete, all in one
+    commit. Returns False, without writing, when there is nothing to reuse.
+    """
+    if settings.SESSION_REUSE_TTL <= 0 or not session.segment:
+        return False
+    max_companies = session.max_companies or 5
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.SESSION_REUSE_TTL)
+    source_id = await db.scalar(
+        select(ResearchSession.id)
+        .where(
+            ResearchSession.segment == session.segment,
+            ResearchSession.status == "COMPLETE",
+            ResearchSession.id != session.id,
+            ResearchSession.updated_at >= cutoff,
+            ResearchSession.max_companies >= max_companies,
+        )
+        .order_by(ResearchSession.updated_at.desc())
+        .limit(1)
+    )
+    if source_id is None:
+        return False
+
+    companies = SessionCompany.__table__
+    rows = (
+        await db.execute(
+            select(companies)
+            .where(companies.c.session_id == source_id)
+            .order_by(companies.c.created_at)
+            .limit(max_companies)
+        )
+    ).mappings().all()
+    if not rows:
+        return False
+
+    # New ids for the copies; timestamps come from the server defaults.
+    new_ids = {row["id"]: str(uuid4()) for row in rows}
+    await db.execute(
+        insert(SessionCompany),
+        [
+            {
+                **{key: value for key, value in row.items() if key not in ("created_at", "updated_at")},
+                "id": new_ids[row["id"]],
+                "session_id": session.id,
+            }
+            for row in rows
+        ],
+    )
+    profiles = (
+        await db.execute(
+            select(CompanyProfile.company_id, CompanyProfile.content)
+            .where(CompanyProfile.company_id.in_(new_ids))
+        )
+    ).all()
+    if profiles:
+        await db.execute(
+            insert(CompanyProfile),
+            [{"company_id": new_ids[company_id], "content": content} for company_id, content in profiles],
+        )
+    sources = (
+        await db.execute(
+            select(CompanySource.company_id, CompanySource.url, CompanySource.label, CompanySource.source_type)
+            .where(CompanySource.company_id.in_(new_ids))
+        )
+    ).mappings().all()
+    if sources:
+        await db.execute(
+            insert(CompanySource),
+            [{**source, "company_id": new_ids[source["company_id"]]} for source in sources],
+        )
+
+    session.companies_found = len(rows)
+    session.charts = await _build_charts(db, session.id)
+    session.status = "COMPLETE"
+    await _add_log(
+        db,
+        session.id,
+        f"Reused {len(rows)} companies researched for '{session.segment}' in session {source_id}",
+        commit=False,
+    )
+    await db.commit()
+    return True
+
+
+async def _profile_session_company(
+    session_id: str,
+    comp: SessionCompany,
+    segment: Optional[str],
+    search_service: SearchService,
+    llm_service: LLMService,
+) -> None:
+    """Deep-profile one discovered company and store the result.
+
+    Runs in a fresh session so several companies can be profiled at once.
+    Failures are logged to the session console rather than raised.
+    """
+    name = comp.name
+    async with async_session() as db:
+        comp = await db.merge(comp, load=False)
+        try:
+            await _add_log(db, session_id, f"Deep research on {name}...")
+            
+            profile_data = await _deep_profile_company(
+                company_name=name,
+                company_domain=comp.domain,
+                segment=segment,
+                search_service=search_service,
+                llm_service=llm_service
+            )
+            
+            # Persist the detailed profile content
+            profile = CompanyProfile(
+                company_id=comp.id,
+                content={
+                    field: _safe_text(profile_data.get(field))
+                    for field in PROFILE_FIELDS
+                },
+            )
+            db.add(profile)
+
+            # Update high-level company fields stored on SessionCompany
+            comp.summary = profile.summary
+            comp.data_reliability = profile_data.get("data_reliability", "medium")
+            comp.last_verified_at = datetime.now(timezone.utc)
+            comp.status = "COMPLETE"
+            
+            # Add sources with one executemany INSERT
+            source_rows = [
+                {
+                    "company_id": comp.id,
+                    "url": src.get("url", ""),
+                    "label": src.get("title", "Unknown"),
+                    "source_type": src.get("source_type") or None,
+                }
+                for src in profile_data.get("sources", [])[:10]  # Limit to 10 sources
+            ]
+            if source_rows:
+                await db.execute(insert(CompanySource), source_rows)
+            
+            await _add_log(db, session_id, f"✓ Profile complete: {name}", commit=False)
+            await db.commit()
+            invalidate_session(session_id)
+            
+        except Exception as e:
+            await db.rollback()  # Critical: rollback on error
+            logger.exception(f"Failed to profile {name}: {e}")
+            await _add_log(db, session_id, f"✗ Failed to profile {name}: {str(e)[:100]}")
+
+
+async def _search_all(
+    search_service: SearchService,
+    queries: List[str],
+    num_results: int,
+) -> List[Dict[str, Any]]:
+    """Run ``queries`` concurrently and concatenate their results in order.
+
+    A failed query is logged and contributes no results.
+    """
+    responses = await asyncio.gather(
+        *(search_service.search(query, num_results=num_results) for query in queries),
+        return_exceptions=True,
+    )
+    results: List[Dict[str, Any]] = []
+    for query, response in zip(queries, responses):
+        if isinstance(response, Exception):
+            logger.warning(f"Search failed for '{query}': {response}")
+        else:
+            results.extend(response)
+    return results
+
+
 async def _discover_companies_reliably(
     segment: str,
     max_companies: int,
@@ -207,14 +418,7 @@ async def _discover_companies_reliably(
         f"leading {segment} businesses"
     ]
     
-    all_results = []
-    for query in queries[:3]:  # Limit to 3 queries
-        try:
-            results = await search_service.search(query, num_results=10)
-            all_results.extend(results)
-            await asyncio.sleep(0.5)  # Rate limiting
-        except Exception as e:
-            logger.warning(f"Search failed for '{query}': {e}")
+    all_results = await _search_all(search_service, queries[:3], num_results=10)  # Limit to 3 queries
     
     # Build context
     context = "\n\n".join([
@@ -243,15 +447,10 @@ Return format:
 Return ONLY the JSON array, no markdown, no explanation."""
     
     try:
-        response = await llm_service.generate(prompt, max_tokens=2000)
-        
-        # Clean response
-        response_text = response.strip()
-        response_text = re.sub(r'```json\s*', '', response_text)
-        response_text = re.sub(r'```\s*$', '', response_text)
-        response_text = response_text.strip()
+        response = await llm_service.cached_generate(prompt, max_tokens=2000)
         
-        companies = json.loads(response_text)
+        # Tolerates markdown fences around the JSON.
+        companies = json_codec.loads_embedded(response)
         
         # Validate
         valid_companies = []
@@ -285,13 +484,13 @@ async def _deep_profile_company(
     ]
     
     all_sources = []
-    for query in search_queries:
-        try:
-            results = await search_service.search(query, num_results=5)
-            all_sources.extend(results)
-            await asyncio.sleep(0.3)
-        except Exception as e:
-            logger.warning(f"Search failed for {company_name}: {e}")
+    seen_urls = set()
+    # The queries overlap, so keep only the first hit per URL.
+    for result in await _search_all(search_service, search_queries, num_results=5):
+        url = result.get("url")
+        if url not in seen_urls:
+            seen_urls.add(url)
+            all_sources.append(result)
     
     # Fetch website content
     website_content = ""
@@ -337,15 +536,10 @@ IMPORTANT:
 - Return ONLY valid JSON, no markdown"""
     
     try:
-        response = await llm_service.generate(prompt, max_tokens=2000)
-        
-        # Clean response
-        response_text = response.strip()
-        response_text = re.sub(r'```json\s*', '', response_text)
-        response_text = re.sub(r'```\s*$', '', response_text)
-        response_text = response_text.strip()
+        response = await llm_service.cached_generate(prompt, max_tokens=2000)
         
-        profile_data = json.loads(response_text)
+        # Tolerates markdown fences around the JSON.
+        profile_data = json_codec.loads_embedded(response)
         
         # Add sources
         profile_data["sources"] = [
@@ -381,6 +575,56 @@ IMPORTANT:
         }
 
 
+async def _build_charts(db: AsyncSession, session_id: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Aggregate a session's companies into the ``ChartsPayload`` datasets.
+
+    Reads the few columns the charts need in a single query.
+    """
+    result = await db.execute(
+        select(
+            SessionCompany.name,
+            SessionCompany.employees,
+            SessionCompany.score,
+            SessionCompany.founded_year,
+            SessionCompany.primary_tags,
+        ).where(SessionCompany.session_id == session_id)
+    )
+    rows = result.all()
+
+    segments: Dict[str, int] = {}
+    for row in rows:
+        tags = row.primary_tags
+        # Rows written before tags were coerced may hold any JSON shape.
+        first = tags[0] if isinstance(tags, list) and tags else None
+        label = first if isinstance(first, str) and first.strip() else "Other"
+        segments[label] = segments.get(label, 0) + 1
+
+    scored = sorted((row.score for row in rows if row.score is not None), reverse=True)
+    return {
+        "segmentation": [{"label": label, "value": count} for label, count in segments.items()],
+        "company_scale": [
+            {"name": row.name, "employees": row.employees}
+            for row in rows
+            if row.employees is not None
+        ],
+        "performance_matrix": [{"x": rank, "score": score} for rank, score in enumerate(scored, 1)],
+        "market_evolution": [
+            {"name": row.name, "year": row.founded_year, "score": row.score or 0, "size": row.employees or 1}
+            for row in rows
+            if row.founded_year is not None
+        ],
+    }
+
+
+def _tag_strings(value: Any) -> List[str]:
+    """Coerce LLM-provided tags into a list of non-empty strings."""
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    return [tag.strip() for tag in value if isinstance(tag, str) and tag.strip()]
+
+
 def _safe_text(value: Any) -> str:
     """Convert arbitrary data to a safe string for text columns."""
     if value is None:
@@ -388,7 +632,7 @@ def _safe_text(value: Any) -> str:
     if isinstance(value, (str, int, float)):
         return str(value)
     try:
-        return json.dumps(value, ensure_ascii=False)
+        return json_codec.dumps(value)
     except Exception:
         return str(value)
 
@@ -396,39 +640,48 @@ def _safe_text(value: Any) -> str:
 async def _fetch_website_content(domain: str) -> str:
     """Fetch and clean website content."""
     url = domain if domain.startswith("http") else f"https://{domain}"
-    
+    cache_key = url.lower().rstrip("/")
+    cached = _website_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            response = await client.get(
-                url,
-                headers={"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
-            )
-            html = response.text
-            
-            # Remove scripts and styles
-            html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-            html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-            html = re.sub(r'<[^>]+>', ' ', html)
-            
-            # Clean text
-            text = unescape(html)
-            text = re.sub(r'\s+', ' ', text)
-            
-            return text[:3000]  # Limit length
-            
+        response, html = await fetch_page(
+            url,
+            headers={"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"},
+            timeout=10.0,
+            follow_redirects=True,
+        )
     except Exception as e:
         logger.warning(f"Failed to fetch {url}: {e}")
         return ""
+    # Error and bot-challenge pages must not be cached as the company's text;
+    # failures are retried on the next session instead.
+    if not response.is_success or "text" not in response.headers.get("content-type", "text"):
+        logger.warning(f"Skipping {url}: HTTP {response.status_code}, {response.headers.get('content-type')}")
+        return ""
+    text = html_to_text(html)[:3000]  # Limit length
 
+    if text:
+        _website_cache.set(cache_key, text)
+    return text
 
-async def _add_log(db: AsyncSession, session_id: str, message: str):
-    """Add log entry to session."""
+
+async def _add_log(db: AsyncSession, session_id: str, message: str, commit: bool = True):
+    """Add log entry to session.
+
+    With ``commit=False`` the entry is only added to ``db`` and is written
+    by the caller's next commit, saving a round trip when one follows
+    shortly anyway. Lines that precede slow work should commit so the
+    console shows them straight away.
+    """
     log = ResearchSessionLog(
         session_id=session_id,
         message=message
     )
     db.add(log)
-    await db.commit()
+    if commit:
+        await db.commit()
     logger.info(f"[{session_id}] {message}")
 
 
@@ -439,6 +692,6 @@ async def _mark_session_failed(session_id: str, error: str):
         session = result.scalar_one_or_none()
         if session:
             session.status = "FAILED"
-            session.updated_at = datetime.utcnow()
+            await _add_log(db, session_id, f"Session failed: {error[:200]}", commit=False)
             await db.commit()
-            await _add_log(db, session_id, f"Session failed: {error[:200]}")
+            invalidate_session(session_id)
@@ -1,10 +1,30 @@
 import asyncio
-from app.db.session import engine
+from sqlalchemy import inspect
+from app.db.session import async_session, engine
 from app.db.models import Base
+from app.services.research_service import backfill_company_tags
+
+
+def _create_missing_tables(sync_conn):
+    # One table-name query instead of create_all's existence check per
+    # table; an initialised database needs no further statements.
+    existing = set(inspect(sync_conn).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    if missing:
+        Base.metadata.create_all(sync_conn, tables=missing, checkfirst=False)
+    return missing
+
 
 async def main():
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    print('✅ Database created!')
+        missing = await conn.run_sync(_create_missing_tables)
+    if any(table.name == 'company_tags' for table in missing):
+        # Existing companies predate the tag table; mirror their lists.
+        async with async_session() as db:
+            await backfill_company_tags(db)
+    if missing:
+        print(f'✅ Database created! ({len(missing)} new tables)')
+    else:
+        print('✅ Database already up to date')
 
 asyncio.run(main())
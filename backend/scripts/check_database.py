@@ -12,7 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.db.session import async_session, engine
+from app.db.session import engine
 from app.db.models import Base, Company, ResearchJob, SourceDocument
 
 
@@ -23,21 +23,31 @@ async def check_database():
     print("DATABASE CHECK")
     print("=" * 60)
     
-    # Create all tables if they don't exist
-    print("\n1. Creating tables if needed...")
+    # Everything below runs on one connection: the schema check and the
+    # reads share a single checkout and transaction.
     async with engine.begin() as conn:
+        # Create all tables if they don't exist
+        print("\n1. Creating tables if needed...")
         await conn.run_sync(Base.metadata.create_all)
-    print("✓ Tables created/verified")
-    
-    # Check companies
-    print("\n2. Checking companies table...")
-    async with async_session() as session:
-        result = await session.execute(text("SELECT COUNT(*) FROM companies"))
-        count = result.scalar()
-        print(f"   Total companies: {count}")
-        
-        if count > 0:
-            result = await session.execute(
+        print("✓ Tables created/verified")
+
+        # All three counts in one round trip
+        company_count, job_count, document_count = (
+            await conn.execute(
+                text(
+                    "SELECT (SELECT COUNT(*) FROM companies), "
+                    "(SELECT COUNT(*) FROM research_jobs), "
+                    "(SELECT COUNT(*) FROM source_documents)"
+                )
+            )
+        ).one()
+
+        # Check companies
+        print("\n2. Checking companies table...")
+        print(f"   Total companies: {company_count}")
+
+        if company_count > 0:
+            result = await conn.execute(
                 text("SELECT id, name, category, region, description FROM companies LIMIT 5")
             )
             print("\n   Sample companies:")
@@ -46,30 +56,24 @@ async def check_database():
                 print(f"     Category: {row[2] or 'N/A'}, Region: {row[3] or 'N/A'}")
                 desc = row[4] or "No description"
                 print(f"     Description: {desc[:80]}...")
-    
-    # Check research jobs
-    print("\n3. Checking research_jobs table...")
-    async with async_session() as session:
-        result = await session.execute(text("SELECT COUNT(*) FROM research_jobs"))
-        count = result.scalar()
-        print(f"   Total jobs: {count}")
-        
-        if count > 0:
-            result = await session.execute(
+
+        # Check research jobs
+        print("\n3. Checking research_jobs table...")
+        print(f"   Total jobs: {job_count}")
+
+        if job_count > 0:
+            result = await conn.execute(
                 text("SELECT id, segment, status, created_at FROM research_jobs ORDER BY id DESC LIMIT 5")
             )
             print("\n   Recent jobs:")
             for row in result:
                 print(f"   - Job {row[0]}: {row[1][:50]}")
                 print(f"     Status: {row[2]}, Created: {row[3]}")
-    
-    # Check source documents
-    print("\n4. Checking source_documents table...")
-    async with async_session() as session:
-        result = await session.execute(text("SELECT COUNT(*) FROM source_documents"))
-        count = result.scalar()
-        print(f"   Total source documents: {count}")
-    
+
+        # Check source documents
+        print("\n4. Checking source_documents table...")
+        print(f"   Total source documents: {document_count}")
+
     print("\n" + "=" * 60)
     print("Check complete!")
     print("=" * 60)
@@ -7,8 +7,9 @@ intended for production use.
 """
 
 import asyncio
-from typing import Optional
+from typing import Dict, Sequence, Tuple
 
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Base, User
@@ -27,16 +28,31 @@ async def seed() -> None:
 
 async def create_demo_user(session: AsyncSession, email: str, password: str) -> None:
     """Insert a demo user into the database if it does not already exist."""
-    existing = await session.execute(
-        User.__table__.select().where(User.email == email)
-    )
-    if existing.scalar_one_or_none() is None:
-        user = User(email=email, hashed_password=password)
-        session.add(user)
+    await create_demo_users(session, [(email, password)])
+
+
+async def create_demo_users(session: AsyncSession, users: Sequence[Tuple[str, str]]) -> None:
+    """Insert the ``(email, password)`` demo users that do not already exist.
+
+    One SELECT finds the existing emails and one INSERT adds the rest,
+    however many users are given.
+    """
+    emails = [email for email, _ in users]
+    existing = set(await session.scalars(select(User.email).where(User.email.in_(emails))))
+    new_users: Dict[str, str] = {}
+    for email, password in users:
+        if email in existing:
+            print(f"Demo user {email} already exists")
+        else:
+            new_users.setdefault(email, password)
+    if new_users:
+        await session.execute(
+            insert(User),
+            [{"email": email, "hashed_password": password} for email, password in new_users.items()],
+        )
         await session.commit()
-        print(f"Created demo user {email}")
-    else:
-        print(f"Demo user {email} already exists")
+        for email in new_users:
+            print(f"Created demo user {email}")
 
 
 if __name__ == "__main__":
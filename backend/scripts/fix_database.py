@@ -7,13 +7,41 @@ Run with: python scripts/fix_database.py
 import asyncio
 import sys
 from pathlib import Path
-from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import text, select
+from sqlalchemy import String, column, func, or_, select, table, update
 from app.db.session import async_session, engine
-from app.db.models import Base, ResearchSession, SessionCompany, CompanyProfile, CompanySource
+from app.db.models import Base, CodedString, ResearchSession, SessionCompany, CompanyProfile, CompanySource
+
+
+def _fill_timestamps(model):
+    """UPDATE setting missing ``created_at``/``updated_at`` on ``model`` rows."""
+    return (
+        update(model)
+        .where(or_(model.created_at.is_(None), model.updated_at.is_(None)))
+        .values(
+            created_at=func.coalesce(model.created_at, func.now()),
+            updated_at=func.coalesce(model.updated_at, model.created_at, func.now()),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _legacy_code_updates():
+    """UPDATEs turning label strings in ``CodedString`` columns into codes.
+
+    Databases created with ``create_all`` before those columns were coded
+    (e.g. the development ``scout.db``) still hold the labels themselves.
+    """
+    for mapped in Base.metadata.sorted_tables:
+        for col in mapped.columns:
+            if not isinstance(col.type, CodedString):
+                continue
+            # Plain String columns, so the labels are bound as text.
+            raw = table(mapped.name, column(col.name, String))
+            for code, label in enumerate(col.type.labels):
+                yield update(raw).where(raw.c[col.name] == label).values({col.name: str(code)})
 
 
 async def fix_database():
@@ -23,75 +51,82 @@ async def fix_database():
     print("DATABASE DIAGNOSTIC AND REPAIR")
     print("=" * 70)
     
-    print("\n[1/6] Creating tables if needed...")
+    print("\n[1/7] Creating tables if needed...")
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     print("✅ Tables created/verified")
     
-    print("\n[2/6] Checking for missing timestamps...")
+    print("\n[2/7] Converting legacy status/level labels to codes...")
+    if engine.dialect.name == "postgresql":
+        # The 20240407 migration converted these columns in place.
+        print("✅ Nothing to convert on PostgreSQL")
+    else:
+        async with engine.begin() as conn:
+            converted = 0
+            for stmt in _legacy_code_updates():
+                converted += (await conn.execute(stmt)).rowcount
+        print(f"✅ Converted {converted} values")
+    
+    print("\n[3/7] Checking for missing timestamps...")
     async with async_session() as session:
+        # One UPDATE fills both columns; RETURNING lists the fixed rows.
         result = await session.execute(
-            select(ResearchSession).where(
-                (ResearchSession.created_at == None) | (ResearchSession.updated_at == None)
-            )
+            _fill_timestamps(ResearchSession).returning(ResearchSession.id, ResearchSession.label)
         )
-        sessions_to_fix = result.scalars().all()
-        
-        if sessions_to_fix:
-            print(f"⚠️  Found {len(sessions_to_fix)} sessions with missing timestamps")
-            now = datetime.utcnow()
-            for s in sessions_to_fix:
-                if not s.created_at:
-                    s.created_at = now
-                if not s.updated_at:
-                    s.updated_at = now
-                print(f"   Fixed: {s.id} - {s.label}")
-            await session.commit()
-            print(f"✅ Fixed {len(sessions_to_fix)} sessions")
+        fixed = result.all()
+        await session.commit()
+
+        if fixed:
+            for session_id, label in fixed:
+                print(f"   Fixed: {session_id} - {label}")
+            print(f"✅ Fixed {len(fixed)} sessions")
         else:
             print("✅ All sessions have valid timestamps")
     
-    print("\n[3/6] Checking company timestamps...")
+    print("\n[4/7] Checking company timestamps...")
     async with async_session() as session:
-        result = await session.execute(
-            select(SessionCompany).where(
-                (SessionCompany.created_at == None) | (SessionCompany.updated_at == None)
-            )
-        )
-        companies_to_fix = result.scalars().all()
-        
-        if companies_to_fix:
-            print(f"⚠️  Found {len(companies_to_fix)} companies with missing timestamps")
-            now = datetime.utcnow()
-            for c in companies_to_fix:
-                if not c.created_at:
-                    c.created_at = now
-                if not c.updated_at:
-                    c.updated_at = now
-                print(f"   Fixed: {c.name}")
-            await session.commit()
-            print(f"✅ Fixed {len(companies_to_fix)} companies")
+        result = await session.execute(_fill_timestamps(SessionCompany).returning(SessionCompany.name))
+        fixed = result.scalars().all()
+        await session.commit()
+
+        if fixed:
+            for name in fixed:
+                print(f"   Fixed: {name}")
+            print(f"✅ Fixed {len(fixed)} companies")
         else:
             print("✅ All companies have valid timestamps")
     
-    print("\n[4/6] Checking database integrity...")
+    print("\n[5/7] Checking database integrity...")
     async with async_session() as session:
-        result = await session.execute(select(ResearchSession))
-        sessions = result.scalars().all()
-        print(f"   Total sessions: {len(sessions)}")
-        
-        result = await session.execute(select(SessionCompany))
-        companies = result.scalars().all()
-        print(f"   Total companies: {len(companies)}")
+        # Both counts in one statement, so one round trip.
+        session_count, company_count = (
+            await session.execute(
+                select(
+                    select(func.count()).select_from(ResearchSession).scalar_subquery(),
+                    select(func.count()).select_from(SessionCompany).scalar_subquery(),
+                )
+            )
+        ).one()
+        print(f"   Total sessions: {session_count}")
+        print(f"   Total companies: {company_count}")
     
-    print("\n[5/6] Sample session data:")
+    print("\n[6/7] Sample session data:")
     async with async_session() as session:
         result = await session.execute(
-            select(ResearchSession)
+            # Only the printed columns; companies_found is a stored counter,
+            # so no related rows are needed.
+            select(
+                ResearchSession.id,
+                ResearchSession.label,
+                ResearchSession.status,
+                ResearchSession.created_at,
+                ResearchSession.updated_at,
+                ResearchSession.companies_found,
+            )
             .order_by(ResearchSession.created_at.desc())
             .limit(3)
         )
-        sessions = result.scalars().all()
+        sessions = result.all()
         
         if sessions:
             for s in sessions:
@@ -104,19 +139,25 @@ async def fix_database():
         else:
             print("   No sessions found in database")
     
-    print("\n[6/6] Testing frontend query...")
+    print("\n[7/7] Testing frontend query...")
     try:
         async with async_session() as session:
             result = await session.execute(
-                select(ResearchSession)
+                select(
+                    ResearchSession.id,
+                    ResearchSession.label,
+                    ResearchSession.status,
+                    # Same fallbacks as list_sessions, resolved by the database
+                    func.coalesce(ResearchSession.updated_at, ResearchSession.created_at, func.now()).label("updated_at"),
+                )
                 .order_by(ResearchSession.updated_at.desc())
                 .limit(6)
             )
-            sessions = result.scalars().all()
+            sessions = result.all()
             
             items = []
             for s in sessions:
-                updated_at = s.updated_at or s.created_at or datetime.utcnow()
+                updated_at = s.updated_at
                 items.append({
                     "id": s.id,
                     "label": s.label,
@@ -8,8 +8,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import text
-from app.db.session import async_session, engine
+from app.db.session import engine
 from app.db.models import Base
 
 
@@ -17,23 +16,18 @@ async def init_database():
     """Create all tables."""
     
     print("Dropping existing tables...")
+    # One connection and transaction for the drop and the re-create.
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
-    
-    print("Creating fresh tables...")
-    async with engine.begin() as conn:
+        print("Creating fresh tables...")
         await conn.run_sync(Base.metadata.create_all)
     
     print("✅ Database initialized successfully!")
     
-    # Verify tables
-    async with async_session() as session:
-        result = await session.execute(text(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        ))
-        tables = [row[0] for row in result.fetchall()]
-        print(f"\nCreated tables: {', '.join(tables)}")
-
+    # create_all committed every table in the metadata, so list those
+    # rather than querying the (dialect-specific) catalog.
+    tables = [table.name for table in Base.metadata.sorted_tables]
+    print(f"\nCreated tables: {', '.join(tables)}")
 
 if __name__ == "__main__":
     asyncio.run(init_database())
\ No newline at end of file
@@ -20,11 +20,10 @@ async def migrate():
     # In production, you'd want to actually backup the data
     
     print("Dropping all tables...")
+    # One connection and transaction for the drop and the re-create.
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
-    
-    print("Creating fresh tables...")
-    async with engine.begin() as conn:
+        print("Creating fresh tables...")
         await conn.run_sync(Base.metadata.create_all)
     
     print("✅ Migration complete!")
@@ -0,0 +1,28 @@
+"""
+Shared test fixtures.
+"""
+
+import os
+import tempfile
+
+import pytest_asyncio
+
+# Run against a throwaway SQLite database (or TEST_DB_URL), never the
+# development scout.db, whose schema may predate the current models. Set
+# before the app modules below create the engine.
+os.environ["DB_URL"] = os.environ.get(
+    "TEST_DB_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/test.db"
+)
+
+from app.db.models import Base
+from app.db.session import engine
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def _schema() -> None:
+    """Create the database schema once for the whole test run."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # Pooled connections belong to this fixture's event loop; tests running
+    # on their own loops open fresh ones.
+    await engine.dispose()
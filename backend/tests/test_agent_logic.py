@@ -2,7 +2,13 @@
 Tests for agent logic functions.
 """
 
-from app.llm.agent_registry import list_agents, get_default_agent
+import json
+
+import pytest
+
+from app.llm.agent_registry import AGENTS, list_agents, get_default_agent, register_agent, serialized_agents
+from app.llm.planner import plan
+from app.schemas.common import Message
 
 def test_list_agents_returns_agents() -> None:
     agents = list(list_agents())
@@ -12,3 +18,31 @@ def test_list_agents_returns_agents() -> None:
 def test_default_agent_is_base() -> None:
     default_agent = get_default_agent()
     assert default_agent.name == "base"
+
+
+def test_registry_is_read_only() -> None:
+    with pytest.raises(TypeError):
+        AGENTS["base"] = get_default_agent()  # type: ignore[index]
+
+
+def test_serialized_agents_rebuilt_after_register() -> None:
+    base = get_default_agent()
+    before = serialized_agents()
+    assert serialized_agents() is before
+    register_agent(base.model_copy(update={"description": "changed"}))
+    try:
+        agents = json.loads(serialized_agents())["agents"]
+        assert {"name": "base", "description": "changed"}.items() <= agents[0].items()
+    finally:
+        register_agent(base)
+
+
+@pytest.mark.asyncio
+async def test_planner_routes_trigger_phrases() -> None:
+    call = await plan([Message(role="user", content="Please find LMS vendors")])
+    assert call == {"name": "search", "arguments": {"query": "Please find LMS vendors"}}
+
+
+@pytest.mark.asyncio
+async def test_planner_respects_allowed_tools() -> None:
+    assert await plan([Message(role="user", content="Schedule a meeting")], allowed=()) is None
@@ -2,31 +2,36 @@
 Tests for the chat API endpoint.
 """
 
-import asyncio
+from typing import AsyncIterator
 
 import pytest
-from httpx import AsyncClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 from app.core.config import settings
 
 
-@pytest.mark.asyncio
-async def test_chat_endpoint_returns_unauthorized_without_key() -> None:
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.post(
-            "/api/v1/chat/", json={"messages": [{"role": "user", "content": "Hello"}]}
-        )
-        assert response.status_code == 401
+# One client (and event loop) for every test in the module.
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client() -> AsyncIterator[AsyncClient]:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
 
-@pytest.mark.asyncio
-async def test_chat_endpoint_with_key_returns_success() -> None:
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.post(
-            "/api/v1/chat/",
-            json={"messages": [{"role": "user", "content": "Hello"}]},
-            headers={"X-API-Key": settings.OPENAI_API_KEY},
-        )
-        # Since ``generate`` returns a stub response, we only check status code here.
-        assert response.status_code == 200
\ No newline at end of file
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize(
+    "headers, expected_status",
+    [
+        pytest.param({}, 401, id="without_key"),
+        pytest.param({"X-API-Key": settings.OPENAI_API_KEY}, 200, id="with_key"),
+    ],
+)
+async def test_chat_endpoint_auth(client: AsyncClient, headers: dict, expected_status: int) -> None:
+    response = await client.post(
+        "/api/v1/chat/",
+        json={"messages": [{"role": "user", "content": "Hello"}]},
+        headers=headers,
+    )
+    # Since ``generate`` returns a stub response, we only check status code here.
+    assert response.status_code == expected_status
@@ -0,0 +1,54 @@
+"""
+Tests for chat service streaming helpers.
+"""
+
+import asyncio
+
+import pytest
+
+from app.schemas.agent import AgentConfig
+from app.schemas.common import Message
+from app.services import chat_service
+from app.services.chat_service import _coalesce
+from app.utils import json_codec
+
+
+@pytest.mark.asyncio
+async def test_coalesce_closes_during_pending_read() -> None:
+    closed = asyncio.Event()
+
+    async def source():
+        try:
+            yield "a"
+            await asyncio.sleep(10)
+            yield "b"
+        finally:
+            closed.set()
+
+    stream = _coalesce(source(), max_chars=100, interval=0.01)
+    # "a" is flushed on the interval while the read of "b" is still pending.
+    assert await stream.__anext__() == "a"
+    await stream.aclose()
+    assert closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_handle_chat_sends_agent_tools(monkeypatch: pytest.MonkeyPatch) -> None:
+    agent = AgentConfig(name="tooling", description="Test agent", prompt_file="base.md", model="m", tools=["search"])
+    tool_defs = ({"type": "function", "name": "search"},)
+    sent = []
+
+    async def fake_generate_raw(body: bytes) -> str:
+        sent.append(json_codec.loads(body))
+        return "ok"
+
+    async def no_plan(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(chat_service, "_agent_and_tools", lambda: (agent, tool_defs))
+    monkeypatch.setattr(chat_service, "plan", no_plan)
+    monkeypatch.setattr(chat_service, "RAG_AVAILABLE", False)
+    monkeypatch.setattr(chat_service, "generate_raw", fake_generate_raw)
+
+    assert await chat_service.handle_chat([Message(role="user", content="hi")]) == "ok"
+    assert sent[0]["tools"] == [{"type": "function", "name": "search"}]
@@ -0,0 +1,52 @@
+"""
+Tests for the shared HTTP client helpers.
+"""
+
+import httpx
+import pytest
+
+from app.core import http_client
+
+
+class _Body(httpx.AsyncByteStream):
+    """Response body that records how many chunks were read."""
+
+    def __init__(self, chunks: int, size: int) -> None:
+        self.chunks, self.size, self.sent = chunks, size, 0
+
+    async def __aiter__(self):
+        for _ in range(self.chunks):
+            self.sent += 1
+            yield b"a" * self.size
+
+
+def _serve(monkeypatch: pytest.MonkeyPatch, content_type: str, body: _Body) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": content_type}, stream=body)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_client, "get_http_client", lambda: client)
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_stops_reading_at_max_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    body = _Body(chunks=100, size=1000)
+    _serve(monkeypatch, "text/html; charset=utf-8", body)
+
+    response, text = await http_client.fetch_page("https://example.com", max_bytes=2500)
+
+    assert response.status_code == 200
+    assert text == "a" * 2500
+    assert body.sent < body.chunks
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_skips_non_text_bodies(monkeypatch: pytest.MonkeyPatch) -> None:
+    body = _Body(chunks=3, size=1000)
+    _serve(monkeypatch, "application/pdf", body)
+
+    response, text = await http_client.fetch_page("https://example.com/report.pdf")
+
+    assert response.headers["content-type"] == "application/pdf"
+    assert text == ""
+    assert body.sent == 0
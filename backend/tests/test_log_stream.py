@@ -0,0 +1,42 @@
+"""
+Tests for the live log stream.
+"""
+
+import pytest
+
+from app.services import log_stream
+
+
+class _FakeDriver:
+    def __init__(self) -> None:
+        self.channels = []
+
+    def is_closed(self) -> bool:
+        return False
+
+    async def add_listener(self, channel, callback) -> None:
+        self.channels.append(channel)
+
+    async def remove_listener(self, channel, callback) -> None:
+        self.channels.remove(channel)
+
+
+@pytest.mark.asyncio
+async def test_streams_share_one_listen_per_channel(monkeypatch: pytest.MonkeyPatch) -> None:
+    driver = _FakeDriver()
+
+    async def fake_listener():
+        return driver
+
+    monkeypatch.setattr(log_stream, "_uses_listen", lambda: True)
+    monkeypatch.setattr(log_stream, "_listener", fake_listener)
+    monkeypatch.setattr(log_stream, "_listen_driver", driver)
+
+    async with log_stream._wakeups("a") as first, log_stream._wakeups("a") as second:
+        async with log_stream._wakeups("b") as other:
+            assert driver.channels == ["session_a", "session_b"]
+            log_stream._dispatch(None, 0, "session_a", "")
+            assert first.is_set() and second.is_set() and not other.is_set()
+        assert driver.channels == ["session_a"]
+    assert driver.channels == []
+    assert log_stream._subscribers == {}
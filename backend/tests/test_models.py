@@ -0,0 +1,13 @@
+"""
+Tests for custom column types.
+"""
+
+from app.db.models import SESSION_STATUSES, CodedString
+
+
+def test_coded_string_round_trip_and_legacy_labels() -> None:
+    coded = CodedString(SESSION_STATUSES)
+    assert coded.process_bind_param("COMPLETE", None) == 2
+    assert coded.process_result_value(2, None) == "COMPLETE"
+    # Unconverted rows from older SQLite databases still hold the label.
+    assert coded.process_result_value("COMPLETE", None) == "COMPLETE"
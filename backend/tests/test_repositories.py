@@ -8,17 +8,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import asyncio
 
-from app.db.session import async_session, engine
-from app.db.models import Base, User
+from app.db.session import async_session
 from app.repositories.user_repo import create_user, get_user_by_email
 
 
 @pytest.mark.asyncio
 async def test_create_and_get_user():
-    # Ensure tables are created
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
+    # The schema is created once by the ``_schema`` fixture in conftest.py.
     async with async_session() as session:
         user = await create_user(session, "test@example.com", "secret")
         fetched = await get_user_by_email(session, "test@example.com")
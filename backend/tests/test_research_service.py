@@ -0,0 +1,196 @@
+"""
+Tests for the research service.
+"""
+
+import asyncio
+import threading
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.db.models import Company, CompanyTag
+from app.db.session import async_session
+from app.services import research_service
+from app.utils import json_codec
+
+
+@pytest.fixture
+def fresh_encoding():
+    research_service._token_encoding.cache_clear()
+    yield
+    research_service._token_encoding.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_token_encoding_loads_off_loop_and_falls_back(
+    monkeypatch: pytest.MonkeyPatch, fresh_encoding
+) -> None:
+    loaded_on = []
+
+    class OfflineTiktoken:
+        @staticmethod
+        def get_encoding(name):
+            loaded_on.append(threading.current_thread())
+            raise OSError("no network")
+
+    monkeypatch.setattr(research_service, "tiktoken", OfflineTiktoken)
+
+    await research_service.warm_token_encoding()
+    await research_service.warm_token_encoding()
+
+    assert loaded_on and loaded_on[0] is not threading.main_thread()
+    assert len(loaded_on) == 1
+    budget = research_service.PROFILE_CONTEXT_CHARS
+    fitted = research_service._fit_context(["a" * budget, "b" * 10])
+    assert fitted == ["a" * budget, ""]
+
+
+async def _tags(db, company_id):
+    rows = await db.execute(
+        select(CompanyTag.tag_type, CompanyTag.tag_value)
+        .where(CompanyTag.company_id == company_id)
+        .order_by(CompanyTag.tag_type, CompanyTag.tag_value)
+    )
+    return rows.all()
+
+
+@pytest.mark.asyncio
+async def test_profile_and_refresh_keep_tags_in_sync(monkeypatch: pytest.MonkeyPatch) -> None:
+    replies = iter(
+        [
+            {"pricing_model": ["freemium"], "strengths": ["fast", "cheap"], "risks": ["churn"]},
+            {"pricing_model": ["freemium"], "strengths": ["stable"]},
+        ]
+    )
+
+    async def no_results(query, num_results=2):
+        return []
+
+    async def fake_generate(messages, **_kwargs):
+        return json_codec.dumps(next(replies))
+
+    monkeypatch.setattr(research_service, "search_web", no_results)
+    monkeypatch.setattr(research_service, "cached_generate", fake_generate)
+
+    async with async_session() as db:
+        company = Company(name=f"Tagged {uuid4()}")
+        db.add(company)
+        await db.commit()
+
+        await research_service.profile_company(company, db)
+        assert await _tags(db, company.id) == [
+            ("pricing", "freemium"),
+            ("risk", "churn"),
+            ("strength", "cheap"),
+            ("strength", "fast"),
+        ]
+
+        # Only the changed list is rewritten; omitted lists keep their tags.
+        await research_service.profile_company(company, db, refresh=True)
+        assert await _tags(db, company.id) == [
+            ("pricing", "freemium"),
+            ("risk", "churn"),
+            ("strength", "stable"),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_company_tags_is_rerunnable() -> None:
+    async with async_session() as db:
+        company = Company(name=f"Untagged {uuid4()}", pricing_model='["seat"]', risks="a, b")
+        db.add(company)
+        await db.commit()
+
+        assert await research_service.backfill_company_tags(db) >= 1
+        expected = [("pricing", "seat"), ("risk", "a"), ("risk", "b")]
+        assert await _tags(db, company.id) == expected
+
+        assert await research_service.backfill_company_tags(db) == 0
+        assert await _tags(db, company.id) == expected
+
+
+@pytest.mark.asyncio
+async def test_count_pricing_models_counts_tags_and_untagged_companies() -> None:
+    label = f"plan-{uuid4()}"
+    async with async_session() as db:
+        before = await research_service._count_pricing_models(db)
+        tagged = [Company(name=f"Priced {uuid4()}") for _ in range(2)]
+        untagged = Company(name=f"Unpriced {uuid4()}")
+        db.add_all([*tagged, untagged])
+        await db.flush()
+        for company in tagged:
+            await research_service.replace_company_tags(db, company.id, {"pricing_model": [label]})
+        await db.commit()
+
+        after = await research_service._count_pricing_models(db)
+
+    assert after[label] == 2
+    assert after["unknown"] == before.get("unknown", 0) + 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_research_jobs_share_one_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    release = asyncio.Event()
+
+    async def fake_run(segment, max_companies, db):
+        calls.append(segment)
+        await release.wait()
+        return f"job for {segment}"
+
+    monkeypatch.setattr(research_service, "_run_research", fake_run)
+    jobs = [
+        asyncio.create_task(research_service.start_research(segment, 5, db=None))
+        for segment in ("LMS Europe", "lms  europe", "LMS Europe ")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*jobs) == ["job for LMS Europe"] * 3
+    assert calls == ["LMS Europe"]
+    # A finished job is not reused: the next call runs again.
+    assert await research_service.start_research("LMS Europe", 5, db=None) == "job for LMS Europe"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_research_job_failure_reaches_every_caller(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = asyncio.Event()
+
+    async def failing_run(segment, max_companies, db):
+        await release.wait()
+        raise RuntimeError("discovery failed")
+
+    monkeypatch.setattr(research_service, "_run_research", failing_run)
+    jobs = [asyncio.create_task(research_service.start_research("MOOC", 3, db=None)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*jobs, return_exceptions=True)
+    assert [str(result) for result in results] == ["discovery failed"] * 2
+    assert research_service._running_jobs == {}
+
+
+@pytest.mark.asyncio
+async def test_upsert_companies_fills_only_missing_fields() -> None:
+    existing_name, new_name = f"Existing {uuid4()}", f"New {uuid4()}"
+    async with async_session() as db:
+        db.add(Company(name=existing_name, website="https://kept.example", segment="old"))
+        await db.commit()
+
+        companies = await research_service._upsert_companies(
+            [
+                {"name": existing_name, "website": "https://ignored.example", "category": "LMS"},
+                {"name": new_name, "website": "https://new.example"},
+            ],
+            "new segment",
+            db,
+        )
+        await db.commit()
+
+    by_name = {company.name: company for company in companies}
+    assert set(by_name) == {existing_name, new_name}
+    existing = by_name[existing_name]
+    assert (existing.website, existing.segment, existing.category) == ("https://kept.example", "old", "LMS")
+    assert (by_name[new_name].website, by_name[new_name].segment) == ("https://new.example", "new segment")
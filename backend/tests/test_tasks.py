@@ -0,0 +1,100 @@
+"""
+Tests for research session worker helpers.
+"""
+
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from app.db.models import CompanyProfile, CompanySource, ResearchSession, SessionCompany
+from app.db.session import async_session
+from app.workers import tasks
+from app.workers.tasks import _build_charts, _tag_strings
+
+
+def test_tag_strings_keeps_only_non_empty_strings() -> None:
+    assert _tag_strings(["LMS", {"x": 1}, " ", 3, " MOOC "]) == ["LMS", "MOOC"]
+    assert _tag_strings("LMS") == ["LMS"]
+    assert _tag_strings(None) == []
+
+
+@pytest.mark.asyncio
+async def test_build_charts_falls_back_for_malformed_tags() -> None:
+    async with async_session() as db:
+        session = ResearchSession(label="charts", status="RUNNING")
+        db.add(session)
+        await db.flush()
+        for name, tags in [("A", ["LMS"]), ("B", [{"x": 1}]), ("C", "LMS"), ("D", None)]:
+            db.add(SessionCompany(session_id=session.id, name=name, primary_tags=tags))
+        await db.commit()
+
+        charts = await _build_charts(db, session.id)
+
+    segments = {item["label"]: item["value"] for item in charts["segmentation"]}
+    assert segments == {"LMS": 1, "Other": 3}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status, content_type, cached",
+    [(200, "text/html", True), (403, "text/html", False), (503, "text/html", False), (200, "image/png", False)],
+)
+async def test_fetch_website_content_caches_only_successful_text(
+    monkeypatch: pytest.MonkeyPatch, status: int, content_type: str, cached: bool
+) -> None:
+    async def fake_fetch_page(url, **_kwargs):
+        return httpx.Response(status, headers={"content-type": content_type}), "<p>Hello</p>"
+
+    monkeypatch.setattr(tasks, "fetch_page", fake_fetch_page)
+    domain = f"example-{status}-{content_type.replace('/', '-')}.com"
+
+    text = await tasks._fetch_website_content(domain)
+
+    assert (text == "Hello") is cached
+    assert (tasks._website_cache.get(f"https://{domain}") is not None) is cached
+
+
+@pytest.mark.asyncio
+async def test_copy_recent_session_reuses_companies_profiles_and_sources() -> None:
+    segment = f"segment {uuid4()}"
+    async with async_session() as db:
+        source = ResearchSession(label="source", segment=segment, status="COMPLETE", max_companies=5)
+        db.add(source)
+        await db.flush()
+        originals = [
+            SessionCompany(session_id=source.id, name=name, primary_tags=["LMS"]) for name in ("A", "B")
+        ]
+        db.add_all(originals)
+        await db.flush()
+        db.add(CompanyProfile(company_id=originals[0].id, content={"summary": "copied"}))
+        db.add(CompanySource(company_id=originals[0].id, url="https://a.example", source_type="news"))
+        target = ResearchSession(label="target", segment=segment, status="PENDING", max_companies=1)
+        db.add(target)
+        await db.commit()
+
+        assert await tasks._copy_recent_session(db, target)
+
+        copies = (
+            await db.scalars(select(SessionCompany).where(SessionCompany.session_id == target.id))
+        ).all()
+        assert [company.name for company in copies] == ["A"]
+        assert copies[0].id != originals[0].id
+        profile = await db.get(CompanyProfile, copies[0].id)
+        assert profile.content == {"summary": "copied"}
+        urls = await db.scalars(select(CompanySource.url).where(CompanySource.company_id == copies[0].id))
+        assert urls.all() == ["https://a.example"]
+        assert (target.status, target.companies_found) == ("COMPLETE", 1)
+        assert target.charts["segmentation"] == [{"label": "LMS", "value": 1}]
+
+
+@pytest.mark.asyncio
+async def test_copy_recent_session_without_a_match_writes_nothing() -> None:
+    async with async_session() as db:
+        target = ResearchSession(label="fresh", segment=f"segment {uuid4()}", status="PENDING", max_companies=3)
+        db.add(target)
+        await db.commit()
+
+        assert not await tasks._copy_recent_session(db, target)
+        assert target.status == "PENDING"